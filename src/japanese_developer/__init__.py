@@ -1,2 +1,19 @@
 """japanese-developer: Gemini CLI汎用コーディング環境セットアップツール"""
+import os
+
 __version__ = "0.3.0"
+
+
+def template_path(*parts: str) -> str:
+    """パッケージ同梱の templates/ 以下のパス（同梱テンプレートは必ずこれで引く）
+
+    通常のインストールではパッケージのディレクトリをそのまま使う。hook の起動を
+    軽くするため、importlib.resources（shutil 等を読み込む）はそこに無い時だけ使う。
+    """
+    for location in __path__:
+        path = os.path.join(location, "templates", *parts)
+        if os.path.exists(path):
+            return path
+    from importlib import resources
+
+    return str(resources.files(__name__).joinpath("templates", *parts))
@@ -0,0 +1,220 @@
+"""hookのレイテンシ計測（`japanese-developer bench-hooks`）
+
+templates/bench_payloads.jsonl に記録したhook入力（SessionStart・BeforeTool・AfterTool・AfterAgent）を、
+hook設定の各コマンドにイベント・matcher どおりに流して1回ずつ計測する。
+
+- 使い捨ての git リポジトリ（ブランチ feature/bench）と一時 HOME の中で実行する。
+  実際の ~/.gemini や作業中のリポジトリには書き込まない
+- gh は偽物（PRは常に #1、コメント投稿は成功）に差し替える
+- 計測値: 壁時計時間（p50/p95/p99）・fork数（/proc/stat の processes の増分。
+  システム全体の値なので他のプロセスの分も混ざる）・ピークRSS（os.wait4 の ru_maxrss）
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from japanese_developer import template_path
+
+TEMPLATES_DIR = Path(template_path())
+CORPUS_PATH = TEMPLATES_DIR / "bench_payloads.jsonl"
+
+BENCH_BRANCH = "feature/bench"
+
+FAKE_GH = """#!/usr/bin/env bash
+# bench-hooks 用の偽gh: PRは常に #1、コメント投稿は常に成功
+case "$1 $2" in
+  "pr view") echo 1 ;;
+  "pr comment") cat >/dev/null 2>&1 ;;
+esac
+exit 0
+"""
+
+
+def load_corpus(path=None) -> list:
+    with open(path or CORPUS_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def iter_hooks(config: dict):
+    """hook設定から (イベント, matcher, hook定義) を列挙する。"""
+    for event, groups in config.items():
+        for group in groups:
+            for hook in group.get("hooks", []):
+                if hook.get("type", "command") == "command" and hook.get("command"):
+                    yield event, group.get("matcher", ""), hook
+
+
+def payloads_for(event: str, matcher: str, corpus: list) -> list:
+    pattern = re.compile(f"^(?:{matcher})$") if matcher else None
+    return [
+        entry for entry in corpus
+        if entry["event"] == event
+        and (pattern is None or pattern.match(entry["payload"].get("tool_name", "")))
+    ]
+
+
+def _forks() -> int:
+    """起動以来のfork数（/proc/stat）。読めなければ -1。"""
+    try:
+        with open("/proc/stat") as f:
+            for line in f:
+                if line.startswith("processes "):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def percentile(values: list, p: float) -> float:
+    """最近接順位法のパーセンタイル"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+class Sandbox:
+    """使い捨ての git リポジトリ・一時 HOME・偽 gh"""
+
+    def __init__(self, real_home: Path):
+        self.root = Path(tempfile.mkdtemp(prefix="jd-bench-"))
+        self.home = self.root / "home"
+        self.repo = self.root / "repo"
+        self.bin = self.root / "bin"
+        self.real_home = real_home
+        self.commits = 0
+
+    def __enter__(self):
+        gemini = self.home / ".gemini"
+        gemini.mkdir(parents=True)
+        # プライマー等は実環境のものを使う（無ければテンプレート）
+        for name in ("primer.md", "commands"):
+            src = self.real_home / ".gemini" / name
+            if not src.exists():
+                src = TEMPLATES_DIR / name
+            if src.is_dir():
+                shutil.copytree(src, gemini / name)
+            elif src.exists():
+                shutil.copy2(src, gemini / name)
+
+        self.bin.mkdir()
+        gh = self.bin / "gh"
+        gh.write_text(FAKE_GH)
+        gh.chmod(0o755)
+
+        self.repo.mkdir()
+        self.git("init", "-q", "-b", BENCH_BRANCH)
+        self.git("config", "user.name", "bench")
+        self.git("config", "user.email", "bench@example.invalid")
+        (self.repo / "README.md").write_text("# bench\n")
+        self.git("add", "README.md")
+        self.git("commit", "-q", "-m", "init")
+        return self
+
+    def __exit__(self, *exc):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, env=self.env(), check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def env(self) -> dict:
+        env = dict(os.environ)
+        env.update({
+            "HOME": str(self.home),
+            "GEMINI_PROJECT_DIR": str(self.repo),
+            "PATH": f"{self.bin}{os.pathsep}{env.get('PATH', '')}",
+            "JD_GH": str(self.bin / "gh"),
+        })
+        return env
+
+    def prepare(self, entry: dict):
+        """計測前の準備（コミットの作成・書き込まれたファイルの配置）。計測には含めない。"""
+        for rel, content in entry.get("files", {}).items():
+            path = self.repo / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        if entry.get("prepare") == "commit":
+            self.commits += 1
+            (self.repo / "bench.txt").write_text(f"{self.commits}\n")
+            self.git("add", "bench.txt")
+            self.git("commit", "-q", "-m", f"bench {self.commits}")
+
+
+def run_once(command: str, payload: dict, sandbox: Sandbox) -> dict:
+    """hookコマンドを1回実行して {"ms", "forks", "rss_kb", "code"} を返す。"""
+    data = json.dumps(payload, ensure_ascii=False).encode()
+    forks_before = _forks()
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        ["bash", "-c", command], cwd=sandbox.repo, env=sandbox.env(),
+        stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        proc.stdin.write(data)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = (time.perf_counter() - start) * 1000
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    forks_after = _forks()
+    return {
+        "ms": elapsed,
+        "forks": forks_after - forks_before if forks_before >= 0 else -1,
+        "rss_kb": usage.ru_maxrss,
+        "code": proc.returncode,
+    }
+
+
+def run(config: dict, corpus: list, iterations: int = 5, warmup: int = 1) -> dict:
+    """全hookを計測し、hook名 → 集計結果 を返す。"""
+    real_home = Path.home()
+    results = {}
+    with Sandbox(real_home) as sandbox:
+        for event, matcher, hook in iter_hooks(config):
+            entries = payloads_for(event, matcher, corpus)
+            if not entries:
+                continue
+            # settings.json の ~ は実際のHOMEで展開する（一時HOMEではスクリプトが見つからない）
+            command = re.sub(r"(^|\s)~/", lambda m: f"{m.group(1)}{real_home}/", hook["command"])
+            samples = []
+            for i in range(warmup + iterations):
+                for entry in entries:
+                    sandbox.prepare(entry)
+                    sample = run_once(command, entry["payload"], sandbox)
+                    if i >= warmup:
+                        samples.append(sample)
+            times = [s["ms"] for s in samples]
+            forks = [s["forks"] for s in samples if s["forks"] >= 0]
+            results[hook.get("name") or command] = {
+                "event": event,
+                "command": hook["command"],
+                "runs": len(samples),
+                "payloads": len(entries),
+                "p50_ms": round(percentile(times, 50), 2),
+                "p95_ms": round(percentile(times, 95), 2),
+                "p99_ms": round(percentile(times, 99), 2),
+                "forks_per_run": round(sum(forks) / len(forks), 1) if forks else None,
+                "peak_rss_kb": max(s["rss_kb"] for s in samples),
+                "failures": sum(1 for s in samples if s["code"] != 0),
+            }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """ベースラインと比べ、p95 が tolerance（割合）を超えて悪化したhookを返す。
+
+    戻り値は (hook名, ベースラインのp95, 今回のp95) のリスト。
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base and current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append((name, base["p95_ms"], current["p95_ms"]))
+    return regressions
@@ -0,0 +1,412 @@
+"""構文チェッカー
+
+syntax-check hook の拡張子ごとの振り分けをPythonで実装したもの。
+Pythonは compile()、JS/TSは常駐Nodeプロセス（templates/workers/node-checker.js）、
+HTML/CSSは structure モジュールのストリーミングチェッカーでパースするため、
+編集ごとに python3 -m py_compile や npx tsc を起動しなくて済む。
+
+常駐モード（hookd）では Python・Node のワーカープロセスを起動したまま使い回し、
+MAX_JOBS 件処理するか異常終了したら作り直す。
+"""
+
+import json
+import os
+import re
+import select
+import subprocess
+import sys
+import threading
+
+from japanese_developer import structure, template_path
+
+# 拡張子 → 言語
+LANGUAGES = {
+    "py": "python",
+    "js": "javascript",
+    "mjs": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "jsx": "typescript",
+    "json": "json",
+    "sh": "shell",
+    "bash": "shell",
+    "html": "html",
+    "htm": "html",
+    "css": "css",
+    "scss": "css",
+}
+
+# ワーカーを作り直すまでの処理件数
+MAX_JOBS = 500
+
+# ワーカー1件あたりの応答待ちの上限（秒）
+JOB_TIMEOUT = 10
+
+NODE_WORKER = template_path("workers", "node-checker.js")
+
+
+def language_of(path: str) -> str:
+    """ファイルの言語を返す。対象外なら空文字。"""
+    return LANGUAGES.get(path.rsplit(".", 1)[-1].lower(), "") if "." in path else ""
+
+
+def check_python(path: str) -> str:
+    """compile() でPythonの構文をチェックする。"""
+    import traceback
+
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+        compile(source, path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
+        return "".join(traceback.format_exception_only(type(e), e)).rstrip()
+    return ""
+
+
+def check_json(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8") as f:
+            json.load(f)
+    except ValueError as e:
+        return f"JSON構文エラー: {path}: {e}"
+    return ""
+
+
+def check_shell(path: str) -> str:
+    result = subprocess.run(["bash", "-n", path], capture_output=True, text=True)
+    return result.stderr.strip()
+
+
+class Worker:
+    """1行1件のJSONでやり取りする常駐チェッカープロセス"""
+
+    def __init__(self, argv: list, max_jobs: int = MAX_JOBS):
+        self.argv = argv
+        self.max_jobs = max_jobs
+        self.proc = None
+        self.jobs = 0
+        self.lock = threading.Lock()
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.jobs = 0
+
+    def close(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+            self.proc.wait()
+        self.proc = None
+
+    def _exchange(self, request: dict) -> dict:
+        self.proc.stdin.write(json.dumps(request).encode() + b"\n")
+        self.proc.stdin.flush()
+        ready, _, _ = select.select([self.proc.stdout], [], [], JOB_TIMEOUT)
+        if not ready:
+            raise TimeoutError("チェッカーが応答しません")
+        line = self.proc.stdout.readline()
+        if not line:
+            raise BrokenPipeError("チェッカーが終了しました")
+        return json.loads(line)
+
+    def request(self, request: dict) -> dict:
+        """リクエストを送って応答を返す。
+
+        異常終了時は作り直して1回だけ再試行する。タイムアウト時は再試行すると
+        hook の制限時間を超えるので、ワーカーを止めて TimeoutError を送出する。
+        """
+        with self.lock:
+            return self._request(request)
+
+    def _request(self, request: dict) -> dict:
+        if self.proc is None or self.proc.poll() is not None or self.jobs >= self.max_jobs:
+            self.close()
+            self._start()
+        self.jobs += 1
+        try:
+            return self._exchange(request)
+        except TimeoutError:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+            raise
+        except (OSError, ValueError):
+            self.close()
+            self._start()
+            self.jobs = 1
+            return self._exchange(request)
+
+
+class CheckerPool:
+    """言語ごとの構文チェッカー
+
+    persistent=True（hookd）ではPythonもワーカープロセスで処理し、
+    False（1回きりのhook）ではプロセス内の compile() で処理する。
+    """
+
+    def __init__(self, persistent: bool = True, max_jobs: int = MAX_JOBS):
+        self.persistent = persistent
+        self.max_jobs = max_jobs
+        self._workers = {}
+
+    def _worker(self, language: str) -> Worker:
+        if language not in self._workers:
+            if language == "python":
+                argv = [sys.executable, "-m", "japanese_developer.checkers", "--worker"]
+            else:
+                argv = ["node", "--experimental-vm-modules", "--no-warnings", NODE_WORKER]
+            self._workers[language] = Worker(argv, self.max_jobs)
+        return self._workers[language]
+
+    def check(self, path: str) -> str:
+        """ファイルの構文をチェックしてエラー内容を返す。エラーなし・対象外は空文字。"""
+        language = language_of(path)
+        if language == "python":
+            if not self.persistent:
+                return check_python(path)
+            return self._worker("python").request({"path": path}).get("error", "")
+        if language in ("javascript", "typescript"):
+            ext = path.rsplit(".", 1)[-1].lower()
+            try:
+                return self._worker("node").request({"path": path, "ext": ext}).get("error", "")
+            except FileNotFoundError:
+                # nodeが無い環境ではチェックしない
+                return ""
+        checker = _IN_PROCESS.get(language)
+        return checker(path) if checker else ""
+
+    def check_many(self, paths: list) -> dict:
+        """複数ファイルをチェックして path → エラー内容 を返す。
+
+        Python・JS/TS はワーカーへの1回のリクエストにまとめ、他は言語ごとに続けて処理する。
+        """
+        groups = {}
+        for path in paths:
+            language = language_of(path)
+            key = "node" if language in ("javascript", "typescript") else language
+            groups.setdefault(key, []).append(path)
+
+        results = {}
+        for key, group in groups.items():
+            if key == "python" and self.persistent:
+                errors = self._worker("python").request({"paths": group}).get("errors", [])
+            elif key == "python":
+                errors = [check_python(path) for path in group]
+            elif key == "node":
+                files = [{"path": path, "ext": path.rsplit(".", 1)[-1].lower()} for path in group]
+                try:
+                    errors = self._worker("node").request({"files": files}).get("errors", [])
+                except FileNotFoundError:
+                    errors = []
+            else:
+                checker = _IN_PROCESS.get(key)
+                errors = [checker(path) if checker else "" for path in group]
+            results.update(zip(group, errors + [""] * (len(group) - len(errors))))
+        return results
+
+    def close(self):
+        for worker in self._workers.values():
+            worker.close()
+        self._workers.clear()
+
+
+_IN_PROCESS = {
+    "json": check_json,
+    "shell": check_shell,
+    "html": structure.check_html,
+    "css": structure.check_css,
+}
+
+
+# --- プロジェクト全体のチェック（japanese-developer check） ---
+
+# 内容ハッシュの索引（前回エラーなしだったファイルのsha256）
+INDEX_PATH = os.path.join(".gemini", "check-index.json")
+
+# gitリポジトリ外で走査しないディレクトリ
+SKIP_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build", ".gemini"}
+
+
+def iter_project_files(root: str):
+    """チェック対象のファイル（rootからの相対パス）を列挙する。gitリポジトリなら追跡・未追跡（除外設定外）のみ。"""
+    result = subprocess.run(
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+        cwd=root, capture_output=True,
+    )
+    if result.returncode == 0:
+        for name in result.stdout.decode("utf-8", "replace").split("\0"):
+            if name.startswith(".gemini/") or not language_of(name):
+                continue
+            if os.path.isfile(os.path.join(root, name)):
+                yield name
+        return
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if language_of(filename):
+                yield os.path.relpath(os.path.join(dirpath, filename), root)
+
+
+def _file_hash(path: str) -> str:
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_index(root: str) -> dict:
+    try:
+        with open(os.path.join(root, INDEX_PATH), encoding="utf-8") as f:
+            return json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(root: str, files: dict):
+    path = os.path.join(root, INDEX_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "files": files}, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp, path)
+
+
+_PROCESS_POOL = None
+
+
+def _init_process():
+    global _PROCESS_POOL
+    _PROCESS_POOL = CheckerPool(persistent=False)
+
+
+def _check_in_process(path: str) -> str:
+    try:
+        return _PROCESS_POOL.check(path)
+    except OSError as e:
+        return str(e)
+
+
+def check_project(root: str, paths: list = None, jobs: int = None, use_index: bool = True) -> dict:
+    """プロジェクト内のファイルをプロセスプールで並列チェックする。
+
+    前回エラーなしで内容が変わっていないファイルは索引を見てスキップする。
+    戻り値は {"checked": 件数, "skipped": 件数, "errors": [{"path", "language", "error"}]}。
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    root = os.path.abspath(root)
+    names = paths if paths is not None else list(iter_project_files(root))
+    index = load_index(root) if use_index else {}
+
+    pending = []
+    skipped = 0
+    for name in names:
+        digest = _file_hash(os.path.join(root, name))
+        if index.get(name) == digest:
+            skipped += 1
+        else:
+            pending.append((name, digest))
+
+    errors = []
+    if pending:
+        jobs = jobs or os.cpu_count() or 1
+        full_paths = [os.path.join(root, name) for name, _ in pending]
+        chunksize = max(1, len(full_paths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_process) as executor:
+            results = executor.map(_check_in_process, full_paths, chunksize=chunksize)
+            for (name, digest), error in zip(pending, results):
+                if error:
+                    index.pop(name, None)
+                    errors.append({"path": name, "language": language_of(name), "error": error})
+                else:
+                    index[name] = digest
+
+    if use_index:
+        # 削除・移動されたファイルの記録は残さない
+        index = {name: digest for name, digest in index.items() if os.path.isfile(os.path.join(root, name))}
+        save_index(root, index)
+    return {"checked": len(pending), "skipped": skipped, "errors": errors}
+
+
+# エラー内容から行番号を拾うパターン（Python / tsc / JSON / node・HTML・CSS の順）
+_LINE_PATTERNS = (
+    re.compile(r'File ".*", line (\d+)'),
+    re.compile(r"\((\d+),\d+\): error"),
+    re.compile(r"line (\d+) column \d+"),
+    re.compile(r":(\d+)(?::\d+)?\b"),
+)
+
+
+# 位置だけの行（"File ..., line N" や "path:N"）。ファイル名と行番号は見出しに出すので省く
+_LOCATION_ONLY = re.compile(r'^\s*(File ".*", line \d+|\S+:\d+(:\d+)?)\s*$')
+
+
+def error_line(error: str):
+    """エラー内容の最初の行番号。見つからなければ None。"""
+    for pattern in _LINE_PATTERNS:
+        m = pattern.search(error)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+def batch_message(errors: list, checked: int, max_lines: int = 3) -> str:
+    """チェック結果を、言語ごと・ファイルごと（行番号付き）の1つの systemMessage 用テキストにする。
+
+    syntax-check hook と `check --json` の両方で使う。
+    errors は [{"path", "language", "error"}]。path は表示用（プロジェクトからの相対パス等）。
+    """
+    if not errors:
+        return ""
+    lines = [f"構文エラー検出（{checked}ファイル中 {len(errors)}件）。以下を修正してください。"]
+    by_language = {}
+    for item in sorted(errors, key=lambda e: e["path"]):
+        by_language.setdefault(item["language"], []).append(item)
+    for language, items in by_language.items():
+        lines.append(f"[{language}]")
+        for item in items:
+            line = error_line(item["error"])
+            lines.append(f"- {item['path']}" + (f":{line}" if line else ""))
+            detail = [text for text in item["error"].splitlines() if text.strip() and not _LOCATION_ONLY.match(text)]
+            if len(detail) > max_lines:
+                # 最後の行（"SyntaxError: ..." 等）は残す
+                detail = detail[:max_lines - 1] + detail[-1:]
+            lines.extend(f"    {text}" for text in detail[:max_lines])
+    return "\n".join(lines)
+
+
+def _safe_check_python(path: str) -> str:
+    try:
+        return check_python(path)
+    except OSError as e:
+        return str(e)
+
+
+def _python_worker():
+    """Pythonチェッカーワーカーのメインループ"""
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+            if "paths" in request:
+                reply = {"errors": [_safe_check_python(path) for path in request["paths"]]}
+            else:
+                reply = {"error": check_python(request["path"])}
+        except (OSError, ValueError, KeyError) as e:
+            reply = {"error": str(e)}
+        sys.stdout.write(json.dumps(reply, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["--worker"]:
+    _python_worker()
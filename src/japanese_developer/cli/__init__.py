@@ -0,0 +1,69 @@
+"""japanese-developer CLI: Gemini CLI汎用環境セットアップ
+
+サブコマンドは cli/ 以下のモジュールに分かれており、実行するサブコマンドの
+モジュールだけを import する（`status` で tasks・fonts 等を読み込まない）。
+起動時に読み込むのは click とこのファイルだけ。起動時間の予算は
+CLI_IMPORT_BUDGET_MS（`japanese-developer hook-budget` で計測）。
+"""
+
+import importlib
+from pathlib import Path
+
+import click
+
+GEMINI_DIR = Path.home() / ".gemini"
+
+# CLIの起動時間の予算（ミリ秒、インタプリタ起動時間は除く。click の import を含む）
+CLI_IMPORT_BUDGET_MS = 80
+
+# CLIの起動から status の解決までにimportしてはならないモジュール
+CLI_FORBIDDEN_IMPORTS = ("shutil", "subprocess", "sqlite3", "urllib.request", "zipfile")
+
+# サブコマンド名 → "モジュール:属性"
+SUBCOMMANDS = {
+    "setup": "japanese_developer.cli.install:setup",
+    "status": "japanese_developer.cli.install:status",
+    "uninstall": "japanese_developer.cli.install:uninstall",
+    "termux-setup": "japanese_developer.cli.install:termux_setup",
+    "hook": "japanese_developer.cli.hooks:hook",
+    "hook-budget": "japanese_developer.cli.hooks:hook_budget",
+    "bench-hooks": "japanese_developer.cli.hooks:bench_hooks",
+    "stats": "japanese_developer.cli.hooks:stats",
+    "hookd": "japanese_developer.cli.hooks:hookd",
+    "check": "japanese_developer.cli.diagnose:check",
+    "error": "japanese_developer.cli.diagnose:error",
+    "primer": "japanese_developer.cli.session:primer",
+    "context": "japanese_developer.cli.session:context_group",
+    "worklog": "japanese_developer.cli.worklog:worklog",
+    # `japanese-developer log search` でも呼べるようにする
+    "log": "japanese_developer.cli.worklog:worklog",
+    "pr-sync": "japanese_developer.cli.worklog:pr_sync",
+    "tasks": "japanese_developer.cli.tasks:tasks",
+    "guard": "japanese_developer.cli.guard:guard",
+    "font": "japanese_developer.cli.font:font",
+}
+
+
+class LazyGroup(click.Group):
+    """サブコマンドのモジュールを、そのサブコマンドが呼ばれた時に初めて import するグループ"""
+
+    def __init__(self, *args, lazy_subcommands: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        target = self.lazy_subcommands.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+        module_name, attr = target.split(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=SUBCOMMANDS)
+@click.version_option(package_name="japanese-developer")
+def main():
+    """Gemini CLI用の汎用コーディング環境セットアップツール"""
+    pass
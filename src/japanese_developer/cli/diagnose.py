@@ -0,0 +1,232 @@
+"""構文チェック・エラー診断レポート（check / error）"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option("--root", default=".", type=click.Path(exists=True, file_okay=False), help="プロジェクトのルート")
+@click.option("--jobs", "-j", type=int, help="並列プロセス数（既定: CPU数）")
+@click.option("--no-cache", is_flag=True, help="内容ハッシュ索引を使わず全ファイルをチェックする")
+@click.option("--json", "as_json", is_flag=True, help="結果をJSON（systemMessage付き）で出力する")
+def check(paths, root, jobs, no_cache, as_json):
+    """プロジェクト全体の構文エラーを並列チェックする（変更のないファイルはスキップ）"""
+    from japanese_developer import checkers
+
+    names = None
+    if paths:
+        root_abs = os.path.abspath(root)
+        names = [os.path.relpath(os.path.abspath(p), root_abs) for p in paths]
+
+    start = time.perf_counter()
+    report = checkers.check_project(root, names, jobs=jobs, use_index=not no_cache)
+    elapsed = time.perf_counter() - start
+
+    if as_json:
+        output = dict(report, seconds=round(elapsed, 3))
+        message = checkers.batch_message(report["errors"], report["checked"])
+        if message:
+            output["systemMessage"] = message
+        click.echo(json.dumps(output, ensure_ascii=False))
+    else:
+        click.secho("構文チェック", fg="cyan", bold=True)
+        click.echo(f"  チェック: {report['checked']}件 / スキップ（変更なし）: {report['skipped']}件（{elapsed:.2f} 秒）")
+        for item in report["errors"]:
+            click.echo()
+            click.secho(f"  ✗ {item['path']}", fg="red")
+            for line in item["error"].splitlines():
+                click.echo(f"    {line}")
+        if not report["errors"]:
+            click.secho("  ✓ 構文エラーなし", fg="green")
+
+    if report["errors"]:
+        sys.exit(1)
+
+
+def _read_multiline(prompt_msg: str, err: bool = False) -> str:
+    """複数行入力を受け付ける。空行で終了。"""
+    click.echo(prompt_msg, err=err)
+    click.secho("  （入力後、空行でEnterを押すと確定）", fg="bright_black", err=err)
+    lines = []
+    while True:
+        try:
+            line = input()
+        except EOFError:
+            break
+        if line == "":
+            if lines:
+                break
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option("--output", "-o", type=click.Path(), help="レポートをファイルに保存")
+@click.option("--auto", "auto_only", is_flag=True, help="対話をスキップして環境情報のみ収集")
+@click.option("--json", "as_json", is_flag=True, help="レポートをJSONで出力する（質問は標準エラーに表示）")
+@click.option("--from-log", "from_log", type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+              help="ログファイルからスタックトレースを抽出する（- で標準入力）")
+@click.option("--traces", default=3, show_default=True, help="抽出する異なるスタックトレースの数")
+def error(output, auto_only, as_json, from_log, traces):
+    """エラー情報を収集してコーディングエージェント用レポートを生成する"""
+    from japanese_developer import envinfo
+
+    # --json では標準出力をJSONだけにするため、対話・案内は標準エラーに出す
+    err = as_json
+    # 標準入力からログを読む場合は対話できない
+    if from_log == "-":
+        auto_only = True
+
+    click.echo(err=err)
+    click.secho("🔍 エラー診断レポート作成", fg="cyan", bold=True, err=err)
+    click.echo(err=err)
+
+    # --- 対話パート ---
+    user_answers = {}
+    if not auto_only:
+        click.secho("エラーについて教えてください（エージェントに渡すための情報収集です）", fg="yellow", err=err)
+        click.echo(err=err)
+
+        # 1. 何をしようとしていたか
+        user_answers["やろうとしていたこと"] = click.prompt(
+            "❶ 何をしようとしていた？（例: npm run devでサーバーを起動しようとした）", err=err
+        )
+        click.echo(err=err)
+
+        # 2. エラーメッセージ（ログから抽出する場合は聞かない）
+        if not from_log:
+            user_answers["エラーメッセージ"] = _read_multiline(
+                "❷ エラーメッセージを貼り付けてください:", err=err
+            )
+            click.echo(err=err)
+
+        # 3. 実行したコマンド
+        user_answers["実行したコマンド"] = click.prompt(
+            "❸ 実行したコマンドは？（例: npm run dev）",
+            default="", show_default=False, err=err
+        )
+        click.echo(err=err)
+
+        # 4. いつから
+        click.echo("❹ いつから発生している？", err=err)
+        choices = {"1": "最初から（一度も動いたことがない）", "2": "さっきまで動いてた", "3": "わからない"}
+        for k, v in choices.items():
+            click.echo(f"  {k}. {v}", err=err)
+        since = click.prompt("番号を選択", type=click.Choice(["1", "2", "3"]), default="3", err=err)
+        user_answers["発生時期"] = choices[since]
+        click.echo(err=err)
+
+        # 5. 最近変更したこと
+        user_answers["最近の変更"] = click.prompt(
+            "❺ 最近変更したことは？（例: パッケージを追加した、設定ファイルをいじった）",
+            default="特になし / わからない", show_default=True, err=err
+        )
+        click.echo(err=err)
+    else:
+        click.echo("--auto: 環境情報のみ収集します", err=err)
+        click.echo(err=err)
+
+    # --- ログからスタックトレースを抽出 ---
+    log_scan = None
+    if from_log:
+        from japanese_developer import logscan
+
+        click.secho("ログを解析中...", fg="bright_black", err=err)
+        log_scan = logscan.scan(from_log, limit=traces)
+
+    # --- 環境情報収集 ---
+    click.secho("環境情報を収集中...", fg="bright_black", err=err)
+    start = time.perf_counter()
+    env_info = envinfo.collect()
+    elapsed = time.perf_counter() - start
+
+    if as_json:
+        data = {
+            "generated_at": env_info.pop("日時"),
+            "answers": user_answers,
+            "environment": env_info,
+        }
+        if log_scan is not None:
+            data["log"] = {"path": from_log, **log_scan}
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        if output:
+            Path(output).write_text(text + "\n", encoding="utf-8")
+            click.secho(f"📄 レポートを保存しました: {output}", fg="green", err=True)
+        click.echo(text)
+        return
+
+    # --- レポート生成 ---
+    report_lines = []
+    report_lines.append("# エラー診断レポート")
+    report_lines.append("")
+    report_lines.append(f"生成日時: {env_info.pop('日時')}")
+    report_lines.append("")
+
+    if user_answers:
+        report_lines.append("## エラー内容")
+        report_lines.append("")
+        for key, val in user_answers.items():
+            if "\n" in val:
+                report_lines.append(f"### {key}")
+                report_lines.append("```")
+                report_lines.append(val)
+                report_lines.append("```")
+            else:
+                report_lines.append(f"- **{key}**: {val}")
+        report_lines.append("")
+
+    if log_scan is not None:
+        report_lines.append("## ログから抽出したスタックトレース")
+        report_lines.append("")
+        scanned_mb = log_scan["scanned_bytes"] / 1024 / 1024
+        source = "標準入力" if from_log == "-" else from_log
+        report_lines.append(f"（{source}、末尾から {scanned_mb:.1f} MB を走査。新しい順）")
+        report_lines.append("")
+        if not log_scan["traces"]:
+            report_lines.append("スタックトレースは見つかりませんでした。")
+            report_lines.append("")
+        for i, trace in enumerate(log_scan["traces"], 1):
+            report_lines.append(f"### {i}. {trace['kind']}（{trace['count']}回・指紋 {trace['fingerprint']}）")
+            report_lines.append("```")
+            report_lines.extend(trace["lines"])
+            report_lines.append("```")
+            report_lines.append("")
+
+    report_lines.append("## 環境情報")
+    report_lines.append("")
+    for key, val in env_info.items():
+        if "\n" in val:
+            report_lines.append(f"### {key}")
+            report_lines.append("```")
+            report_lines.append(val)
+            report_lines.append("```")
+        else:
+            report_lines.append(f"- **{key}**: {val}")
+    report_lines.append("")
+
+    report = "\n".join(report_lines)
+
+    # --- 出力 ---
+    click.echo(err=err)
+    click.secho("━" * 50, fg="cyan", err=err)
+    click.echo(report, err=err)
+    click.secho("━" * 50, fg="cyan", err=err)
+    click.secho(f"（環境情報の収集: {elapsed:.2f} 秒）", fg="bright_black", err=err)
+
+    if output:
+        out_path = Path(output)
+        out_path.write_text(report, encoding="utf-8")
+        click.echo(err=err)
+        click.secho(f"📄 レポートを保存しました: {out_path}", fg="green", err=err)
+
+    click.echo(err=err)
+    click.secho("使い方:", fg="yellow", err=err)
+    click.echo("  上のレポートをコピーしてコーディングエージェントに貼り付けてください。", err=err)
+    click.echo("  エージェントがエラーの原因を診断してくれます。", err=err)
@@ -0,0 +1,81 @@
+"""Termuxのフォント（font）"""
+
+import shutil
+import subprocess
+
+import click
+
+
+@click.group()
+def font():
+    """Termuxのフォントを取得・キャッシュ・適用する（font-select.sh 用）"""
+    pass
+
+
+@font.command(name="list")
+def font_list():
+    """選べるフォントとキャッシュの状態"""
+    from japanese_developer import fonts
+
+    index = fonts.load_index()
+    for name, desc, repo, _, ttf_name in fonts.FONTS:
+        sha256 = index.get(repo, {}).get("fonts", {}).get(ttf_name)
+        cached = sha256 and fonts.object_path(sha256).exists()
+        mark = "✓ キャッシュ済み" if cached else "- 未取得"
+        click.echo(f"  {name:<12} {mark}  {desc}")
+
+
+@font.command(name="install")
+@click.argument("name")
+def font_install(name):
+    """フォントを取得して ~/.termux/font.ttf に適用する（キャッシュがあれば再ダウンロードしない）"""
+    from japanese_developer import fonts
+    from japanese_developer.github import ApiError, OfflineError
+
+    spec = next((f for f in fonts.FONTS if f[0].lower() == name.lower()), None)
+    if spec is None:
+        raise click.ClickException(f"不明なフォント: {name}（{', '.join(f[0] for f in fonts.FONTS)}）")
+    display, _, repo, zip_prefix, ttf_name = spec
+
+    shown = []
+
+    def progress(done, total):
+        # 1%（サイズ不明なら1MB）進むごとに表示を更新する
+        step = done * 100 // total if total else done >> 20
+        if shown and shown[-1] == step:
+            return
+        shown.append(step)
+        if total:
+            click.echo(f"\r  ダウンロード中: {step}%（{done / 1e6:.1f} / {total / 1e6:.1f} MB）", nl=False)
+        else:
+            click.echo(f"\r  ダウンロード中: {done / 1e6:.1f} MB", nl=False)
+
+    click.echo(f"  {display} を準備しています...")
+    try:
+        result = fonts.fetch(repo, zip_prefix, ttf_name, progress)
+    except OfflineError as e:
+        raise click.ClickException(f"ネットワークに接続できません: {e}（途中まで取得した分は次回続きから取得します）")
+    except (ApiError, fonts.FontError) as e:
+        raise click.ClickException(str(e))
+    if result["downloaded"]:
+        click.echo()
+    elif result["offline"]:
+        click.echo("  オフラインのためキャッシュ済みのフォントを使います")
+    else:
+        click.echo("  キャッシュ済みのフォントを使います（ダウンロードなし）")
+
+    fonts.install(result["path"])
+    if shutil.which("termux-reload-settings"):
+        subprocess.run(["termux-reload-settings"], capture_output=True)
+    click.echo()
+    click.secho(f"  ✅ {display} を適用しました。", fg="green")
+    click.echo("  （元に戻すには ~/.termux/font.ttf を削除して termux-reload-settings）")
+
+
+@font.command(name="prune")
+def font_prune():
+    """使われていないフォントと途中のダウンロードをキャッシュから削除する"""
+    from japanese_developer import fonts
+
+    freed = fonts.prune()
+    click.echo(f"  ✓ {freed / 1e6:.1f} MB を解放しました")
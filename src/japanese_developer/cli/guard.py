@@ -0,0 +1,69 @@
+"""interactive-guard のルール確認・計測（guard）"""
+
+import sys
+import time
+
+import click
+
+
+@click.group()
+def guard():
+    """interactive-guard のルールを確認・計測する"""
+    pass
+
+
+@guard.command(name="check")
+@click.argument("command")
+def guard_check(command):
+    """コマンド文字列をガードルールで評価する"""
+    from japanese_developer import guard as engine
+
+    rule, subcommand = engine.evaluate(command)
+    if rule is None:
+        click.secho("  ✓ 許可", fg="green")
+        return
+    click.secho(f"  ✗ 拒否 [{rule.id}] {subcommand}", fg="red")
+    click.echo(f"  {rule.reason.replace('{command}', subcommand)}")
+
+
+@guard.command(name="bench")
+@click.option("--iterations", "-n", default=200, show_default=True, help="コーパスを評価する回数")
+@click.option("--corpus", type=click.Path(exists=True, dir_okay=False), help="コーパスファイル（JSONL）")
+def guard_bench(iterations, corpus):
+    """コマンドコーパスで判定結果を検証し、評価スループットを計測する"""
+    from japanese_developer import guard as engine
+
+    entries = engine.load_corpus(corpus) if corpus else engine.load_corpus()
+    start = time.perf_counter()
+    ruleset = engine.compiled()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    mismatches = []
+    for entry in entries:
+        rule, _ = engine.evaluate(entry["command"], ruleset)
+        expected = entry.get("rule") if entry["expect"] == "deny" else None
+        actual = rule.id if rule else None
+        if (entry["expect"] == "deny") != (rule is not None) or (expected and expected != actual):
+            mismatches.append((entry["command"], entry["expect"], actual))
+
+    commands = [entry["command"] for entry in entries]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for command in commands:
+            engine.evaluate(command, ruleset)
+    elapsed = time.perf_counter() - start
+    total = iterations * len(commands)
+
+    click.secho("interactive-guard ベンチマーク", fg="cyan", bold=True)
+    click.echo(f"  ルール数: {len(ruleset.rules)}（プログラム {len(ruleset.index)}種）")
+    click.echo(f"  コンパイル: {compile_ms:.2f} ms")
+    click.echo(f"  コーパス: {len(commands)}件 × {iterations}回")
+    click.echo(f"  スループット: {total / elapsed:,.0f} コマンド/秒（1件あたり {elapsed / total * 1e6:.1f} µs）")
+
+    if mismatches:
+        click.echo()
+        click.secho(f"  ✗ 判定がコーパスと一致しません（{len(mismatches)}件）:", fg="red")
+        for command, expect, actual in mismatches:
+            click.echo(f"    - {command}（期待: {expect} / 実際: {actual or 'allow'}）")
+        sys.exit(1)
+    click.secho(f"  ✓ 全{len(commands)}件の判定がコーパスと一致", fg="green")
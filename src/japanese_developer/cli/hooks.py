@@ -0,0 +1,273 @@
+"""hookの実行・計測（hook / hook-budget / bench-hooks / stats / hookd）"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from japanese_developer import settings as settings_file
+from japanese_developer import template_path
+
+
+@click.command(context_settings={"ignore_unknown_options": True})
+@click.argument("name")
+def hook(name):
+    """Python版hookを実行する（stdinのhook JSONを処理）"""
+    # 通常は entry.main がclickを経由せずに処理する。ここはヘルプ表示と直接呼び出し用。
+    from japanese_developer import hooks
+    sys.exit(hooks.main([name]))
+
+
+# hook-budget で計測するimport: hook の高速パスと、CLIの `status` サブコマンドの解決まで
+# （click と cli/install.py を含む）
+HOOK_IMPORT_CODE = "import japanese_developer.entry, japanese_developer.hooks"
+CLI_IMPORT_CODE = (
+    "import japanese_developer.entry, japanese_developer.cli as cli; cli.main.get_command(None, 'status')"
+)
+
+
+def _import_ms(code: str, runs: int):
+    """`python -X importtime -c code` を runs 回実行し、(import時間の中央値 ms, importしたモジュール) を返す。"""
+    import_ms = []
+    imported = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True,
+        )
+        total_us = 0
+        for line in result.stderr.splitlines():
+            # 形式: "import time: self [us] | cumulative | imported package"
+            parts = line.split("|")
+            if len(parts) != 3 or not parts[1].strip().isdigit():
+                continue
+            name = parts[2].rstrip()
+            imported.add(name.strip())
+            # インデントなし = トップレベルでimportしたモジュール
+            if name.startswith(" japanese_developer"):
+                total_us += int(parts[1])
+        import_ms.append(total_us / 1000)
+    return sorted(import_ms)[len(import_ms) // 2], imported
+
+
+def _wall_ms(args: list, runs: int) -> float:
+    """`python -m japanese_developer.entry args` のインタプリタ起動込みの実行時間（中央値 ms）"""
+    wall_ms = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "japanese_developer.entry", *args],
+            input="{}", capture_output=True, text=True,
+        )
+        wall_ms.append((time.perf_counter() - start) * 1000)
+    return sorted(wall_ms)[len(wall_ms) // 2]
+
+
+def _report_budget(title: str, import_ms: float, budget_ms: int, wall_label: str, wall_ms: float,
+                   forbidden: list) -> bool:
+    click.secho(title, fg="cyan", bold=True)
+    click.echo(f"  モジュールimport: {import_ms:.1f} ms（予算 {budget_ms} ms）")
+    click.echo(f"  {wall_label}（インタプリタ起動込み）: {wall_ms:.1f} ms")
+    if forbidden:
+        click.secho(f"  ✗ 禁止モジュールをimport: {', '.join(forbidden)}", fg="red")
+    ok = import_ms <= budget_ms and not forbidden
+    if ok:
+        click.secho("  ✓ 予算内", fg="green")
+    else:
+        click.secho("  ✗ 予算超過", fg="red")
+    return ok
+
+
+@click.command(name="hook-budget")
+@click.option("--runs", default=5, show_default=True, help="計測回数")
+def hook_budget(runs):
+    """hook高速パスとCLIの起動時間を計測し、予算内か確認する"""
+    from japanese_developer.cli import CLI_FORBIDDEN_IMPORTS, CLI_IMPORT_BUDGET_MS
+    from japanese_developer.hooks import FORBIDDEN_IMPORTS, HOOK_IMPORT_BUDGET_MS
+
+    import_ms, imported = _import_ms(HOOK_IMPORT_CODE, runs)
+    hook_ok = _report_budget(
+        "hook高速パスの起動時間", import_ms, HOOK_IMPORT_BUDGET_MS,
+        "hook実行", _wall_ms(["hook", "interactive-guard"], runs),
+        [m for m in FORBIDDEN_IMPORTS if m in imported],
+    )
+
+    import_ms, imported = _import_ms(CLI_IMPORT_CODE, runs)
+    click.echo()
+    cli_ok = _report_budget(
+        "CLIの起動時間（status）", import_ms, CLI_IMPORT_BUDGET_MS,
+        "status 実行", _wall_ms(["status"], runs),
+        [m for m in CLI_FORBIDDEN_IMPORTS if m in imported],
+    )
+    if not (hook_ok and cli_ok):
+        sys.exit(1)
+
+
+def _bench_hooks_config(source: str) -> dict:
+    """bench-hooks で計測するhook設定を返す。"""
+    if source == "installed":
+        config = settings_file.read().get("hooks", {})
+        if not config:
+            raise click.ClickException("settings.json にhookがありません。先に setup を実行してください")
+        return config
+    hooks_dir = Path(template_path("hooks"))
+    with open(template_path("hooks.json"), encoding="utf-8") as f:
+        config = json.load(f)
+    # 未導入でも計測できるよう、パッケージ内のスクリプトを直接指す
+    for hook_groups in config.values():
+        for group in hook_groups:
+            for h in group.get("hooks", []):
+                h["command"] = h["command"].replace("~/.gemini/hooks/", f"{hooks_dir}/")
+    if source == "python":
+        from japanese_developer.cli.install import use_python_hooks
+
+        config = use_python_hooks(config)
+    return config
+
+
+@click.command(name="bench-hooks")
+@click.option("--source", type=click.Choice(["installed", "templates", "python"]), default="installed",
+              show_default=True, help="計測するhook（導入済み / パッケージ内のbash版 / Python版）")
+@click.option("--iterations", "-n", default=5, show_default=True, help="ペイロードごとの計測回数")
+@click.option("--corpus", type=click.Path(exists=True, dir_okay=False), help="ペイロードファイル（JSONL）")
+@click.option("--save", "save_path", type=click.Path(dir_okay=False), help="結果をベースラインとして保存する")
+@click.option("--baseline", "baseline_path", type=click.Path(exists=True, dir_okay=False),
+              help="ベースラインと比較し、p95 が悪化していれば失敗する")
+@click.option("--tolerance", default=20, show_default=True, help="許容するp95の悪化（%）")
+@click.option("--json", "as_json", is_flag=True, help="結果をJSONで出力する")
+def bench_hooks(source, iterations, corpus, save_path, baseline_path, tolerance, as_json):
+    """記録したhook入力を使い捨てのリポジトリで再生し、hookごとの遅延を計測する"""
+    from japanese_developer import bench
+
+    config = _bench_hooks_config(source)
+    entries = bench.load_corpus(corpus)
+    results = bench.run(config, entries, iterations=iterations)
+
+    regressions = []
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f).get("hooks", {})
+        regressions = bench.compare(results, baseline, tolerance / 100)
+
+    if save_path:
+        with open(save_path, "w", encoding="utf-8") as f:
+            json.dump({"source": source, "iterations": iterations, "hooks": results},
+                      f, indent=2, ensure_ascii=False)
+
+    if as_json:
+        click.echo(json.dumps({"hooks": results, "regressions": [
+            {"name": name, "baseline_p95_ms": base, "p95_ms": now} for name, base, now in regressions
+        ]}, indent=2, ensure_ascii=False))
+    else:
+        click.secho(f"hookレイテンシ（{source}、ペイロードごとに{iterations}回）", fg="cyan", bold=True)
+        click.echo(f"  {'hook':<20} {'p50':>8} {'p95':>8} {'p99':>8} {'fork':>6} {'RSS':>8}")
+        for name, r in results.items():
+            forks = "-" if r["forks_per_run"] is None else f"{r['forks_per_run']:g}"
+            click.echo(
+                f"  {name:<20} {r['p50_ms']:>6.1f}ms {r['p95_ms']:>6.1f}ms {r['p99_ms']:>6.1f}ms"
+                f" {forks:>6} {r['peak_rss_kb'] / 1024:>6.1f}MB"
+            )
+            if r["failures"]:
+                click.secho(f"    ✗ {r['failures']}/{r['runs']}回 非0で終了", fg="yellow")
+        if save_path:
+            click.echo(f"\n  ベースラインを保存しました: {save_path}")
+
+    if regressions:
+        for name, base, now in regressions:
+            click.secho(f"  ✗ {name}: p95 {base:.1f}ms → {now:.1f}ms（許容 +{tolerance}%）", fg="red", err=as_json)
+        sys.exit(1)
+    if baseline_path and not as_json:
+        click.secho(f"  ✓ ベースラインから +{tolerance}% 以内", fg="green")
+
+
+@click.command()
+@click.option("--hours", type=float, help="直近N時間の記録だけを集計する")
+@click.option("--top", default=5, show_default=True, help="表示する遅い呼び出しの件数")
+@click.option("--json", "as_json", is_flag=True, help="集計結果をJSONで出力する")
+def stats(hours, top, as_json):
+    """hook実行の記録（~/.gemini/telemetry.jsonl）を集計する"""
+    from japanese_developer import telemetry
+
+    since = time.time() - hours * 3600 if hours else 0
+    summary = telemetry.summarize(telemetry.load(since=since), top=top)
+    if as_json:
+        click.echo(json.dumps(summary, indent=2, ensure_ascii=False))
+        return
+
+    click.secho("hook実行の統計", fg="cyan", bold=True)
+    if not summary["total"]:
+        click.echo("  記録がありません（Python版hookの実行時に記録されます: setup --python-hooks）")
+        return
+    click.echo(f"  記録: {summary['total']}件（{telemetry.TELEMETRY_PATH}）")
+
+    for name, h in summary["hooks"].items():
+        click.echo()
+        click.secho(f"  {name}", bold=True)
+        line = f"    {h['count']}回  p50 {h['p50_ms']:.1f}ms  p95 {h['p95_ms']:.1f}ms  最大 {h['max_ms']:.1f}ms"
+        if h["denies"]:
+            line += f"  拒否 {h['denies']}回"
+        click.echo(line)
+        if h["errors"]:
+            click.secho(f"    ✗ 異常終了 {h['errors']}回", fg="red")
+        peak = max(h["histogram"].values())
+        for label, n in h["histogram"].items():
+            bar = "█" * max(1, round(n / peak * 30))
+            click.echo(f"    {label:>10} {bar} {n}")
+
+    if summary["denies"]:
+        click.echo()
+        click.secho("  拒否したルール:", bold=True)
+        for rule, n in summary["denies"].items():
+            click.echo(f"    {n:>5}回  {rule}")
+
+    click.echo()
+    click.secho(f"  遅い呼び出し（上位{top}件）:", bold=True)
+    for e in summary["slowest"]:
+        when = time.strftime("%m-%d %H:%M:%S", time.localtime(e.get("ts", 0)))
+        tool = f" {e['tool']}" if e.get("tool") else ""
+        click.echo(f"    {e.get('ms', 0):>8.1f}ms  {when}  {e.get('hook')}{tool}")
+
+
+@click.command()
+@click.option("--background", "-d", is_flag=True, help="バックグラウンドで起動する")
+@click.option("--stop", is_flag=True, help="起動中のhookdを停止する")
+@click.option("--status", "show_status", is_flag=True, help="起動状態を表示する")
+def hookd(background, stop, show_status):
+    """常駐hookサーバーを起動する（hookのインタプリタ起動を省く）"""
+    from japanese_developer import hookd as server
+
+    if show_status:
+        if server.is_running():
+            click.echo(f"  ✓ hookd 起動中（pid {server.read_pid()}、{server.SOCKET_PATH}）")
+        else:
+            click.echo("  ✗ hookd は起動していません（hookはプロセス内で実行されます）")
+        return
+
+    if stop:
+        if server.stop():
+            click.echo("hookd を停止しました")
+        else:
+            click.echo("hookd は起動していません")
+        return
+
+    if server.is_running():
+        click.echo(f"hookd は既に起動しています（pid {server.read_pid()}）")
+        return
+
+    if background:
+        subprocess.Popen(
+            [sys.executable, "-m", "japanese_developer.hookd"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        click.secho(f"✅ hookd をバックグラウンドで起動しました: {server.SOCKET_PATH}", fg="green")
+        return
+
+    click.echo(f"hookd 待ち受け中: {server.SOCKET_PATH}（Ctrl+C で停止）")
+    try:
+        server.serve()
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
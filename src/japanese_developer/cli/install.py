@@ -0,0 +1,317 @@
+"""導入・状態確認・削除（setup / status / uninstall / termux-setup）"""
+
+import json
+from pathlib import Path
+
+import click
+
+from japanese_developer import settings as settings_file
+from japanese_developer import template_path
+from japanese_developer.cli import GEMINI_DIR
+from japanese_developer.settings import merge_hooks
+
+
+def python_hook_command(name: str) -> str:
+    """hook名に対応するPython版hookの起動コマンドを返す。"""
+    import shutil
+
+    exe = shutil.which("japanese-developer") or "japanese-developer"
+    return f"{exe} hook {name}"
+
+
+def use_python_hooks(hooks_config: dict) -> dict:
+    """hooks.json の定義のうちPython実装があるものを `japanese-developer hook` に差し替える。"""
+    from japanese_developer.hooks import HOOKS
+
+    for hook_groups in hooks_config.values():
+        for group in hook_groups:
+            for h in group.get("hooks", []):
+                if h.get("name") in HOOKS:
+                    h["command"] = python_hook_command(h["name"])
+    return hooks_config
+
+
+@click.command()
+@click.option("--force", is_flag=True, help="既存ファイルを上書きする")
+@click.option("--python-hooks", is_flag=True, help="bashスクリプトの代わりにPython版hookを登録する")
+def setup(force, python_hooks):
+    """~/.gemini/ にhook・システムプロンプトを導入する"""
+    import shutil
+    import stat
+
+    from japanese_developer import manifest
+
+    GEMINI_DIR.mkdir(parents=True, exist_ok=True)
+    installed = []
+    skipped = []
+    unchanged = 0
+
+    # --- テンプレート（GEMINI.md・primer.md・hooks・commands・context）---
+    # マニフェストと比べて、未配置・テンプレート更新分だけコピーする
+    previous = manifest.load()
+    files = dict((previous or {}).get("files", {}))
+    for rel, src, state in manifest.plan(previous):
+        dest = GEMINI_DIR / rel
+        if state == manifest.RETIRE:
+            entry = files.pop(rel)
+            if manifest.sha256_file(dest) == entry["sha256"]:
+                dest.unlink()
+                installed.append(f"{rel}（廃止されたため削除）")
+            elif dest.exists():
+                skipped.append(f"{rel}（廃止済み。ローカルで変更ありのため残します）")
+            continue
+        if state == manifest.MODIFIED and not force:
+            skipped.append(f"{rel}（ローカルで変更あり。--force で上書き）")
+            continue
+        if state == manifest.CURRENT:
+            unchanged += 1
+            continue
+
+        src_hash = manifest.sha256_file(src)
+        if state != manifest.ADOPT:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dest)
+            if rel.startswith("hooks/"):
+                # 実行権限付与
+                dest.chmod(dest.stat().st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+            suffix = {manifest.UPDATE: "（更新）", manifest.MODIFIED: "（上書き）"}.get(state, "")
+            installed.append(f"{rel}{suffix}")
+        files[rel] = manifest.entry_for(dest, src_hash)
+
+    if previous is None:
+        # マニフェスト導入前の環境: 以前のバージョンが配置したファイルを片付ける
+        for rel, hashes in manifest.LEGACY_FILES.items():
+            dest = GEMINI_DIR / rel
+            if not dest.exists():
+                continue
+            if manifest.sha256_file(dest) in hashes:
+                dest.unlink()
+                installed.append(f"{rel}（廃止されたため削除）")
+            else:
+                skipped.append(f"{rel}（廃止済み。ローカルで変更ありのため残します）")
+
+    # --- settings.json へhook設定をマージ ---
+    hooks_json_path = Path(template_path("hooks.json"))
+
+    with open(hooks_json_path, "r") as f:
+        new_hooks = json.load(f)
+
+    if python_hooks:
+        new_hooks = use_python_hooks(new_hooks)
+
+    # 以前のバージョンで登録し、hooks.json から無くなったhookは外す
+    # （マニフェストが無ければ、マニフェスト導入前のバージョンが登録していたhook名で判断する）
+    registered = manifest.LEGACY_HOOK_NAMES if previous is None else previous.get("hook_names", [])
+    retired = sorted(set(registered) - set(manifest.hook_names()))
+
+    def apply(settings):
+        settings_file.remove_hooks(settings, retired)
+        return merge_hooks(settings, new_hooks, replace=force or python_hooks)
+
+    settings_file.update(apply)
+    installed.append("settings.json（hook設定をマージ）")
+    installed += [f"hook {name}（廃止されたため登録を解除）" for name in retired]
+
+    manifest.save(files, manifest.hook_names())
+
+    # --- 結果表示 ---
+    click.echo()
+    click.secho("✅ japanese-developer セットアップ完了", fg="green", bold=True)
+    click.echo()
+
+    if installed:
+        click.secho("導入済み:", fg="cyan")
+        for item in installed:
+            click.echo(f"  ✓ {item}")
+
+    if unchanged:
+        click.echo(f"  ✓ 最新のため変更なし: {unchanged}件")
+
+    if skipped:
+        click.echo()
+        click.secho("スキップ:", fg="yellow")
+        for item in skipped:
+            click.echo(f"  - {item}")
+
+    click.echo()
+    click.echo(f"設定先: {GEMINI_DIR}")
+    click.echo()
+    click.secho("次にやること:", fg="cyan")
+    click.echo("  1. ~/.gemini/GEMINI.md を確認・カスタマイズ")
+    click.echo("  2. Gemini CLI を起動して動作確認")
+    click.echo("  3. 環境変数は ~/.gemini/ENV.md に手動で記載")
+
+
+@click.command()
+def status():
+    """現在のインストール状態を確認する"""
+
+    click.secho("japanese-developer 状態確認", fg="cyan", bold=True)
+    click.echo()
+
+    from japanese_developer import manifest
+
+    installed = manifest.load()
+    if installed is None:
+        click.echo("  ✗ マニフェストがありません（japanese-developer setup を実行してください）")
+    else:
+        click.echo(f"  ✓ マニフェスト（v{installed['package_version']}、{installed['updated_at']}）")
+    recorded = (installed or {}).get("files", {})
+
+    # 導入ファイル（マニフェストのハッシュと比較）
+    for rel, _, state in manifest.plan(installed):
+        if state == manifest.CURRENT:
+            click.echo(f"  ✓ {rel}")
+        elif state == manifest.ADOPT:
+            click.echo(f"  ✓ {rel}（マニフェスト未記録）")
+        elif state == manifest.INSTALL:
+            click.echo(f"  ✗ {rel} が見つかりません" if rel in recorded else f"  ✗ {rel} 未導入")
+        elif state == manifest.UPDATE:
+            click.echo(f"  ↻ {rel}（新しいテンプレートあり。setup で更新）")
+        elif state == manifest.MODIFIED:
+            click.echo(f"  ! {rel}（ローカルで変更あり）")
+        else:
+            click.echo(f"  - {rel}（廃止済み。setup で削除）")
+
+    # settings.json のhook設定
+    settings_path = GEMINI_DIR / "settings.json"
+    if settings_path.exists():
+        with open(settings_path) as f:
+            settings = json.load(f)
+        hooks = settings.get("hooks", {})
+        hook_count = sum(
+            len(h.get("hooks", []))
+            for groups in hooks.values()
+            for h in groups
+        )
+        click.echo(f"  ✓ settings.json（hook {hook_count}件登録済み）")
+    else:
+        click.echo("  ✗ settings.json が見つかりません")
+
+    click.echo()
+
+
+@click.command()
+@click.option("--force", is_flag=True, help="ローカルで変更したファイルも削除する")
+def uninstall(force):
+    """japanese-developer が導入したhookを削除する"""
+    from japanese_developer import manifest
+
+    installed = manifest.load()
+    if installed is not None:
+        files = installed["files"]
+        managed_names = installed["hook_names"]
+    else:
+        # マニフェスト導入前の環境: テンプレートと同じ名前のファイルと、以前のバージョンのものを対象にする
+        files = {rel: {"sha256": ""} for rel in [*manifest.template_files(), *manifest.LEGACY_FILES]}
+        managed_names = sorted({*manifest.hook_names(), *manifest.LEGACY_HOOK_NAMES})
+
+    removed = []
+    kept = []
+
+    # 導入ファイル削除（GEMINI.md はユーザーが育てるファイルなので残す）
+    for rel, entry in sorted(files.items()):
+        if rel == "GEMINI.md":
+            continue
+        path = GEMINI_DIR / rel
+        if not path.exists():
+            continue
+        if entry["sha256"] and manifest.sha256_file(path) != entry["sha256"] and not force:
+            kept.append(rel)
+            continue
+        path.unlink()
+        removed.append(rel)
+
+    # settings.json からhook設定を除去
+    settings_path = GEMINI_DIR / "settings.json"
+    if settings_path.exists():
+        settings_file.update(lambda settings: settings_file.remove_hooks(settings, managed_names))
+        removed.append("settings.json（hook設定を除去）")
+
+    # 残したファイルだけをマニフェストに残す（次回の uninstall --force で削除できるように）
+    if kept and installed is not None:
+        manifest.save({rel: files[rel] for rel in kept}, [])
+    elif manifest.MANIFEST_PATH.exists():
+        manifest.MANIFEST_PATH.unlink()
+        removed.append(manifest.MANIFEST_PATH.name)
+
+    click.echo()
+    if removed:
+        click.secho("🗑️  削除完了:", fg="yellow")
+        for item in removed:
+            click.echo(f"  - {item}")
+        click.echo()
+        click.echo("※ GEMINI.md は手動で管理してください")
+    else:
+        click.echo("削除するものがありませんでした")
+    if kept:
+        click.echo()
+        click.secho("残したファイル:", fg="yellow")
+        for item in kept:
+            click.echo(f"  - {item}（ローカルで変更あり。--force で削除）")
+
+
+TERMUX_UI_SETTINGS = {
+    "useAlternateBuffer": False,
+    "hideBanner": True,
+    "hideFooter": True,
+    "hideContextSummary": True,
+    "hideTips": True,
+    "incrementalRendering": True,
+}
+
+
+def shell_template(name: str) -> str:
+    """templates/shell/ の bashrc 追記用スクリプトを読む。"""
+    return Path(template_path("shell", name)).read_text(encoding="utf-8")
+
+
+@click.command(name="termux-setup")
+def termux_setup():
+    """Termux環境向けのGemini CLI UI最適化を適用する"""
+
+    # UI設定をマージ
+    settings_file.update(lambda settings: settings.setdefault("ui", {}).update(TERMUX_UI_SETTINGS))
+
+    click.echo()
+    click.secho("✅ Termux UI最適化を適用しました", fg="green", bold=True)
+    click.echo()
+    click.secho("適用した設定:", fg="cyan")
+    for key, val in TERMUX_UI_SETTINGS.items():
+        click.echo(f"  ✓ {key}: {val}")
+
+    # bashrc エイリアス・プライマー関数
+    bashrc = Path.home() / ".bashrc"
+    bashrc_content = bashrc.read_text() if bashrc.exists() else ""
+
+    primer_marker = "# japanese-developer: gemini起動時プライマー表示"
+    alias_marker = "# Gemini CLI - Termux aliases (japanese-developer)"
+
+    added_items = []
+
+    if primer_marker not in bashrc_content:
+        with open(bashrc, "a") as f:
+            f.write(shell_template("jd-primer.bash"))
+        added_items.append("jd-primer 関数（起動時メニュー表示）")
+
+    bashrc_content = bashrc.read_text() if bashrc.exists() else ""
+    if alias_marker not in bashrc_content:
+        with open(bashrc, "a") as f:
+            f.write(shell_template("termux-aliases.bash"))
+        added_items.append("gemini エイリアス（プライマー付き起動）")
+        added_items.append("gemini-safe（色なしモード）")
+        added_items.append("gemini-plain（screenReaderモード）")
+
+    if added_items:
+        click.echo()
+        click.secho("bashrcに追加:", fg="cyan")
+        for item in added_items:
+            click.echo(f"  ✓ {item}")
+    else:
+        click.echo()
+        click.echo("  - bashrcエイリアス（既に存在）")
+
+    click.echo()
+    click.secho("次にやること:", fg="cyan")
+    click.echo("  1. source ~/.bashrc でエイリアスを反映")
+    click.echo("  2. gemini を起動してUI改善を確認")
@@ -0,0 +1,78 @@
+"""SessionStart で注入する内容の確認（primer / context）"""
+
+import json
+import sys
+import time
+
+import click
+
+
+@click.command()
+@click.option("--git", "git_only", is_flag=True, help="git連携情報だけを表示する")
+@click.option("--no-cache", is_flag=True, help="キャッシュを使わずに作り直す")
+@click.option("--project-dir", default=".", type=click.Path(exists=True, file_okay=False), help="プロジェクトのルート")
+def primer(git_only, no_cache, project_dir):
+    """SessionStart で注入するプライマーを表示する"""
+    from japanese_developer import primer as session_primer
+
+    start = time.perf_counter()
+    result = session_primer.build(project_dir, use_cache=not no_cache)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if git_only:
+        info = result["git"]
+        if info is None:
+            click.echo("  （gitリポジトリ外）")
+            return
+        click.echo(f"  ユーザー: {info['user']}")
+        click.echo(f"  ブランチ: {info['branch']}")
+        click.echo(f"  リモート: {info['remote']}")
+        click.echo(f"  未コミット: {info['changes']}件（未追跡ファイルを除く）")
+        return
+
+    click.echo(result["context"] or "（primer.md が見つかりません）")
+    click.echo()
+    source = "キャッシュ" if result["cached"] else "再生成"
+    click.secho(f"{source}: {elapsed:.1f} ms", fg="cyan")
+
+
+@click.group(name="context")
+def context_group():
+    """SessionStart で注入するコンテキストを管理する"""
+
+
+@context_group.command(name="build")
+@click.option("--project-dir", default=".", type=click.Path(exists=True, file_okay=False), help="プロジェクトのルート")
+@click.option("--budget", type=int, default=None, help="トークン数の予算（既定: JD_CONTEXT_BUDGET または 3000）")
+@click.option("--show", is_flag=True, help="注入するテキストも表示する")
+@click.option("--json", "as_json", is_flag=True, help="JSONで出力する")
+def context_build(project_dir, budget, show, as_json):
+    """コンテキストを組み立ててキャッシュし、セクションごとのサイズを表示する"""
+    from japanese_developer import context
+
+    start = time.perf_counter()
+    result = context.build(project_dir, budget)
+    elapsed = (time.perf_counter() - start) * 1000
+    stats = result["stats"]
+
+    if as_json:
+        click.echo(json.dumps(stats, ensure_ascii=False, indent=2))
+        return
+
+    if show:
+        click.echo(result["output"]["hookSpecificOutput"]["additionalContext"])
+        click.echo()
+    click.secho("注入するコンテキスト", fg="cyan", bold=True)
+    for section in stats["sections"]:
+        if section["included"]:
+            click.echo(f"  ✓ {section['name']:<14} {section['bytes']:>6} B  {section['tokens']:>5} tok  {section['reason']}")
+        else:
+            click.secho(f"  - {section['name']:<14} {'':>6}    {'':>5}      {section['reason']}", fg="bright_black")
+    click.echo()
+    click.echo(f"  合計: {stats['bytes']} B / 約 {stats['tokens']} トークン（予算 {stats['budget']}）")
+    if stats["deduped"]:
+        click.echo(f"  重複で省いた段落: {stats['deduped']}件")
+    click.secho(f"  作成: {elapsed:.1f} ms（SessionStart はキャッシュを読むだけ）", fg="cyan")
+    if stats["tokens"] > stats["budget"]:
+        click.secho("  ✗ 予算超過（常に含めるセクションだけで予算を超えています）", fg="red")
+        sys.exit(1)
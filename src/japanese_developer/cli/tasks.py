@@ -0,0 +1,191 @@
+"""GitHub Issues のローカルミラー（tasks）"""
+
+import json
+import os
+import time
+
+import click
+
+
+@click.group()
+@click.option("--repo", help="owner/repo（省略時は origin から判定）")
+@click.pass_context
+def tasks(ctx, repo):
+    """GitHub Issues のローカルミラーでタスクを管理する（/task 用）"""
+    from japanese_developer import tasks as mirror
+
+    repo = repo or mirror.detect_repo(os.getcwd())
+    if not repo:
+        raise click.ClickException("GitHubのリポジトリが判定できません（--repo owner/repo で指定してください）")
+    ctx.obj = (mirror, mirror.connect(), repo)
+
+
+def _print_issues(issues: list, as_json: bool, synced_at: float):
+    if as_json:
+        click.echo(json.dumps(issues, indent=2, ensure_ascii=False))
+        return
+    if not issues:
+        click.echo("  タスクはありません")
+    for issue in issues:
+        number = "未送信" if issue["pending"] else f"#{issue['number']}"
+        labels = f" [{', '.join(issue['labels'])}]" if issue["labels"] else ""
+        assignees = f" @{', @'.join(issue['assignees'])}" if issue["assignees"] else ""
+        mark = "" if issue["state"] == "open" else "（完了）"
+        click.echo(f"  {number:>6} {issue['title']}{mark}{labels}{assignees}")
+    if synced_at:
+        minutes = int((time.time() - synced_at) // 60)
+        click.echo(f"\n  最終同期: {minutes}分前（tasks sync で更新）")
+    else:
+        click.echo("\n  未同期です（tasks sync を実行してください）")
+
+
+def _send_queue(mirror, db, repo):
+    """キューの送信を試みる。オフラインならキューに残す。"""
+    from japanese_developer.github import Client, OfflineError
+
+    try:
+        sent, failed = mirror.replay(db, repo, Client())
+    except OfflineError:
+        click.secho("  オフラインのためキューに保存しました（次回の tasks sync で送信します）", fg="yellow")
+        return
+    if failed:
+        click.secho("  ✗ 送信に失敗した操作があります（tasks queue で確認）", fg="red")
+    elif sent:
+        click.secho("  ✓ GitHubへ送信しました", fg="green")
+
+
+@tasks.command(name="sync")
+@click.pass_obj
+def tasks_sync(obj):
+    """未送信の操作を送信し、更新されたIssueとラベルを取り込む"""
+    from japanese_developer.github import ApiError, Client, OfflineError
+
+    mirror, db, repo = obj
+    try:
+        result = mirror.sync(db, repo, Client())
+    except OfflineError as e:
+        raise click.ClickException(f"GitHubに接続できません: {e}（一覧はローカルのミラーから表示できます）")
+    except ApiError as e:
+        raise click.ClickException(str(e))
+    if result["sent"]:
+        click.echo(f"  ✓ キューを送信: {result['sent']}件")
+    if result["failed"]:
+        click.secho(f"  ✗ 送信失敗: {result['failed']}件（tasks queue で確認）", fg="red")
+    click.echo(f"  ✓ 更新されたIssue: {result['updated']}件")
+    click.echo(f"  ✓ ラベル: {'更新あり' if result['labels_changed'] else '変更なし'}")
+    click.secho(f"✅ {repo} を同期しました", fg="green")
+
+
+@tasks.command(name="list")
+@click.option("--all", "show_all", is_flag=True, help="完了したタスクも表示する")
+@click.option("--label", help="ラベルで絞り込む")
+@click.option("--json", "as_json", is_flag=True, help="JSONで出力する")
+@click.pass_obj
+def tasks_list(obj, show_all, label, as_json):
+    """タスク一覧（ローカルのミラーから表示）"""
+    mirror, db, repo = obj
+    issues = mirror.list_issues(db, repo, "all" if show_all else "open", label)
+    _print_issues(issues, as_json, mirror.last_synced(db, repo))
+
+
+@tasks.command(name="mine")
+@click.option("--json", "as_json", is_flag=True, help="JSONで出力する")
+@click.pass_obj
+def tasks_mine(obj, as_json):
+    """自分にアサインされたタスク"""
+    mirror, db, repo = obj
+    _print_issues(mirror.list_issues(db, repo, mine=True), as_json, mirror.last_synced(db, repo))
+
+
+@tasks.command(name="show")
+@click.argument("number", type=int)
+@click.pass_obj
+def tasks_show(obj, number):
+    """タスクの詳細"""
+    mirror, db, repo = obj
+    issue = mirror.get_issue(db, repo, number)
+    if issue is None:
+        raise click.ClickException(f"#{number} はミラーにありません（tasks sync を実行してください）")
+    click.secho(f"#{issue['number']} {issue['title']}", bold=True)
+    click.echo(f"  状態: {'未完了' if issue['state'] == 'open' else '完了'}")
+    click.echo(f"  ラベル: {', '.join(issue['labels']) or 'なし'}")
+    click.echo(f"  担当: {', '.join(issue['assignees']) or 'なし'}")
+    if issue["url"]:
+        click.echo(f"  URL: {issue['url']}")
+    if issue["body"]:
+        click.echo()
+        click.echo(issue["body"])
+
+
+@tasks.command(name="labels")
+@click.pass_obj
+def tasks_labels(obj):
+    """リポジトリのラベル一覧"""
+    mirror, db, repo = obj
+    labels = mirror.list_labels(db, repo)
+    if not labels:
+        click.echo("  ラベルがありません（tasks sync を実行してください）")
+    for label in labels:
+        description = f" — {label['description']}" if label["description"] else ""
+        click.echo(f"  {label['name']}{description}")
+
+
+@tasks.command(name="add")
+@click.option("--title", required=True, help="タイトル")
+@click.option("--body", default="", help="説明")
+@click.option("--label", "labels", multiple=True, help="ラベル（複数指定可）")
+@click.option("--no-assign", is_flag=True, help="自分をアサインしない")
+@click.pass_obj
+def tasks_add(obj, title, body, labels, no_assign):
+    """タスクを追加する（オフラインならキューに積む）"""
+    mirror, db, repo = obj
+    mirror.enqueue(db, repo, mirror.ADD, title=title, body=body, labels=list(labels), assign_self=not no_assign)
+    click.echo(f"  ✓ 追加: {title}")
+    _send_queue(mirror, db, repo)
+
+
+@tasks.command(name="close")
+@click.argument("number", type=int)
+@click.option("--comment", default="", help="完了コメント")
+@click.pass_obj
+def tasks_close(obj, number, comment):
+    """タスクを完了にする（オフラインならキューに積む）"""
+    mirror, db, repo = obj
+    mirror.enqueue(db, repo, mirror.CLOSE, number, comment=comment)
+    click.echo(f"  ✓ 完了: #{number}")
+    _send_queue(mirror, db, repo)
+
+
+@tasks.command(name="edit")
+@click.argument("number", type=int)
+@click.option("--add-label", multiple=True, help="付けるラベル")
+@click.option("--remove-label", multiple=True, help="外すラベル")
+@click.pass_obj
+def tasks_edit(obj, number, add_label, remove_label):
+    """タスクのラベルを変更する（オフラインならキューに積む）"""
+    mirror, db, repo = obj
+    if not add_label and not remove_label:
+        raise click.UsageError("--add-label か --remove-label を指定してください")
+    mirror.enqueue(db, repo, mirror.EDIT, number, add_labels=list(add_label), remove_labels=list(remove_label))
+    click.echo(f"  ✓ ラベル変更: #{number}")
+    _send_queue(mirror, db, repo)
+
+
+@tasks.command(name="queue")
+@click.option("--discard", type=int, help="指定したidの操作を取り消す")
+@click.pass_obj
+def tasks_queue(obj, discard):
+    """未送信の操作を表示する"""
+    mirror, db, repo = obj
+    if discard is not None:
+        if not mirror.discard(db, discard):
+            raise click.ClickException(f"id {discard} の操作はキューにありません")
+        click.echo(f"  ✓ id {discard} を取り消しました")
+        return
+    jobs = mirror.pending(db, repo)
+    if not jobs:
+        click.echo("  未送信の操作はありません")
+    for job in jobs:
+        target = job["payload"].get("title", "") if job["action"] == mirror.ADD else f"#{job['number']}"
+        error = f"（失敗{job['attempts']}回: {job['last_error']}）" if job["attempts"] else ""
+        click.echo(f"  id {job['id']}: {job['action']} {target}{error}")
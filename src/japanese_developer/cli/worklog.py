@@ -0,0 +1,105 @@
+"""作業ログとPR同期（worklog・log / pr-sync）"""
+
+import json
+import os
+import time
+
+import click
+
+
+@click.group()
+def worklog():
+    """作業ログ（logs/）を管理する"""
+    pass
+
+
+@worklog.command()
+@click.option("--project-dir", default=".", type=click.Path(exists=True, file_okay=False), help="プロジェクトのルート")
+def rebuild(project_dir):
+    """git履歴から未記録のコミットを作業ログに取り込む（前回の続きから再開）"""
+    from japanese_developer import worklog as journal
+
+    start = time.perf_counter()
+    result = journal.rebuild(os.path.abspath(project_dir))
+    elapsed = time.perf_counter() - start
+
+    for message in result["messages"]:
+        click.echo(f"  {message}")
+    click.secho("✅ 作業ログを更新しました", fg="green", bold=True)
+    click.echo(f"  走査: {result['scanned']}件 / 追加: {result['added']}件（{elapsed:.2f} 秒）")
+
+
+@worklog.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option("--branch", help="ブランチで絞り込む")
+@click.option("--author", help="作者で絞り込む")
+@click.option("--since", help="この日付以降（例: 2024-04-01）")
+@click.option("--limit", "-n", default=20, show_default=True, help="表示する件数")
+@click.option("--project-dir", default=".", type=click.Path(exists=True, file_okay=False), help="プロジェクトのルート")
+@click.option("--json", "as_json", is_flag=True, help="JSONで出力する")
+def search(query, branch, author, since, limit, project_dir, as_json):
+    """作業ログを全文検索する（件名・変更ファイル・ブランチ・作者、新しい順）"""
+    from japanese_developer import logsearch
+
+    project_dir = os.path.abspath(project_dir)
+    start = time.perf_counter()
+    db = logsearch.connect(project_dir)
+    added = logsearch.update(db, project_dir)
+    indexed = time.perf_counter()
+    hits = logsearch.search(db, " ".join(query), branch, author, since, limit)
+    elapsed = time.perf_counter() - indexed
+
+    if as_json:
+        click.echo(json.dumps(hits, indent=2, ensure_ascii=False))
+        return
+    if added:
+        click.echo(f"  索引に追加: {added}件（{(indexed - start) * 1000:.0f} ms）")
+    if not hits:
+        click.echo(f"  見つかりませんでした（索引 {logsearch.count(db)}件）")
+        return
+    for hit in hits:
+        click.secho(f"  {hit['time']} [{hit['branch']}] @{hit['author']}", fg="cyan")
+        click.echo(f"    {hit['subject']}（{hit['hash']}）")
+        if hit["files"]:
+            click.echo(f"    {hit['files']}")
+    click.echo(f"\n  {len(hits)}件（{elapsed * 1000:.1f} ms）")
+
+
+@click.group(name="pr-sync")
+def pr_sync():
+    """PRへの作業ログ同期のアウトボックスを管理する"""
+    pass
+
+
+@pr_sync.command(name="status")
+def pr_sync_status():
+    """未送信の同期ジョブを表示する"""
+    from japanese_developer import prsync
+
+    jobs = [job for _, job in prsync.pending_jobs() if job]
+    if not jobs:
+        click.echo("  ✓ 未送信のジョブはありません")
+        return
+    for job in jobs:
+        line = f"  [{job['branch']}] {job['project_dir']}（push {job['pushes']}件"
+        if job["attempts"]:
+            wait = max(0, int(job["next_attempt"] - time.time()))
+            line += f"・失敗 {job['attempts']}回・{wait}秒後に再試行"
+        click.echo(line + "）")
+        if job["last_error"]:
+            click.echo(f"    ✗ {job['last_error']}")
+
+
+@pr_sync.command(name="flush")
+def pr_sync_flush():
+    """未送信のジョブを今すぐ送信する（再試行待ちのジョブも含む）"""
+    from japanese_developer import prsync
+
+    prsync.reset_retries()
+    results = prsync.flush(wait=False)
+    if not results and prsync.pending_jobs():
+        click.echo("別のフラッシャーが実行中です")
+        return
+    for branch, result in results:
+        click.echo(f"  [{branch}] {result}")
+    click.secho("✅ PRログ同期を実行しました", fg="green")
@@ -0,0 +1,245 @@
+"""SessionStart で注入するコンテキストのコンパイル（`japanese-developer context build`）
+
+言語ルール・プライマー（primer.md + git情報）・プロジェクトに合うルール断片を
+1つのテキストにまとめ、注入するhook出力ごと ~/.gemini/cache/context/ に保存する。
+SessionStart はキャッシュを1回読んで、そのまま出力するだけで済む。
+
+- ルール断片は ~/.gemini/context/（無ければパッケージの templates/context/）にあり、
+  rules.json の conditions に挙げたファイルがプロジェクトにある時だけ含める
+  （例: package.json・vite.config.* があれば Vite・PWA・バージョン表示のルール）
+- GEMINI.md は Gemini CLI が自分で読み込むため注入しない。GEMINI.md と同じ段落、
+  断片どうしで重複する段落は取り除く
+- トークン数の見積もりが予算（DEFAULT_BUDGET_TOKENS）を超える場合は、
+  rules.json で後ろにある条件付きの断片から外す
+
+キャッシュはプライマーのキー・GEMINI.md と断片の mtime・条件ファイルの有無・予算が
+変わった時だけ作り直す。
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from japanese_developer import primer, template_path
+
+GEMINI_DIR = Path.home() / ".gemini"
+GEMINI_MD = GEMINI_DIR / "GEMINI.md"
+CONTEXT_DIR = GEMINI_DIR / "context"
+TEMPLATE_CONTEXT_DIR = Path(template_path("context"))
+CACHE_DIR = GEMINI_DIR / "cache" / "context"
+
+CACHE_VERSION = 1
+
+# 注入するコンテキストのトークン数の予算（環境変数 JD_CONTEXT_BUDGET で変更できる）
+DEFAULT_BUDGET_TOKENS = 3000
+
+# かな・カタカナ・漢字・全角記号（1文字 ≒ 1トークンとして数える）
+_CJK = re.compile(r"[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]")
+
+
+def budget_tokens() -> int:
+    try:
+        return int(os.environ.get("JD_CONTEXT_BUDGET", DEFAULT_BUDGET_TOKENS))
+    except ValueError:
+        return DEFAULT_BUDGET_TOKENS
+
+
+def estimate_tokens(text: str) -> int:
+    """トークン数の見積もり: 日本語は1文字1トークン、それ以外は4文字1トークン。"""
+    cjk = len(_CJK.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def context_dir() -> Path:
+    """ルール断片のディレクトリ。setup 前はパッケージ同梱のものを使う。"""
+    return CONTEXT_DIR if (CONTEXT_DIR / "rules.json").is_file() else TEMPLATE_CONTEXT_DIR
+
+
+def load_rules(directory: Path) -> dict:
+    try:
+        with open(directory / "rules.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"conditions": {}, "fragments": []}
+
+
+def matched_conditions(conditions: dict, project_dir: str) -> dict:
+    """条件名 → 一致したファイル名（一致しなければ空文字）"""
+    result = {}
+    for name, files in conditions.items():
+        result[name] = next((f for f in files if os.path.exists(os.path.join(project_dir, f))), "")
+    return result
+
+
+def _dir_stamp(directory: Path) -> list:
+    stamp = [primer._mtime(directory)]
+    try:
+        with os.scandir(directory) as it:
+            stamp.extend(sorted((e.name, e.stat().st_mtime_ns) for e in it))
+    except OSError:
+        pass
+    return stamp
+
+
+def cache_key(project_dir: str, budget: int) -> list:
+    directory = context_dir()
+    conditions = matched_conditions(load_rules(directory).get("conditions", {}), project_dir)
+    key = [
+        CACHE_VERSION, budget, str(directory), _dir_stamp(directory), primer._mtime(GEMINI_MD),
+        sorted(conditions.items()), primer.cache_key(primer.find_git_dir(project_dir)),
+    ]
+    return json.loads(json.dumps(key))
+
+
+def _paragraphs(text: str) -> list:
+    return [p.strip("\n") for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+
+def _normalize(paragraph: str) -> str:
+    return " ".join(paragraph.split())
+
+
+def _is_heading(paragraph: str) -> bool:
+    return "\n" not in paragraph and paragraph.startswith("#")
+
+
+def _dedupe(text: str, seen: set):
+    """既出の段落を取り除いた (テキスト, 取り除いた段落数) を返す。見出しだけの段落は残す。"""
+    kept, removed = [], 0
+    for paragraph in _paragraphs(text):
+        norm = _normalize(paragraph)
+        if not _is_heading(paragraph):
+            if norm in seen:
+                removed += 1
+                continue
+            seen.add(norm)
+        kept.append(paragraph)
+    if all(_is_heading(p) for p in kept):
+        # 見出ししか残らなければ断片ごと不要
+        kept = []
+    return "\n\n".join(kept), removed
+
+
+def _sections(project_dir: str, directory: Path):
+    """(名前, 条件, テキスト) を優先度順に返す。条件なしの断片 → プライマー → 条件付きの断片。"""
+    rules = load_rules(directory)
+    conditions = matched_conditions(rules.get("conditions", {}), project_dir)
+    fragments = rules.get("fragments", [])
+    result = primer.build(project_dir)
+
+    sections = []
+    for required in (True, False):
+        for fragment in fragments:
+            if (fragment.get("when") is None) != required:
+                continue
+            try:
+                text = (directory / fragment["file"]).read_text(encoding="utf-8")
+            except OSError:
+                text = ""
+            sections.append((fragment["file"], fragment.get("when"), text))
+        if required:
+            sections.append(("primer.md", None, result["context"]))
+    return sections, conditions, result["git"]
+
+
+def compile_context(project_dir: str, budget: int = None) -> dict:
+    """コンテキストを組み立てる。
+
+    {"text", "bytes", "tokens", "budget", "deduped", "sections": [...], "git"} を返す。
+    sections の各要素は {"name", "bytes", "tokens", "included", "reason"}。
+    """
+    project_dir = os.path.abspath(project_dir)
+    budget = budget_tokens() if budget is None else budget
+    sections, conditions, git = _sections(project_dir, context_dir())
+
+    try:
+        seen = {_normalize(p) for p in _paragraphs(GEMINI_MD.read_text(encoding="utf-8"))}
+    except OSError:
+        seen = set()
+
+    report = []
+    deduped = 0
+    for name, when, text in sections:
+        entry = {"name": name, "when": when, "text": "", "bytes": 0, "tokens": 0, "included": False, "reason": ""}
+        report.append(entry)
+        if when is not None and not conditions.get(when):
+            entry["reason"] = f"条件 {when} に一致しない"
+            continue
+        text, removed = _dedupe(text, seen)
+        deduped += removed
+        if not text:
+            entry["reason"] = "GEMINI.md・他の断片と重複" if removed else "空"
+            continue
+        entry.update(text=text, bytes=len(text.encode()), tokens=estimate_tokens(text), included=True,
+                     reason=f"{when}: {conditions[when]}" if when else "常に含める")
+
+    # 予算を超えたら、条件付きの断片を優先度の低い順に外す
+    total = sum(e["tokens"] for e in report if e["included"])
+    for entry in reversed(report):
+        if total <= budget:
+            break
+        if entry["included"] and entry["when"] is not None:
+            entry["included"] = False
+            entry["reason"] = "予算超過のため除外"
+            total -= entry["tokens"]
+
+    text = "\n\n".join(e["text"] for e in report if e["included"])
+    for entry in report:
+        del entry["text"]
+    return {
+        "text": text,
+        "bytes": len(text.encode()),
+        "tokens": estimate_tokens(text),
+        "budget": budget,
+        "deduped": deduped,
+        "sections": report,
+        "git": git,
+    }
+
+
+def _cache_path(project_dir: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(project_dir.encode()).hexdigest()[:16]}.json"
+
+
+def build(project_dir: str, budget: int = None) -> dict:
+    """コンテキストを組み立ててキャッシュに保存する。
+
+    {"output": hookの出力, "menu": ターミナル表示, "stats": compile_context の結果（text以外）} を返す。
+    """
+    project_dir = os.path.abspath(project_dir)
+    budget = budget_tokens() if budget is None else budget
+    key = cache_key(project_dir, budget)
+    compiled = compile_context(project_dir, budget)
+    text = compiled.pop("text")
+    git = compiled.pop("git")
+    has_primer = any(e["name"] == "primer.md" and e["included"] for e in compiled["sections"])
+    cached = {
+        "key": key,
+        "output": {"hookSpecificOutput": {"additionalContext": text}},
+        "menu": primer.menu_lines(git) if has_primer else [],
+        "stats": compiled,
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _cache_path(project_dir)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cached, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return cached
+
+
+def load(project_dir: str, budget: int = None):
+    """キャッシュが最新ならその内容を、古い・無ければ None を返す。"""
+    project_dir = os.path.abspath(project_dir)
+    budget = budget_tokens() if budget is None else budget
+    try:
+        with open(_cache_path(project_dir), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if cached.get("key") == cache_key(project_dir, budget) else None
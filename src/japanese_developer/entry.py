@@ -0,0 +1,82 @@
+"""japanese-developer コマンドのエントリポイント
+
+hookはツール呼び出しのたびに起動されるため、`hook` サブコマンドだけは
+clickを経由せずに処理する。hookd（常駐hookサーバー）が起動していれば
+stdinのJSONをソケット経由で転送し、起動していなければプロセス内で実行する。
+"""
+
+import os
+import sys
+
+HOOKD_SOCKET = os.path.join(os.path.expanduser("~"), ".gemini", "hookd.sock")
+
+# hookdの応答待ちの上限（秒）。hooks.jsonの最大timeoutより短くしておく。
+HOOKD_TIMEOUT = 14
+
+
+def _forward_to_hookd(name: str, raw_input: str):
+    """hookdへhookを転送して (stdout, stderr, code) を返す。未起動ならNone。"""
+    import json
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(HOOKD_SOCKET)
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        try:
+            sock.settimeout(HOOKD_TIMEOUT)
+            request = {
+                "hook": name,
+                "input": raw_input,
+                "project_dir": os.environ.get("GEMINI_PROJECT_DIR") or os.getcwd(),
+            }
+            sock.sendall(json.dumps(request, ensure_ascii=False).encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+            reply = json.loads(b"".join(chunks))
+        except (OSError, ValueError) as e:
+            # 送信後の失敗でプロセス内実行にフォールバックすると二重実行になるため、エラーとして返す
+            return "", f"hookd応答エラー: {e}\n", 1
+    return reply["stdout"], reply["stderr"], reply["code"]
+
+
+def _hook(argv: list) -> int:
+    if len(argv) == 1 and not os.environ.get("JD_NO_HOOKD"):
+        raw_input = sys.stdin.read()
+        result = _forward_to_hookd(argv[0], raw_input)
+        if result is None:
+            from japanese_developer import hooks
+            try:
+                result = hooks.run_hook(argv[0], raw_input)
+            finally:
+                hooks.shutdown()
+        stdout, stderr, code = result
+        sys.stdout.write(stdout)
+        sys.stderr.write(stderr)
+        return code
+
+    from japanese_developer import hooks
+    return hooks.main(argv)
+
+
+def main():
+    argv = sys.argv[1:]
+    if argv[:1] == ["hook"]:
+        sys.exit(_hook(argv[1:]))
+
+    from japanese_developer.cli import main as cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
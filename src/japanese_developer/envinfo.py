@@ -0,0 +1,173 @@
+"""`japanese-developer error` の環境情報収集
+
+ツールのバージョン確認・git情報の取得をスレッドプールで並列に実行し、
+全体で DEADLINE 秒を過ぎたものは打ち切る。
+
+ツールのバージョンは ~/.gemini/cache/tool-versions.json に保存し、
+実行ファイルのパス（シンボリックリンク解決後）と mtime が変わらない限り再利用する。
+Termux では npm --version だけで1秒以上かかるため、2回目以降は起動しない。
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+CACHE_PATH = Path.home() / ".gemini" / "cache" / "tool-versions.json"
+
+# 全プローブの締め切り（秒）
+DEADLINE = 5
+
+# 表示名 → 候補コマンド（先に見つかったものを使う）
+TOOLS = {
+    "Python": ["python3", "python"],
+    "Node.js": ["node"],
+    "npm": ["npm"],
+    "git": ["git"],
+}
+
+# git情報: 表示名 → 引数
+GIT_PROBES = {
+    "git status": ["status", "--short"],
+    "直近コミット": ["log", "--oneline", "-3"],
+    "ブランチ": ["branch", "--show-current"],
+}
+
+
+def _run(argv: list, cwd: str = None, timeout: float = DEADLINE) -> str:
+    """コマンドを実行して標準出力を返す。失敗時は空文字。"""
+    try:
+        result = subprocess.run(argv, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    if result.returncode != 0:
+        return ""
+    # python2 等は --version を stderr に出す
+    return (result.stdout or result.stderr).strip()
+
+
+def _resolve(candidates: list):
+    """(実体のパス, mtime) を返す。見つからなければ None。"""
+    for name in candidates:
+        path = shutil.which(name)
+        if path:
+            real = os.path.realpath(path)
+            try:
+                return real, os.stat(real).st_mtime_ns
+            except OSError:
+                continue
+    return None
+
+
+def load_cache() -> dict:
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_PATH.with_name(f"{CACHE_PATH.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        pass
+
+
+def collect(cwd: str = None, use_cache: bool = True) -> dict:
+    """環境情報を収集する。キーは表示名、値は文字列（表示順）。"""
+    cwd = cwd or os.getcwd()
+    cache = load_cache() if use_cache else {}
+    cache_dirty = False
+
+    info = {
+        "日時": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "OS": " ".join(os.uname()),
+    }
+
+    # ツール → (パス, mtime) を先に解決し、キャッシュに無いものだけ起動する
+    resolved = {label: _resolve(candidates) for label, candidates in TOOLS.items()}
+    versions = {}
+    for label, target in resolved.items():
+        if target is None:
+            versions[label] = "未インストール"
+            continue
+        entry = cache.get(target[0])
+        if entry and entry.get("mtime") == target[1]:
+            versions[label] = entry["version"]
+
+    executor = ThreadPoolExecutor(max_workers=len(TOOLS) + len(GIT_PROBES))
+    try:
+        futures = {}
+        for label, target in resolved.items():
+            if label not in versions:
+                futures[executor.submit(_run, [target[0], "--version"])] = ("tool", label)
+        for label, args in GIT_PROBES.items():
+            futures[executor.submit(_run, ["git", *args], cwd)] = ("git", label)
+
+        done, not_done = wait(futures, timeout=DEADLINE)
+        git_results = {}
+        for future, (kind, label) in futures.items():
+            value = future.result() if future in done else ""
+            if kind == "tool":
+                if future in not_done:
+                    versions[label] = "取得タイムアウト"
+                elif value:
+                    versions[label] = value
+                    path, mtime = resolved[label]
+                    cache[path] = {"mtime": mtime, "version": value}
+                    cache_dirty = True
+                else:
+                    versions[label] = "取得失敗"
+            else:
+                git_results[label] = value
+    finally:
+        # 締め切りを過ぎたプローブは待たない（各プロセスも DEADLINE で打ち切られる）
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for label in TOOLS:
+        info[label] = versions[label]
+    info["カレントディレクトリ"] = cwd
+    for label in GIT_PROBES:
+        if git_results.get(label):
+            info[label] = git_results[label]
+
+    info.update(_project_files(Path(cwd)))
+
+    if cache_dirty:
+        save_cache(cache)
+    return info
+
+
+def _project_files(cwd: Path) -> dict:
+    """package.json の依存関係・requirements.txt の内容"""
+    info = {}
+    pkg_path = cwd / "package.json"
+    if pkg_path.exists():
+        try:
+            with open(pkg_path) as f:
+                pkg = json.load(f)
+            deps = pkg.get("dependencies", {})
+            dev_deps = pkg.get("devDependencies", {})
+            if deps or dev_deps:
+                dep_lines = [f"  {k}: {v}" for k, v in {**deps, **dev_deps}.items()]
+                info["package.json 依存関係"] = "\n".join(dep_lines)
+        except Exception:
+            pass
+
+    req_path = cwd / "requirements.txt"
+    if req_path.exists():
+        try:
+            content = req_path.read_text().strip()
+            if content:
+                info["requirements.txt"] = content
+        except Exception:
+            pass
+    return info
@@ -0,0 +1,236 @@
+"""フォントのダウンロードとキャッシュ（font-select.sh・`japanese-developer font`）
+
+~/.gemini/cache/fonts/ にフォントを内容（SHA-256）で保存し、一度取得したフォントへの
+切り替えはダウンロードなしで済ませる。
+
+- リリース情報は ETag 付きで問い合わせ、304 なら保存済みのアセットURLを使う
+  （オフラインでもキャッシュ済みのフォントは使える）
+- zip は partial/ に書き出し、途中で切れたら次回 Range + If-Range で続きから取得する
+- zip は中央ディレクトリから目的の TTF だけを展開し、展開後に削除する
+
+GitHub API のベースURLは環境変数 JD_GITHUB_API で差し替えられる（github.Client）。
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import urllib.error
+import urllib.request
+import zipfile
+from pathlib import Path
+
+from japanese_developer.github import Client, OfflineError
+
+CACHE_DIR = Path.home() / ".gemini" / "cache" / "fonts"
+OBJECTS_DIR = CACHE_DIR / "objects"
+PARTIAL_DIR = CACHE_DIR / "partial"
+INDEX_PATH = CACHE_DIR / "index.json"
+
+TERMUX_FONT = Path.home() / ".termux" / "font.ttf"
+
+# (表示名, 説明, GitHubリポジトリ, zipの名前の先頭, TTFファイル名)
+FONTS = (
+    ("UDEV Gothic", "モリサワ BIZ UDゴシック + JetBrains Mono", "yuru7/udev-gothic", "UDEVGothic_v",
+     "UDEVGothic-Regular.ttf"),
+    ("HackGen", "Hack + 源柔ゴシック（プログラマー定番）", "yuru7/HackGen", "HackGen_v",
+     "HackGenConsole-Regular.ttf"),
+    ("PlemolJP", "IBM Plex Mono + IBM Plex Sans JP", "yuru7/PlemolJP", "PlemolJP_v",
+     "PlemolJPConsole-Regular.ttf"),
+)
+
+CHUNK = 1 << 16
+TIMEOUT = 30
+
+# 1回のダウンロードで接続が切れたときに続きから再試行する回数
+RESUME_ATTEMPTS = 3
+
+
+class FontError(Exception):
+    """フォントを取得できない"""
+
+
+def load_index() -> dict:
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(index: dict):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_PATH.with_name(f"{INDEX_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, INDEX_PATH)
+
+
+def object_path(sha256: str) -> Path:
+    return OBJECTS_DIR / f"{sha256}.ttf"
+
+
+def latest_asset(repo: str, zip_prefix: str, cached: dict, client: Client = None) -> dict:
+    """最新リリースの zip アセット {"url", "name", "etag"} を返す。
+
+    前回の ETag で問い合わせ、304 なら cached の情報をそのまま返す。
+    304 でもアセットURLが保存されていなければ、ETag なしで取り直す。
+    """
+    client = client or Client(token=os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or "")
+    path = f"/repos/{repo}/releases/latest"
+    status, release, headers = client.request("GET", path, etag=cached.get("release_etag", ""))
+    if status == 304:
+        if cached.get("asset_url"):
+            return {"url": cached["asset_url"], "name": cached.get("asset_name", ""), "etag": cached["release_etag"]}
+        status, release, headers = client.request("GET", path)
+    for asset in (release or {}).get("assets", []):
+        if asset["name"].startswith(zip_prefix):
+            return {"url": asset["browser_download_url"], "name": asset["name"], "etag": headers.get("ETag", "")}
+    raise FontError(f"{repo} の最新リリースに {zip_prefix}* のzipがありません")
+
+
+def _partial_paths(url: str):
+    key = hashlib.sha1(url.encode()).hexdigest()[:16]
+    return PARTIAL_DIR / f"{key}.zip.part", PARTIAL_DIR / f"{key}.json"
+
+
+def download(url: str, progress=None) -> Path:
+    """zip を partial/ に取得してパスを返す。途中まで取得済みなら続きから取得する。
+
+    progress(取得済みバイト数, 全体のバイト数 or None) を随時呼ぶ。
+    """
+    PARTIAL_DIR.mkdir(parents=True, exist_ok=True)
+    part, meta_path = _partial_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        meta = {}
+
+    for attempt in range(RESUME_ATTEMPTS + 1):
+        offset = part.stat().st_size if part.exists() else 0
+        if offset and meta.get("total") == offset:
+            return part
+        headers = {"User-Agent": "japanese-developer"}
+        if offset and meta.get("etag"):
+            # サーバー側のファイルが変わっていれば 200 で全体が返る
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = meta["etag"]
+        else:
+            offset = 0
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=TIMEOUT) as resp:
+                if resp.status == 206:
+                    total = offset + int(resp.headers.get("Content-Length", 0)) or None
+                    mode = "ab"
+                else:
+                    offset = 0
+                    total = int(resp.headers.get("Content-Length", 0)) or None
+                    mode = "wb"
+                meta = {"etag": resp.headers.get("ETag", ""), "total": total}
+                meta_path.write_text(json.dumps(meta))
+                with open(part, mode) as f:
+                    done = offset
+                    while True:
+                        chunk = resp.read(CHUNK)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        done += len(chunk)
+                        if progress:
+                            progress(done, total)
+            if total is None or part.stat().st_size == total:
+                meta["total"] = part.stat().st_size
+                meta_path.write_text(json.dumps(meta))
+                return part
+        except urllib.error.HTTPError as e:
+            if e.code == 416:
+                # 取得済みの範囲が不正。最初から取り直す
+                part.unlink(missing_ok=True)
+                meta = {}
+                continue
+            raise FontError(f"ダウンロードに失敗しました: HTTP {e.code}")
+        except (urllib.error.URLError, OSError) as e:
+            if attempt == RESUME_ATTEMPTS:
+                raise OfflineError(str(getattr(e, "reason", e)))
+    raise FontError("ダウンロードが完了しませんでした（再実行すると続きから取得します）")
+
+
+def extract(zip_path: Path, ttf_name: str) -> str:
+    """zip から ttf_name だけを取り出してキャッシュに保存し、SHA-256 を返す。"""
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            # 中央ディレクトリの一覧から探す（他のメンバーは読まない）
+            member = next((i for i in zf.infolist() if os.path.basename(i.filename) == ttf_name), None)
+            if member is None:
+                raise FontError(f"zipに {ttf_name} がありません")
+            OBJECTS_DIR.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.sha256()
+            with zf.open(member) as src, tempfile.NamedTemporaryFile(dir=OBJECTS_DIR, delete=False) as tmp:
+                for chunk in iter(lambda: src.read(CHUNK), b""):
+                    digest.update(chunk)
+                    tmp.write(chunk)
+    except zipfile.BadZipFile:
+        zip_path.unlink(missing_ok=True)
+        raise FontError("zipが壊れています（再実行すると取得し直します）")
+    sha256 = digest.hexdigest()
+    os.chmod(tmp.name, 0o644)
+    os.replace(tmp.name, object_path(sha256))
+    return sha256
+
+
+def fetch(repo: str, zip_prefix: str, ttf_name: str, progress=None, client: Client = None) -> dict:
+    """フォントをキャッシュに用意し、{"path", "sha256", "downloaded", "offline"} を返す。"""
+    index = load_index()
+    cached = index.get(repo, {})
+    cached_sha = cached.get("fonts", {}).get(ttf_name, "")
+    has_cached = bool(cached_sha) and object_path(cached_sha).exists()
+
+    try:
+        asset = latest_asset(repo, zip_prefix, cached, client)
+        if has_cached and asset["url"] == cached.get("asset_url"):
+            sha256, downloaded = cached_sha, False
+        else:
+            zip_path = download(asset["url"], progress)
+            sha256, downloaded = extract(zip_path, ttf_name), True
+    except OfflineError:
+        # 接続できなければキャッシュ済みのもの（古い版でも）を使う
+        if has_cached:
+            return {"path": object_path(cached_sha), "sha256": cached_sha, "downloaded": False, "offline": True}
+        raise
+
+    if downloaded:
+        for path in _partial_paths(asset["url"]):
+            path.unlink(missing_ok=True)
+
+    fonts = cached.get("fonts", {}) if asset["url"] == cached.get("asset_url") else {}
+    fonts[ttf_name] = sha256
+    index[repo] = {
+        "release_etag": asset["etag"], "asset_url": asset["url"], "asset_name": asset["name"], "fonts": fonts,
+    }
+    save_index(index)
+    return {"path": object_path(sha256), "sha256": sha256, "downloaded": downloaded, "offline": False}
+
+
+def install(path: Path, dest: Path = None):
+    """キャッシュのフォントを ~/.termux/font.ttf に配置する。"""
+    dest = dest or TERMUX_FONT
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    shutil.copyfile(path, tmp)
+    os.replace(tmp, dest)
+
+
+def prune() -> int:
+    """索引から参照されていないフォントと途中のダウンロードを削除し、解放したバイト数を返す。"""
+    used = {sha for entry in load_index().values() for sha in entry.get("fonts", {}).values()}
+    freed = 0
+    for directory in (OBJECTS_DIR, PARTIAL_DIR):
+        if not directory.is_dir():
+            continue
+        for path in directory.iterdir():
+            if directory == OBJECTS_DIR and path.stem in used:
+                continue
+            freed += path.stat().st_size
+            path.unlink()
+    return freed
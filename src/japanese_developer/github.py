@@ -0,0 +1,82 @@
+"""GitHub REST API の最小クライアント（tasks・fonts で共通）
+
+ベースURLは環境変数 JD_GITHUB_API で差し替えられる（テスト用の偽APIなど）。
+トークンは GH_TOKEN・GITHUB_TOKEN、無ければ `gh auth token` から取る。
+"""
+
+import json
+import os
+import re
+import subprocess
+import urllib.error
+import urllib.request
+
+DEFAULT_API = "https://api.github.com"
+TIMEOUT = 10
+
+
+class OfflineError(Exception):
+    """GitHub API に接続できない"""
+
+
+class ApiError(Exception):
+    """GitHub API がエラーを返した"""
+
+
+def _token() -> str:
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    from japanese_developer.prsync import gh_command
+
+    try:
+        result = subprocess.run([gh_command(), "auth", "token"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+class Client:
+    """GitHub REST API の最小クライアント（urllib）"""
+
+    def __init__(self, base: str = None, token: str = None):
+        self.base = (base or os.environ.get("JD_GITHUB_API") or DEFAULT_API).rstrip("/")
+        self.token = _token() if token is None else token
+
+    def request(self, method: str, path: str, body: dict = None, etag: str = ""):
+        """(ステータス, JSON, ヘッダー) を返す。304 の場合 JSON は None。"""
+        url = path if path.startswith("http") else f"{self.base}{path}"
+        headers = {"Accept": "application/vnd.github+json", "User-Agent": "japanese-developer"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if etag:
+            headers["If-None-Match"] = etag
+        data = None
+        if body is not None:
+            data = json.dumps(body, ensure_ascii=False).encode()
+            headers["Content-Type"] = "application/json"
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+                raw = resp.read()
+                return resp.status, json.loads(raw) if raw else None, resp.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, None, e.headers
+            raise ApiError(f"{method} {path}: HTTP {e.code} {e.read()[:200].decode('utf-8', 'replace')}")
+        except (urllib.error.URLError, OSError) as e:
+            raise OfflineError(str(getattr(e, "reason", e)))
+
+    def pages(self, path: str, etag: str = ""):
+        """Link ヘッダーをたどって全ページを返す。(アイテム, 先頭ページのETag)。未変更なら (None, etag)。"""
+        status, data, headers = self.request("GET", path, etag=etag)
+        if status == 304:
+            return None, etag
+        first_etag = headers.get("ETag", "")
+        items = list(data or [])
+        while True:
+            match = re.search(r'<([^>]+)>;\s*rel="next"', headers.get("Link", ""))
+            if not match:
+                return items, first_etag
+            _, data, headers = self.request("GET", match.group(1))
+            items.extend(data or [])
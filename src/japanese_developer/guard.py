@@ -0,0 +1,299 @@
+"""interactive-guard のルールエンジン
+
+templates/guard_rules.json（と ~/.gemini/guard_rules.json）の宣言的ルールを
+プログラム名ごとの索引と1本の結合正規表現にコンパイルする。コマンド文字列は
+shlexでトークン化して `&&` `||` `;` `|` `&` と改行でサブコマンドに分割し
+（ヒアドキュメントの本文はコマンドではないので読み飛ばす）、
+各サブコマンドはプログラム名で引いたバケットの結合正規表現で1回だけ評価する。
+そのため、別プログラム向けのルールをいくら追加しても評価コストは増えない。
+
+ルールの書式:
+  id          ルールID（ユーザールールで同じidを書くと上書き）
+  program     対象プログラム名のリスト（パスは除いたbasenameで比較）
+  args        プログラム名以降の引数（空白1つで連結）の先頭にマッチする正規表現
+  unless      これらのフラグがあれば許可
+  with        これらのフラグのどれかがある場合のみ拒否
+  max_args    位置引数の数がこれ以下なら拒否（option_args は値を1つ取るオプション）
+  kind        "server" なら常駐サーバー扱い（`&` でのバックグラウンド実行は許可）
+  tty         true なら標準入力が端末の時だけ拒否（`<` やヒアドキュメント、パイプで入力を渡せば許可）
+  reason      拒否理由。{command} はサブコマンドに置き換わる
+"""
+
+import json
+import os
+import re
+import shlex
+
+from japanese_developer import template_path
+
+RULES_PATH = template_path("guard_rules.json")
+USER_RULES_PATH = os.path.join(os.path.expanduser("~"), ".gemini", "guard_rules.json")
+CORPUS_PATH = template_path("guard_corpus.jsonl")
+
+SERVER_REASON = (
+    "BLOCKED: サーバー起動はこのターミナル内では実行できません。"
+    "ユーザーに「別のターミナルで {command} を実行してください」と伝えてください。"
+    "サーバーが起動済みかどうかは curl で確認できます。"
+)
+
+_SEPARATORS = {"&&", "||", ";", "|", "|&", "&", ";;", "(", ")", "\n"}
+_REDIRECTS = {">", ">>", "<", "<<", "<<<", ">&", "<&", "&>", "&>>", ">|"}
+# 標準入力をつなぎ替えるリダイレクトとパイプ（この後のコマンドは端末から読まない）
+_STDIN_REDIRECTS = {"<", "<<", "<<<", "<&"}
+_PIPES = {"|", "|&"}
+# サブコマンドの前に付くだけのラッパー → 値を1つ取るオプション
+# （ラッパーのオプションと `env FOO=1` の代入は読み飛ばして、その後のプログラム名を見る）
+_WRAPPERS = {
+    "sudo": {"-u", "-g", "-C", "-D", "-h", "-p", "-r", "-t", "-T", "-U",
+             "--user", "--group", "--close-from", "--chdir", "--host", "--prompt",
+             "--role", "--type", "--command-timeout", "--other-user"},
+    "env": {"-u", "-C", "-S", "--unset", "--chdir", "--split-string"},
+    "exec": {"-a"},
+    "time": {"-f", "-o", "--format", "--output"},
+    "nohup": set(),
+    "command": set(),
+    "builtin": set(),
+}
+_PUNCTUATION = "();<>|&"
+_ASSIGNMENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+
+
+class Rule:
+    __slots__ = ("id", "kind", "unless", "with_", "max_args", "option_args", "tty", "reason")
+
+    def __init__(self, spec: dict):
+        self.id = spec["id"]
+        self.kind = spec.get("kind", "interactive")
+        self.unless = tuple(spec.get("unless", ()))
+        self.with_ = tuple(spec.get("with", ()))
+        self.max_args = spec.get("max_args")
+        self.option_args = frozenset(spec.get("option_args", ()))
+        self.tty = bool(spec.get("tty"))
+        self.reason = spec.get("reason") or (SERVER_REASON if self.kind == "server" else "")
+
+    def applies(self, args: list, background: bool, stdin: bool = False) -> bool:
+        """argsのフラグ条件を確認する（argsパターンは結合正規表現で確認済み）。"""
+        if background and self.kind == "server":
+            return False
+        if stdin and self.tty:
+            return False
+        if self.unless and any(_has_flag(args, f) for f in self.unless):
+            return False
+        if self.with_ and not any(_has_flag(args, f) for f in self.with_):
+            return False
+        if self.max_args is not None and _positional_count(args, self.option_args) > self.max_args:
+            return False
+        return True
+
+
+def _has_flag(args: list, flag: str) -> bool:
+    for arg in args:
+        if arg == flag or arg.startswith(flag + "="):
+            return True
+        # -eSELECT のような短いオプションの連結
+        if len(flag) == 2 and flag[0] == "-" and not arg.startswith("--") and arg.startswith(flag):
+            return True
+    return False
+
+
+def _positional_count(args: list, option_args: frozenset) -> int:
+    count = 0
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg.startswith("-"):
+            skip = arg in option_args
+        else:
+            count += 1
+    return count
+
+
+class RuleSet:
+    """プログラム名 → (結合正規表現, ルール一覧) の索引"""
+
+    def __init__(self, specs: list):
+        self.rules = [Rule(spec) for spec in specs]
+        buckets = {}
+        for rule, spec in zip(self.rules, specs):
+            programs = spec.get("program") or []
+            if isinstance(programs, str):
+                programs = [programs]
+            for program in programs:
+                buckets.setdefault(program, []).append((rule, spec.get("args", "")))
+
+        # 各ルールの args を任意の先読みにして連結すると、1回の match で
+        # 当てはまる全ルールのグループが埋まる
+        self.index = {}
+        for program, entries in buckets.items():
+            parts = [f"(?=(?P<r{i}>{args}))?" for i, (_, args) in enumerate(entries)]
+            pattern = re.compile("".join(parts))
+            self.index[program] = (pattern, [rule for rule, _ in entries])
+
+    def match(self, argv: list, background: bool = False, stdin: bool = False):
+        """サブコマンド1つを評価し、当てはまった最初のルールを返す。
+
+        stdin はリダイレクトかパイプで標準入力が渡されているか。
+        """
+        bucket = self.index.get(os.path.basename(argv[0]))
+        if bucket is None:
+            return None
+        pattern, rules = bucket
+        args = argv[1:]
+        groups = pattern.match(" ".join(args)).groupdict()
+        for i, rule in enumerate(rules):
+            if groups[f"r{i}"] is not None and rule.applies(args, background, stdin):
+                return rule
+        return None
+
+
+def _heredoc_delimiters(line: str) -> list:
+    """1行に書かれたヒアドキュメントの (区切り文字, 行頭タブを除くか) を順に返す。"""
+    lexer = shlex.shlex(line, posix=True, punctuation_chars=_PUNCTUATION)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        return []
+    delimiters = []
+    for i, token in enumerate(tokens[:-1]):
+        if token != "<<":
+            continue
+        # `<<-EOF` は "<<" と "-EOF"、`<<- EOF` は "<<" "-" "EOF" に分かれる
+        target = tokens[i + 1]
+        strip_tabs = target.startswith("-")
+        if strip_tabs:
+            target = target[1:] or (tokens[i + 2] if i + 2 < len(tokens) else "")
+        if target:
+            delimiters.append((target, strip_tabs))
+    return delimiters
+
+
+def _strip_heredocs(command: str) -> str:
+    """ヒアドキュメントの本文を区切り文字の行まで取り除く。"""
+    if "<<" not in command:
+        return command
+    kept = []
+    pending = []
+    for line in command.split("\n"):
+        if pending:
+            delimiter, strip_tabs = pending[0]
+            if (line.lstrip("\t") if strip_tabs else line) == delimiter:
+                pending.pop(0)
+            continue
+        kept.append(line)
+        if "<<" in line:
+            pending.extend(_heredoc_delimiters(line))
+    return "\n".join(kept)
+
+
+def split_commands(command: str):
+    """コマンド文字列を (argv, バックグラウンド実行か, 標準入力が渡されているか) に分解する。"""
+    # 改行はコマンドの区切りとして扱う（行継続の `\` + 改行は空白と同じ）
+    command = _strip_heredocs(command.replace("\\\n", " "))
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=_PUNCTUATION + "\n")
+    lexer.whitespace = " \t\r"
+    lexer.whitespace_split = True
+    # shlex のコメント処理は行末の改行まで読み捨ててしまうので、下のループで扱う
+    lexer.commenters = ""
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        # 引用符の対応が取れない場合は空白区切りで妥協する
+        tokens = command.replace("\n", " ; ").split()
+
+    argv = []
+    stdin = False  # パイプの後か、標準入力のリダイレクトがある
+    wrapper = None  # 直前のラッパーの、値を取るオプション
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if "\n" in token and not token.strip(_PUNCTUATION + "\n"):
+            # `&&` の後の改行のように区切り文字と続いた改行は、区切り文字の方を使う
+            token = token.replace("\n", "") or "\n"
+        if token.startswith("#"):
+            # コメント: 次の改行まで読み飛ばす
+            while i + 1 < len(tokens) and "\n" not in tokens[i + 1]:
+                i += 1
+        elif token in _SEPARATORS:
+            if argv:
+                yield argv, token == "&", stdin
+            argv, wrapper = [], None
+            stdin = token in _PIPES
+        elif token in _REDIRECTS:
+            # 直前のfd番号（2>&1 の 2）とリダイレクト先を捨てる
+            fd = argv.pop() if argv and argv[-1].isdigit() else ""
+            if token in _STDIN_REDIRECTS and fd in ("", "0"):
+                stdin = True
+            i += 1
+        elif argv:
+            argv.append(token)
+        elif token in _WRAPPERS:
+            wrapper = _WRAPPERS[token]
+        elif _ASSIGNMENT.match(token):
+            pass
+        elif wrapper is not None and token.startswith("-"):
+            if token in wrapper:
+                # `sudo -u user` の user を読み飛ばす
+                i += 1
+        else:
+            argv.append(token)
+        i += 1
+    if argv:
+        yield argv, False, stdin
+
+
+def evaluate(command: str, ruleset: "RuleSet" = None):
+    """コマンド文字列を評価して (ルール, サブコマンド文字列) を返す。許可なら (None, "")。"""
+    ruleset = ruleset or compiled()
+    for argv, background, stdin in split_commands(command):
+        rule = ruleset.match(argv, background, stdin)
+        if rule is not None:
+            return rule, " ".join(argv)
+    return None, ""
+
+
+def deny_reason(command: str, ruleset: "RuleSet" = None) -> str:
+    """拒否理由を返す。許可なら空文字。"""
+    rule, subcommand = evaluate(command, ruleset)
+    if rule is None:
+        return ""
+    return rule.reason.replace("{command}", subcommand)
+
+
+def load_specs(paths=(RULES_PATH, USER_RULES_PATH)) -> list:
+    """ルール定義を読み込む。後のファイルの同じidのルールは前のものを上書きする。"""
+    specs = {}
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            continue
+        for spec in data.get("rules", []):
+            specs[spec["id"]] = spec
+    return list(specs.values())
+
+
+# (ルールファイルのmtime, RuleSet)。hookdではルールファイルが変わるまで再利用する。
+_CACHE = [None, None]
+
+
+def compiled() -> RuleSet:
+    """コンパイル済みのルールセットを返す。"""
+    stamp = []
+    for path in (RULES_PATH, USER_RULES_PATH):
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    if _CACHE[0] != stamp:
+        _CACHE[0], _CACHE[1] = stamp, RuleSet(load_specs())
+    return _CACHE[1]
+
+
+def load_corpus(path: str = CORPUS_PATH) -> list:
+    """ベンチマーク・検証用のコマンドコーパスを読み込む。"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
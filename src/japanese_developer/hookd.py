@@ -0,0 +1,114 @@
+"""常駐hookサーバー（hookd）
+
+~/.gemini/hookd.sock でUnixソケットを待ち受け、entry.py の薄いクライアントから
+転送されたhook JSONを常駐プロセス内で処理する。ガードルールのコンパイル結果・
+gitメタデータのキャッシュ・構文チェッカーのワーカープロセスがプロセス内に残るため、
+hookごとのインタプリタ起動が不要になる。
+
+プロトコル（1接続1リクエスト、どちらも改行終端のJSON 1行）:
+  リクエスト: {"hook": 名前, "input": stdinの内容, "project_dir": パス}
+  レスポンス: {"stdout": 文字列, "stderr": 文字列, "code": 終了コード}
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+from japanese_developer import hooks
+
+GEMINI_DIR = Path.home() / ".gemini"
+SOCKET_PATH = GEMINI_DIR / "hookd.sock"
+PID_PATH = GEMINI_DIR / "hookd.pid"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            stdout, stderr, code = hooks.run_hook(
+                request["hook"], request.get("input", ""), request.get("project_dir")
+            )
+        except Exception as e:
+            stdout, stderr, code = "", f"hookd: {e}\n", 1
+        reply = {"stdout": stdout, "stderr": stderr, "code": code}
+        self.wfile.write(json.dumps(reply, ensure_ascii=False).encode() + b"\n")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def is_running() -> bool:
+    """hookdが応答可能な状態か確認する。"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(SOCKET_PATH))
+        return True
+    except OSError:
+        return False
+
+
+def read_pid() -> int:
+    try:
+        return int(PID_PATH.read_text().strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def serve():
+    """フォアグラウンドでhookdを起動する。SIGTERM/SIGINTで終了。"""
+    GEMINI_DIR.mkdir(parents=True, exist_ok=True)
+    if is_running():
+        raise RuntimeError(f"hookd は既に起動しています: {SOCKET_PATH}")
+    # 前回の異常終了で残ったソケットを削除
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    old_umask = os.umask(0o077)
+    try:
+        server = _Server(str(SOCKET_PATH), _Handler)
+    finally:
+        os.umask(old_umask)
+    PID_PATH.write_text(str(os.getpid()))
+    hooks.RESIDENT = True
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for path in (SOCKET_PATH, PID_PATH):
+            if path.exists():
+                path.unlink()
+        hooks.shutdown()
+
+
+def stop() -> bool:
+    """起動中のhookdにSIGTERMを送る。停止対象が無ければFalse。"""
+    pid = read_pid()
+    if not pid:
+        return False
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        PID_PATH.unlink(missing_ok=True)
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        serve()
+    except RuntimeError as e:
+        sys.stderr.write(f"{e}\n")
+        sys.exit(1)
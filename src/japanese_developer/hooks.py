@@ -0,0 +1,318 @@
+"""Gemini CLI hookのPython実装（高速パス）
+
+`japanese-developer hook <name>` から呼ばれ、stdinのhook JSONを1回だけパースして
+各hookの処理を実行する。bash + jq のプロセス起動連鎖を置き換えるためのもの。
+
+このモジュールはhook呼び出しのたびにimportされるため、click・shutil・datetime
+等の重いモジュールをトップレベルでimportしないこと。起動時間の予算は
+HOOK_IMPORT_BUDGET_MS（`japanese-developer hook-budget` で計測）。
+
+各hookの実行時間と判定は telemetry に記録される（`japanese-developer stats`）。
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from japanese_developer import guard, telemetry
+
+# hookモジュールのimport時間の予算（ミリ秒、インタプリタ起動時間は除く）
+HOOK_IMPORT_BUDGET_MS = 30
+
+# hookの高速パスでimportしてはならないモジュール
+FORBIDDEN_IMPORTS = ("click",)
+
+ALLOW = {"decision": "allow"}
+
+# 処理関数がテレメトリに追加で記録する項目を載せるキー（出力前に取り除く）
+TELEMETRY_KEY = "_telemetry"
+
+# hookd（常駐プロセス）内で実行されているか。Trueならチェッカーワーカーを使い回す。
+RESIDENT = False
+
+FILE_WRITE_TOOLS = ("write_file", "edit_file", "create_file", "replace_in_file", "write_to_file")
+
+
+def _tool_command(payload: dict) -> str:
+    """`.tool_input.command // .tool_input.content // ""` 相当"""
+    tool_input = payload.get("tool_input") or {}
+    return tool_input.get("command") or tool_input.get("content") or ""
+
+
+def _tool_error(payload: dict) -> str:
+    """`.tool_response.error // ""` 相当"""
+    response = payload.get("tool_response") or {}
+    error = response.get("error")
+    return str(error) if error else ""
+
+
+def _git(project_dir: str, *args: str) -> str:
+    """gitコマンドを実行して出力を返す。失敗時は空文字。"""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=project_dir, capture_output=True, text=True
+        )
+    except OSError:
+        return ""
+    if result.returncode != 0:
+        return ""
+    return result.stdout.strip()
+
+
+# project_dir → ((HEADとconfigのmtime), (ブランチ, 作業者))。hookdでは呼び出しをまたいで保持される。
+_GIT_META_CACHE = {}
+
+
+def _git_meta(project_dir: str):
+    """(ブランチ名, 作業者名) を返す。.git/HEAD と .git/config が変わらない限りキャッシュする。"""
+    try:
+        stamp = (
+            os.stat(os.path.join(project_dir, ".git", "HEAD")).st_mtime_ns,
+            os.stat(os.path.join(project_dir, ".git", "config")).st_mtime_ns,
+        )
+    except OSError:
+        stamp = None
+    cached = _GIT_META_CACHE.get(project_dir)
+    if stamp is not None and cached and cached[0] == stamp:
+        return cached[1]
+
+    branch = _git(project_dir, "branch", "--show-current")
+    author = _git(project_dir, "config", "user.name") or "unknown"
+    if stamp is not None:
+        _GIT_META_CACHE[project_dir] = (stamp, (branch, author))
+    return branch, author
+
+
+def _project_dir() -> str:
+    return os.environ.get("GEMINI_PROJECT_DIR") or os.getcwd()
+
+
+# --- primer ---
+
+def primer(payload: dict, project_dir: str):
+    """SessionStart: プライマー情報をコンテキストに注入し、メニューをターミナルに表示する"""
+    from japanese_developer import primer as session_primer
+
+    result = session_primer.build(project_dir)
+    if not result["context"]:
+        return {"hookSpecificOutput": {"additionalContext": ""}}, []
+    return (
+        {"hookSpecificOutput": {"additionalContext": result["context"]}},
+        session_primer.menu_lines(result["git"]),
+    )
+
+
+# --- context ---
+
+def session_context(payload: dict, project_dir: str):
+    """SessionStart: コンパイル済みのコンテキストを注入し、メニューをターミナルに表示する"""
+    from japanese_developer import context
+
+    cached = context.load(project_dir)
+    hit = cached is not None
+    if not hit:
+        cached = context.build(project_dir)
+    response = dict(cached["output"])
+    response[TELEMETRY_KEY] = {"cached": hit, "tokens": cached["stats"]["tokens"]}
+    return response, cached["menu"]
+
+
+# --- interactive-guard ---
+
+def interactive_guard(payload: dict, project_dir: str):
+    """BeforeTool: 対話型コマンドを検知し、非対話フラグ付きの代替を提案する"""
+    command = (payload.get("tool_input") or {}).get("command") or ""
+    if not command:
+        return ALLOW, []
+    rule, subcommand = guard.evaluate(command)
+    if rule is not None:
+        reason = rule.reason.replace("{command}", subcommand)
+        return {"decision": "deny", "reason": reason, TELEMETRY_KEY: {"rule": rule.id}}, []
+    return ALLOW, []
+
+
+# --- auto-worklog ---
+
+def auto_worklog(payload: dict, project_dir: str):
+    """AfterTool: git commit 検出後に logs/ へ作業ログを追記する"""
+    if not re.match(r"git commit", _tool_command(payload)):
+        return {}, []
+    if _tool_error(payload):
+        return {}, ["コミット失敗のためログ記録をスキップ"]
+
+    from japanese_developer import worklog
+
+    entry, messages = worklog.record_commit(project_dir)
+    if entry is None:
+        return {}, messages
+
+    log_name = worklog.branch_log_name(entry["branch"], entry["author"])
+    messages.append(f"ログ記録完了: WORK_LOG.md + {log_name}")
+    context = (
+        f"作業ログを記録しました ({entry['hash']}: {entry['subject']})\n"
+        f"統合ログ: logs/WORK_LOG.md\n"
+        f"ブランチログ: logs/{log_name}"
+    )
+    return {"hookSpecificOutput": {"additionalContext": context}}, messages
+
+
+# --- pr-log-sync ---
+
+def pr_log_sync(payload: dict, project_dir: str):
+    """AfterTool: git push 検出後にPRへの作業ログ同期ジョブを積む（投稿はバックグラウンド）"""
+    if not re.match(r"git push", _tool_command(payload)):
+        return {}, []
+    if _tool_error(payload):
+        return {}, ["push失敗のためPRログ同期をスキップ"]
+
+    branch, author = _git_meta(project_dir)
+    if branch in ("main", "master"):
+        return {}, []
+
+    from japanese_developer import prsync
+
+    job = prsync.enqueue(project_dir, branch, author)
+    prsync.spawn_flusher()
+    context = "PRへの作業ログ同期をバックグラウンドで予約しました"
+    return {"hookSpecificOutput": {"additionalContext": context}}, [
+        f"PRログ同期を予約（{branch}・未送信push {job['pushes']}件）"
+    ]
+
+
+# --- syntax-check ---
+
+_CHECKER_POOL = None
+
+
+def _checker_pool():
+    global _CHECKER_POOL
+    if _CHECKER_POOL is None:
+        from japanese_developer.checkers import CheckerPool
+        _CHECKER_POOL = CheckerPool(persistent=RESIDENT)
+    return _CHECKER_POOL
+
+
+def _written_path(payload: dict) -> str:
+    """`.tool_input.path // .tool_input.file_path // .tool_input.target_file` 相当"""
+    tool_input = payload.get("tool_input") or {}
+    return tool_input.get("path") or tool_input.get("file_path") or tool_input.get("target_file") or ""
+
+
+def _check_files(paths: list) -> dict:
+    paths = [p for p in paths if os.path.isfile(p)]
+    return _checker_pool().check_many(paths) if paths else {}
+
+
+def _syntax_report(results: dict, project_dir: str, event: str):
+    """チェック結果（path → エラー内容）を、エラーがあれば1つのメッセージで報告する。"""
+    from japanese_developer.checkers import batch_message, language_of
+
+    errors = [
+        {"path": os.path.relpath(p, project_dir) if p.startswith(project_dir + os.sep) else p,
+         "language": language_of(p), "error": e}
+        for p, e in results.items() if e
+    ]
+    stats = {TELEMETRY_KEY: {"files": len(results), "errors": len(errors)}}
+    if not errors:
+        return None, []
+    message = batch_message(errors, len(results))
+    if event == "AfterAgent":
+        # ターンの終わり: 応答を差し戻して修正させる
+        return {"decision": "deny", "reason": message, "systemMessage": message, **stats}, []
+    return {
+        "systemMessage": message,
+        "hookSpecificOutput": {"additionalContext": message},
+        **stats,
+    }, []
+
+
+def syntax_check(payload: dict, project_dir: str):
+    """AfterTool: ファイル書き込み後に構文エラーをチェックしてGeminiに報告する
+
+    同時に来た書き込みはスプールにまとめ、1つのメッセージにする（syntaxbatch）。
+    AfterAgent ではスプールに残っている分をチェックする。
+    """
+    from japanese_developer import syntaxbatch
+
+    if payload.get("hook_event_name") == "AfterAgent":
+        results = syntaxbatch.collect(project_dir, _check_files, quiet=0)
+        return _syntax_report(results or {}, project_dir, "AfterAgent")
+
+    if payload.get("tool_name") not in FILE_WRITE_TOOLS:
+        return None, []
+    path = _written_path(payload)
+    if path and not os.path.isabs(path):
+        path = os.path.join(project_dir, path)
+    if not path or not os.path.isfile(path):
+        return None, []
+
+    syntaxbatch.add(project_dir, path)
+    results = syntaxbatch.collect(project_dir, _check_files)
+    if results is None:
+        # チェック中の別の呼び出しがまとめて報告する
+        return None, []
+    return _syntax_report(results, project_dir, "AfterTool")
+
+
+# hook名 → 処理関数。関数は (payload, project_dir) を受け取り
+# (stdoutに出すJSON, stderrに出すメッセージのリスト) を返す。
+HOOKS = {
+    "context": session_context,
+    "primer": primer,
+    "interactive-guard": interactive_guard,
+    "auto-worklog": auto_worklog,
+    "pr-log-sync": pr_log_sync,
+    "syntax-check": syntax_check,
+}
+
+
+def run_hook(name: str, raw_input: str, project_dir: str = None):
+    """hookを実行して (stdout, stderr, 終了コード) を返す。"""
+    handler = HOOKS.get(name)
+    if handler is None:
+        return "", f"不明なhook: {name}\n", 1
+    try:
+        payload = json.loads(raw_input) if raw_input.strip() else {}
+    except ValueError:
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+
+    start = time.perf_counter()
+    response, code = None, 1
+    try:
+        response, messages = handler(payload, project_dir or _project_dir())
+        code = 0
+    finally:
+        extra = response.pop(TELEMETRY_KEY, None) if response else None
+        if telemetry.enabled():
+            telemetry.record(name, payload, (time.perf_counter() - start) * 1000, response, code, extra)
+    stdout = "" if response is None else json.dumps(response, ensure_ascii=False) + "\n"
+    stderr = "".join(f"{m}\n" for m in messages)
+    return stdout, stderr, 0
+
+
+def shutdown():
+    """保持している状態（gitメタデータ・チェッカーワーカー）を破棄する。"""
+    global _CHECKER_POOL
+    _GIT_META_CACHE.clear()
+    if _CHECKER_POOL is not None:
+        _CHECKER_POOL.close()
+        _CHECKER_POOL = None
+
+
+def main(argv: list) -> int:
+    """`japanese-developer hook <name>` のエントリポイント"""
+    if len(argv) != 1:
+        sys.stderr.write(f"使い方: japanese-developer hook <{'|'.join(HOOKS)}>\n")
+        return 2
+    try:
+        stdout, stderr, code = run_hook(argv[0], sys.stdin.read())
+    finally:
+        shutdown()
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return code
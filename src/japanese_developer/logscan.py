@@ -0,0 +1,219 @@
+"""ログからのスタックトレース抽出（`japanese-developer error --from-log`）
+
+ログファイルを mmap して末尾から1行ずつ逆向きに読み、Python・Node・Vite の
+スタックトレースを新しい順に取り出す。トレースの目印（Traceback・`    at `・[vite] 等）
+の位置は mmap.rfind で探し、目印の無い範囲は行に分けずに読み飛ばすので、
+1GB のログでも全体をメモリに載せず、末尾付近のトレースなら一瞬で見つかる。
+
+同じエラーはパス・行番号・数値を取り除いた指紋でまとめ、出現回数を数える。
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+
+# 取り出す異なるトレースの数（既定）
+DEFAULT_LIMIT = 3
+
+# 1トレースとして保持する最大行数
+MAX_TRACE_LINES = 60
+
+# 1行として扱う最大バイト数（改行の無い巨大な行への対策）
+MAX_LINE_BYTES = 64 * 1024
+
+# トレースの目印
+MARKERS = (b"Traceback (most recent call last)", b'  File "', b"    at ", b"[vite]", b"[plugin:")
+
+_ANSI = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_VITE_HEADER = re.compile(r"\[vite\]|\[plugin:")
+_PY_FRAME = re.compile(r'File "(?P<path>[^"]+)", line \d+, in (?P<func>.+)')
+_NODE_FRAME = re.compile(r"at (?:(?P<func>.+?) \()?(?P<loc>[^()\s]+?)(?::\d+){1,2}\)?$")
+_PATH = re.compile(r"""(?:[A-Za-z]:)?(?:file://)?[\\/][^\s:'"()]+""")
+_NUMBER = re.compile(r"0x[0-9a-fA-F]+|\d+")
+
+
+def _decode(raw: bytes) -> str:
+    return _ANSI.sub("", raw.decode("utf-8", "replace")).rstrip("\r")
+
+
+def _normalize(text: str) -> str:
+    text = _PATH.sub("<path>", text)
+    return _NUMBER.sub("<n>", text).strip()
+
+
+def fingerprint(kind: str, lines: list) -> str:
+    """パス・行番号・数値を除いたトレースの指紋（関数名と例外行から作る）"""
+    parts = [kind]
+    for line in lines:
+        stripped = line.strip()
+        frame = _PY_FRAME.match(stripped)
+        if frame:
+            parts.append(frame.group("func"))
+            continue
+        frame = _NODE_FRAME.match(stripped)
+        if frame and stripped.startswith("at "):
+            parts.append(frame.group("func") or "<anonymous>")
+            continue
+        if line[:1] not in (" ", "\t"):
+            parts.append(_normalize(stripped))
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:12]
+
+
+# 目印を探す窓の大きさ（末尾から窓単位で遡る）
+WINDOW_BYTES = 8 * 1024 * 1024
+
+
+class _NextMarker:
+    """end より前にある最も近い目印の位置を返す。
+
+    末尾から WINDOW_BYTES ずつ遡って rfind し、通り過ぎた窓のページは
+    madvise で手放す（1GB のログを遡っても常駐メモリが増えない）。
+    """
+
+    def __init__(self, mm):
+        self.mm = mm
+        self.hit = None  # 直前に見つけた (位置, 目印の長さ)
+        self.clean_below = -1  # この位置より前には目印が無い
+        self.released = len(mm)
+        self.page = mmap.PAGESIZE
+
+    def _release(self, lo: int):
+        start = -(-lo // self.page) * self.page
+        if start < self.released:
+            if hasattr(self.mm, "madvise"):
+                self.mm.madvise(mmap.MADV_DONTNEED, start, self.released - start)
+            self.released = start
+
+    def before(self, end: int) -> int:
+        if self.hit and self.hit[0] + self.hit[1] <= end:
+            return self.hit[0]
+        if end <= self.clean_below:
+            return -1
+        hi = end
+        while hi > 0:
+            lo = max(0, hi - WINDOW_BYTES)
+            best, length = -1, 0
+            for marker in MARKERS:
+                pos = self.mm.rfind(marker, lo, min(end, hi + len(marker) - 1))
+                if pos > best:
+                    best, length = pos, len(marker)
+            if best >= 0:
+                self.hit = (best, length)
+                return best
+            self._release(lo)
+            hi = lo
+        self.clean_below = end
+        return -1
+
+
+def _region_end(mm, marker_pos: int, size: int) -> int:
+    """目印の行から、続くインデント行と直後の1行（Pythonの例外行）までの終端を返す。"""
+    end = mm.find(b"\n", marker_pos)
+    for _ in range(MAX_TRACE_LINES):
+        if end < 0 or end + 1 >= size:
+            return size
+        next_end = mm.find(b"\n", end + 1)
+        next_end = size if next_end < 0 else next_end
+        indented = mm[end + 1:end + 2] in (b" ", b"\t")
+        end = next_end
+        if not indented:
+            break
+    return end
+
+
+def scan_mmap(mm, size: int, limit: int = DEFAULT_LIMIT) -> dict:
+    """mmap したログの末尾から異なるトレースを limit 件まで取り出す。"""
+    traces = {}
+    order = []
+    block = []  # インデント行（逆順）
+    tail = None  # ブロック直後の非インデント行（Pythonの例外行の候補）
+    markers = _NextMarker(mm)
+    end = size
+    if end and mm[end - 1:end] == b"\n":
+        end -= 1
+    scanned_from = end
+
+    def emit(kind: str, lines: list):
+        lines = lines[:MAX_TRACE_LINES // 2] + lines[-(MAX_TRACE_LINES // 2):] \
+            if len(lines) > MAX_TRACE_LINES else lines
+        key = fingerprint(kind, lines)
+        if key in traces:
+            traces[key]["count"] += 1
+        else:
+            traces[key] = {"kind": kind, "fingerprint": key, "count": 1, "lines": lines}
+            order.append(key)
+
+    while end > 0 and len(order) < limit:
+        if not block:
+            # 目印の無い範囲は読み飛ばす
+            marker = markers.before(end)
+            if marker < 0:
+                scanned_from = 0
+                break
+            target = _region_end(mm, marker, size)
+            if target < end:
+                end = target
+                tail = None
+
+        start = mm.rfind(b"\n", 0, end) + 1
+        line = _decode(mm[max(start, end - MAX_LINE_BYTES):end])
+        scanned_from = start
+        end = start - 1
+
+        if line[:1] in (" ", "\t"):
+            if len(block) < MAX_TRACE_LINES * 4:
+                block.append(line)
+            continue
+        if "Traceback (most recent call last)" in line:
+            if any(_PY_FRAME.search(b) for b in block):
+                emit("python", [line.strip()] + block[::-1] + ([tail] if tail else []))
+            block, tail = [], None
+        elif _VITE_HEADER.search(line):
+            emit("vite", [line] + block[::-1])
+            block, tail = [], None
+        elif any(b.lstrip().startswith("at ") for b in block):
+            emit("node", [line] + block[::-1])
+            block, tail = [], None
+        else:
+            block, tail = [], (line or None)
+
+    return {
+        "traces": [traces[key] for key in order],
+        "scanned_bytes": size - max(scanned_from, 0),
+        "total_bytes": size,
+    }
+
+
+def _open_source(path: str):
+    """ログのファイルオブジェクトを返す。"-" は標準入力。
+
+    標準入力がパイプの場合は一時ファイルへチャンク単位でコピーしてから mmap する。
+    """
+    if path != "-":
+        return open(path, "rb")
+    stdin = sys.stdin.buffer
+    if stat.S_ISREG(os.fstat(stdin.fileno()).st_mode):
+        return os.fdopen(os.dup(stdin.fileno()), "rb")
+    spool = tempfile.TemporaryFile()
+    shutil.copyfileobj(stdin, spool, 1 << 20)
+    spool.flush()
+    return spool
+
+
+def scan(path: str, limit: int = DEFAULT_LIMIT) -> dict:
+    """ログファイル（"-" で標準入力）からトレースを取り出す。
+
+    戻り値は {"traces": [{"kind", "fingerprint", "count", "lines"}], "scanned_bytes", "total_bytes"}。
+    traces は新しい順。count は走査した範囲での出現回数。
+    """
+    with _open_source(path) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return {"traces": [], "scanned_bytes": 0, "total_bytes": 0}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return scan_mmap(mm, size, limit)
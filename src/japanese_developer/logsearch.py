@@ -0,0 +1,225 @@
+"""作業ログの全文検索（`japanese-developer log search`）
+
+logs/.worklog.jsonl のエントリを SQLite FTS5 の索引（~/.gemini/cache/logsearch/）に
+取り込み、件名・変更ファイル・ブランチ・作者を検索する。
+
+- 日本語は単語の区切りが無いため、かな・漢字の連続を文字bigramに分けてから
+  unicode61 トークナイザに渡す（「ログイン画面」→「ログ グイ イン ン画 画面 面」）。
+  検索語も同じように分け、bigramの並びをフレーズとして照合する
+- 索引済みのバイトオフセットと直前のバイト列の指紋を保存しておき、検索のたびに
+  追記された分だけを取り込む。マージ等でジャーナルが書き換わっていれば作り直す
+- ジャーナル導入前に書かれた WORK_LOG.md・ブランチログのエントリ（ジャーナルに無いもの）は、
+  索引を作る時に Markdown から取り込む。ジャーナルが無いプロジェクトでは
+  WORK_LOG.md が変わるたびに Markdown から作り直す
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+
+INDEX_DIR = Path.home() / ".gemini" / "cache" / "logsearch"
+
+# 索引済みの位置の直前から指紋を取るバイト数
+TAIL_BYTES = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL,
+    time TEXT NOT NULL,
+    branch TEXT NOT NULL,
+    author TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    files TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_time ON entries (time);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    subject, files, branch, author, content='', tokenize='unicode61'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# かな・カタカナ・漢字（半角カナ・々〆ー を含む）の連続
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff66-\uff9f々〆]+")
+
+
+def _grams(run: str) -> list:
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def bigrams(text: str) -> str:
+    """索引用: かな・漢字の連続を文字bigramと末尾の1文字に分ける。"""
+    return _CJK.sub(lambda m: " " + " ".join(_grams(m.group(0)) + [m.group(0)[-1]]) + " ", text)
+
+
+def _query_term(term: str) -> str:
+    """検索語1つを FTS5 のクエリに変換する。"""
+    if len(term) == 1 and _CJK.fullmatch(term):
+        # 1文字はその文字で始まるbigram（または末尾の1文字）に前方一致
+        return f"{term}*"
+    text = _CJK.sub(lambda m: " " + " ".join(_grams(m.group(0))) + " ", term)
+    return '"' + " ".join(text.split()).replace('"', '""') + '"'
+
+
+def build_query(query: str) -> str:
+    """空白区切りの検索語をすべて含む（AND）クエリを作る。記号だけの語は無視する。"""
+    return " AND ".join(_query_term(term) for term in query.split() if re.search(r"[^\W_]", term))
+
+
+def index_path(project_dir: str) -> Path:
+    key = hashlib.sha1(os.path.realpath(project_dir).encode()).hexdigest()[:16]
+    return INDEX_DIR / f"{key}.db"
+
+
+def connect(project_dir: str) -> sqlite3.Connection:
+    path = index_path(project_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, timeout=10)
+    db.row_factory = sqlite3.Row
+    db.executescript(SCHEMA)
+    return db
+
+
+def _meta(db, key: str, default: str = "") -> str:
+    row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else default
+
+
+def _tail_digest(f, offset: int) -> str:
+    start = max(0, offset - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def _reset(db):
+    db.execute("DELETE FROM entries")
+    db.execute("INSERT INTO entries_fts(entries_fts) VALUES ('delete-all')")
+
+
+def _insert(db, entry: dict):
+    files = ", ".join(entry.get("files", []))
+    cur = db.execute(
+        "INSERT INTO entries (hash, time, branch, author, subject, files) VALUES (?, ?, ?, ?, ?, ?)",
+        (entry.get("hash", ""), entry.get("time", ""), entry.get("branch", ""),
+         entry.get("author", ""), entry.get("subject", ""), files),
+    )
+    db.execute(
+        "INSERT INTO entries_fts (rowid, subject, files, branch, author) VALUES (?, ?, ?, ?, ?)",
+        (cur.lastrowid, bigrams(entry.get("subject", "")), bigrams(files),
+         bigrams(entry.get("branch", "")), bigrams(entry.get("author", ""))),
+    )
+
+
+def _import_markdown(db, logs_dir: str, journal_hashes: set) -> set:
+    """ジャーナルに無い Markdown のエントリを取り込み、取り込んだコミットハッシュ（先頭7桁）を返す。"""
+    from japanese_developer.worklog import markdown_entries
+
+    imported = set()
+    for entry in markdown_entries(logs_dir):
+        if entry["hash"][:7] not in journal_hashes:
+            _insert(db, entry)
+            imported.add(entry["hash"][:7])
+    return imported
+
+
+def _set_meta(db, **values):
+    for key, value in values.items():
+        db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+
+def update(db, project_dir: str) -> int:
+    """ジャーナル（初回は Markdown のログも）の未索引エントリを取り込み、取り込んだ件数を返す。"""
+    from japanese_developer.worklog import JOURNAL_NAME
+
+    logs_dir = os.path.join(project_dir, "logs")
+    journal = os.path.join(logs_dir, JOURNAL_NAME)
+    offset = int(_meta(db, "offset", "0"))
+    try:
+        f = open(journal, "rb")
+    except FileNotFoundError:
+        # ジャーナルが無い（Markdownのログだけの）プロジェクト
+        try:
+            stamp = str(os.path.getsize(os.path.join(logs_dir, "WORK_LOG.md")))
+        except OSError:
+            stamp = ""
+        if not offset and _meta(db, "markdown") == stamp:
+            return 0
+        _reset(db)
+        db.execute("DELETE FROM meta")
+        added = len(_import_markdown(db, logs_dir, set()))
+        _set_meta(db, markdown=stamp)
+        db.commit()
+        return added
+
+    added = 0
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == offset and offset and _tail_digest(f, offset) == _meta(db, "tail"):
+            return 0
+        if (offset > size or (offset and _tail_digest(f, offset) != _meta(db, "tail"))
+                or _meta(db, "markdown") or (offset and not _meta(db, "imported"))):
+            # ジャーナルが作り直された・書き換えられた・Markdownを取り込んでいない場合は最初から
+            _reset(db)
+            db.execute("DELETE FROM meta")
+            offset = 0
+
+        first = not _meta(db, "imported")
+        # Markdownから取り込んだエントリと同じコミットがジャーナルに来ても二重に索引しない
+        imported = set(json.loads(_meta(db, "imported", "[]") or "[]"))
+        journal_hashes = set()
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # 書き込み途中の行は次回に回す
+                break
+            offset += len(raw)
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            short = entry.get("hash", "")[:7]
+            journal_hashes.add(short)
+            if short in imported:
+                continue
+            _insert(db, entry)
+            added += 1
+        tail = _tail_digest(f, offset)
+
+    if first:
+        imported = _import_markdown(db, logs_dir, journal_hashes)
+        added += len(imported)
+    _set_meta(db, offset=offset, tail=tail, imported=json.dumps(sorted(imported)))
+    db.commit()
+    return added
+
+
+def search(db, query: str, branch: str = None, author: str = None, since: str = None,
+           limit: int = 20) -> list:
+    """検索語をすべて含むエントリを新しい順に返す。"""
+    match = build_query(query)
+    if not match:
+        return []
+    sql = ["SELECT e.* FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid WHERE entries_fts MATCH ?"]
+    params = [match]
+    if branch:
+        sql.append("AND e.branch = ?")
+        params.append(branch)
+    if author:
+        sql.append("AND e.author = ?")
+        params.append(author)
+    if since:
+        sql.append("AND e.time >= ?")
+        params.append(since)
+    sql.append("ORDER BY e.time DESC, e.id DESC LIMIT ?")
+    params.append(limit)
+    return [dict(row) for row in db.execute(" ".join(sql), params)]
+
+
+def count(db) -> int:
+    return db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -0,0 +1,146 @@
+"""導入ファイルのマニフェスト
+
+setup で ~/.gemini/ に配置したファイルを、SHA-256 とパッケージのバージョン付きで
+~/.gemini/jd-manifest.json に記録する。
+
+- setup の再実行: テンプレートが変わったファイルだけコピーする。
+  ユーザーが手を加えたファイルは --force が無ければ上書きしない
+- status: 変更あり・更新あり（古い）・見つからないファイルを報告する
+- uninstall: マニフェストに載っているファイルと hook 名だけを削除する
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from japanese_developer import template_path
+
+GEMINI_DIR = Path.home() / ".gemini"
+TEMPLATES_DIR = Path(template_path())
+MANIFEST_PATH = GEMINI_DIR / "jd-manifest.json"
+
+MANIFEST_VERSION = 1
+
+# setup で ~/.gemini/ に配置するテンプレート（~/.gemini/ からの相対パス）
+TOP_LEVEL_TEMPLATES = ("GEMINI.md", "primer.md")
+TEMPLATE_DIRS = ("hooks", "commands", "context")
+
+# マニフェスト導入前のバージョンが登録していた hook 名と、配置していたファイル → 配布時のSHA-256
+# （マニフェストが無い環境では、setup で登録解除・削除し、uninstall でも対象にする）
+LEGACY_HOOK_NAMES = ("enforce-japanese", "primer")
+LEGACY_FILES = {
+    "hooks/enforce-japanese.sh": ("ad9a1839f83095141bd10b9a19fc7e98fd273ee8df4fe9e26626e2e5709894d6",),
+}
+
+# 状態
+INSTALL = "install"  # 未配置 → コピー
+UPDATE = "update"  # テンプレートが更新され、ローカルは未変更 → コピー
+ADOPT = "adopt"  # マニフェスト導入前から同じ内容で存在 → 記録のみ
+CURRENT = "current"  # 最新
+MODIFIED = "modified"  # ローカルで変更あり（--force で上書き）
+RETIRE = "retire"  # テンプレートから削除された
+
+
+def package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("japanese-developer")
+    except Exception:
+        from japanese_developer import __version__
+
+        return __version__
+
+
+def sha256_file(path) -> str:
+    """ファイルのSHA-256。存在しなければ空文字。"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+def template_files() -> dict:
+    """~/.gemini/ からの相対パス → テンプレートのパス"""
+    files = {name: TEMPLATES_DIR / name for name in TOP_LEVEL_TEMPLATES}
+    for dirname in TEMPLATE_DIRS:
+        src_dir = TEMPLATES_DIR / dirname
+        if src_dir.is_dir():
+            for path in sorted(src_dir.iterdir()):
+                if path.is_file():
+                    files[f"{dirname}/{path.name}"] = path
+    return files
+
+
+def hook_names() -> list:
+    """templates/hooks.json に定義されている hook 名"""
+    with open(TEMPLATES_DIR / "hooks.json", encoding="utf-8") as f:
+        config = json.load(f)
+    return sorted({
+        h["name"]
+        for groups in config.values()
+        for group in groups
+        for h in group.get("hooks", [])
+        if h.get("name")
+    })
+
+
+def load():
+    """マニフェストを読む。無ければ None。"""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save(files: dict, names: list):
+    GEMINI_DIR.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": MANIFEST_VERSION,
+        "package_version": package_version(),
+        "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "files": files,
+        "hook_names": names,
+    }
+    tmp = MANIFEST_PATH.with_name(f"{MANIFEST_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def plan(manifest=None) -> list:
+    """テンプレートと配置済みファイルを比べ、(相対パス, テンプレート, 状態) のリストを返す。
+
+    状態は INSTALL / UPDATE / ADOPT / CURRENT / MODIFIED / RETIRE。
+    """
+    recorded = (manifest or {}).get("files", {})
+    templates = template_files()
+    actions = []
+    for rel, src in templates.items():
+        dest_hash = sha256_file(GEMINI_DIR / rel)
+        src_hash = sha256_file(src)
+        entry = recorded.get(rel)
+        if not dest_hash:
+            state = INSTALL
+        elif dest_hash == src_hash:
+            state = CURRENT if entry and entry["sha256"] == src_hash else ADOPT
+        elif entry and dest_hash == entry["sha256"]:
+            state = UPDATE
+        else:
+            state = MODIFIED
+        actions.append((rel, src, state))
+
+    for rel in sorted(set(recorded) - set(templates)):
+        actions.append((rel, None, RETIRE))
+    return actions
+
+
+def entry_for(path, sha256: str = None) -> dict:
+    return {"sha256": sha256 or sha256_file(path), "version": package_version()}
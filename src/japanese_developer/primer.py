@@ -0,0 +1,230 @@
+"""SessionStart プライマー
+
+primer.md に git 情報・カスタムコマンド一覧を埋め込んだコンテキストを作る。
+描画結果は ~/.gemini/cache/primer/ にプロジェクトごとに保存し、
+.git/HEAD・.git/index・git設定・commands/・primer.md の mtime が変わった時だけ作り直す。
+
+作り直す場合も git の呼び出しは2回だけ:
+- `git config --get-regexp` でユーザー名・メール・リモートをまとめて取得
+- `git status --porcelain --untracked-files=no` で未コミット変更を数える
+  （未追跡ファイルの走査は大きな作業ツリーで数秒かかるため行わない）
+ブランチは .git/HEAD を直接読む。
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+
+GEMINI_DIR = Path.home() / ".gemini"
+PRIMER_PATH = GEMINI_DIR / "primer.md"
+COMMANDS_DIR = GEMINI_DIR / "commands"
+CACHE_DIR = GEMINI_DIR / "cache" / "primer"
+
+CACHE_VERSION = 1
+
+MENU_ITEMS = [
+    "1. Termuxとは？     — スマホの中のキッチン",
+    "2. gitとは？        — セーブデータ管理",
+    "3. Gemini CLIとは？ — AIの助手",
+    "4. エージェントとは？— 腕のいい助手",
+    "5. 連絡先           — shimadatoshiyuki839@gmail.com",
+    None,  # 6. git連携（git情報から作る）
+    "7. コマンド一覧     — setup / status / error 等",
+    "8. 視覚設定         — UDフォント・文字サイズ",
+    "9. GitHubとは？     — コードの共有倉庫",
+    "10. GitHub連携      — ログインして連携する",
+    "11. GitHubアカウント作成 — 持っていない人はこちら",
+]
+
+
+def find_git_dir(path: str):
+    """(gitディレクトリ, 共通gitディレクトリ) を返す。リポジトリ外なら None。
+
+    worktree（.git がファイル）の場合、HEAD・index は worktree 側、config は共通側にある。
+    """
+    path = os.path.abspath(path)
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git, dot_git
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git, encoding="utf-8") as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if not line.startswith("gitdir:"):
+                return None
+            git_dir = os.path.normpath(os.path.join(path, line[len("gitdir:"):].strip()))
+            common = git_dir
+            try:
+                with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+                    common = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+            except OSError:
+                pass
+            return git_dir, common
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def read_branch(git_dir: str) -> str:
+    """.git/HEAD からブランチ名を読む。detached HEAD ならコミットハッシュ（短縮）。"""
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return "不明"
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return head[:7] or "不明"
+
+
+def _mtime(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _commands_stamp() -> list:
+    """commands/ のディレクトリと各 .md の mtime（説明行の変更も拾う）"""
+    stamp = [_mtime(COMMANDS_DIR)]
+    try:
+        with os.scandir(COMMANDS_DIR) as it:
+            stamp.extend(sorted((e.name, e.stat().st_mtime_ns) for e in it if e.name.endswith(".md")))
+    except OSError:
+        pass
+    return stamp
+
+
+def cache_key(git_dirs) -> list:
+    key = [CACHE_VERSION, _mtime(PRIMER_PATH), _commands_stamp(), _mtime(Path.home() / ".gitconfig")]
+    if git_dirs:
+        git_dir, common = git_dirs
+        key += [
+            _mtime(os.path.join(git_dir, "HEAD")),
+            _mtime(os.path.join(git_dir, "index")),
+            _mtime(os.path.join(common, "config")),
+        ]
+    return json.loads(json.dumps(key))
+
+
+def collect_git(project_dir: str, git_dir: str) -> dict:
+    """git情報を集める（git呼び出し2回）。"""
+    # インデックスのリフレッシュ書き込みをさせない（index の mtime をキャッシュキーに使うため）
+    env = dict(os.environ, GIT_OPTIONAL_LOCKS="0")
+    config = {}
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get-regexp", r"^(user\.(name|email)|remote\..*\.url)$"],
+            cwd=project_dir, capture_output=True, text=True, env=env,
+        )
+        for line in result.stdout.splitlines():
+            name, _, value = line.partition(" ")
+            config.setdefault(name, value)
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no", "--ignore-submodules"],
+            cwd=project_dir, capture_output=True, env=env,
+        )
+        changes = status.stdout.count(b"\n") if status.returncode == 0 else 0
+    except OSError:
+        changes = 0
+
+    remotes = [v for k, v in config.items() if k.startswith("remote.")]
+    return {
+        "user": config.get("user.name", "未設定"),
+        "email": config.get("user.email", "未設定"),
+        "branch": read_branch(git_dir),
+        "remote": config.get("remote.origin.url") or (remotes[0] if remotes else "なし"),
+        "changes": changes,
+    }
+
+
+def git_info_text(info) -> str:
+    if info is None:
+        return "（現在のディレクトリはgitリポジトリではありません）"
+    return (
+        "現在のgit情報:\n"
+        f"- ユーザー: {info['user']} <{info['email']}>\n"
+        f"- ブランチ: {info['branch']}\n"
+        f"- リモート: {info['remote']}\n"
+        f"- 未コミット変更: {info['changes']}件（未追跡ファイルを除く）"
+    )
+
+
+def custom_commands_text() -> str:
+    lines = []
+    try:
+        names = sorted(p for p in os.listdir(COMMANDS_DIR) if p.endswith(".md"))
+    except OSError:
+        names = []
+    for name in names:
+        try:
+            with open(COMMANDS_DIR / name, encoding="utf-8") as f:
+                desc = f.readline().strip().lstrip("#").strip()
+        except OSError:
+            continue
+        lines.append(f"- `/{name[:-3]}` — {desc}")
+    return "\n".join(lines) or "（カスタムコマンドなし）"
+
+
+def menu_lines(info) -> list:
+    """ターミナルに表示するメニュー（stderr用）"""
+    if info is None:
+        git_item = "6. git連携          — (リポジトリ外)"
+    else:
+        repo = os.path.basename(info["remote"])
+        repo = repo[:-4] if repo.endswith(".git") else repo
+        git_item = f"6. git連携          — {info['branch']} @ {repo if info['remote'] != 'なし' else '-'}"
+    lines = ["", "━━━ japanese-developer プライマー ━━━", ""]
+    lines += [f"  {item or git_item}" for item in MENU_ITEMS]
+    lines += ["", "  詳しく知りたい項目の番号を伝えてください。", "━" * 35, ""]
+    return lines
+
+
+def _cache_path(project_dir: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(project_dir.encode()).hexdigest()[:16]}.json"
+
+
+def build(project_dir: str, use_cache: bool = True) -> dict:
+    """プライマーを返す: {"context": 注入するテキスト, "git": git情報 or None, "cached": bool}
+
+    primer.md が無ければ context は空文字。
+    """
+    project_dir = os.path.abspath(project_dir)
+    git_dirs = find_git_dir(project_dir)
+    key = cache_key(git_dirs)
+    path = _cache_path(project_dir)
+    if use_cache:
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                return {"context": cached["context"], "git": cached["git"], "cached": True}
+        except (OSError, ValueError):
+            pass
+
+    info = collect_git(project_dir, git_dirs[0]) if git_dirs else None
+    try:
+        template = PRIMER_PATH.read_text(encoding="utf-8")
+    except OSError:
+        template = ""
+    context = ""
+    if template:
+        context = (template.rstrip("\n")
+                   .replace("{{GIT_INFO}}", git_info_text(info))
+                   .replace("{{CUSTOM_COMMANDS}}", custom_commands_text()))
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "context": context, "git": info}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return {"context": context, "git": info, "cached": False}
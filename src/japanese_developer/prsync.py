@@ -0,0 +1,324 @@
+"""PRへの作業ログ同期（アウトボックス方式）
+
+pr-log-sync hook は git push を検出するとアウトボックス（~/.gemini/pr-outbox/）に
+同期ジョブを積んで即座に戻り、バックグラウンドのフラッシャーが gh でコメントを投稿する。
+
+- 同じプロジェクト・ブランチへの連続pushは1つのジョブにまとまる（1コメント）
+- コメントには、PRごとに保存したカーソル（最後に投稿したコミット）以降の
+  ジャーナルエントリだけを載せる。ブランチログ全文は貼らない
+- ジャーナルが無いプロジェクト（Markdownのログしか無い旧形式）では git log から集める
+- 投稿に失敗したジョブは指数バックオフで再試行する
+
+gh の実行ファイルは環境変数 JD_GH で差し替えられる（テスト用の偽ghなど）。
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from japanese_developer import worklog
+
+OUTBOX_DIR = Path.home() / ".gemini" / "pr-outbox"
+CURSORS_PATH = OUTBOX_DIR / "cursors.json"
+FLUSH_LOG = OUTBOX_DIR / "flush.log"
+
+# 連続pushをまとめるため、フラッシャーが最初の処理まで待つ秒数
+COALESCE_SECONDS = 3
+
+# 再試行の間隔（秒）: RETRY_BASE * 2^(試行回数-1)、上限 RETRY_MAX
+RETRY_BASE = 30
+RETRY_MAX = 3600
+MAX_ATTEMPTS = 8
+
+# バックグラウンドのフラッシャーが再試行待ちで居残る最大秒数
+FLUSH_MAX_SECONDS = 600
+
+# ジャーナルが無い時に git log から集めるコミットの最大件数
+GIT_FALLBACK_LIMIT = 20
+
+
+def gh_command() -> str:
+    return os.environ.get("JD_GH") or "gh"
+
+
+@contextmanager
+def _lock(name: str, blocking: bool = True):
+    """アウトボックスのロックを取る。blocking=False で取れなければ False を渡す。"""
+    OUTBOX_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTBOX_DIR / name, "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _job_path(project_dir: str, branch: str) -> Path:
+    key = hashlib.sha1(f"{project_dir}\0{branch}".encode()).hexdigest()[:16]
+    return OUTBOX_DIR / f"{key}.json"
+
+
+def _read_json(path: Path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path: Path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def enqueue(project_dir: str, branch: str, author: str) -> dict:
+    """同期ジョブを積む。同じブランチのジョブが残っていればpush回数を増やしてまとめる。"""
+    path = _job_path(project_dir, branch)
+    with _lock(".outbox.lock"):
+        job = _read_json(path, None) or {
+            "project_dir": project_dir,
+            "branch": branch,
+            "author": author,
+            "queued_at": time.time(),
+            "pushes": 0,
+            "attempts": 0,
+            "next_attempt": 0,
+            "last_error": "",
+        }
+        job["pushes"] += 1
+        job["author"] = author
+        # 新しいpushがあれば再試行待ちを解除する
+        job["attempts"] = 0
+        job["next_attempt"] = 0
+        _write_json(path, job)
+    return job
+
+
+def spawn_flusher():
+    """フラッシャーをバックグラウンドで起動する（既に動いていれば起動先ですぐ終了する）。"""
+    subprocess.Popen(
+        [sys.executable, "-m", "japanese_developer.prsync", "flush"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def pending_jobs() -> list:
+    if not OUTBOX_DIR.exists():
+        return []
+    return [(path, _read_json(path, None)) for path in sorted(OUTBOX_DIR.glob("*.json"))
+            if path != CURSORS_PATH]
+
+
+def reset_retries():
+    """再試行待ちのジョブをすぐ送信対象に戻す。"""
+    with _lock(".outbox.lock"):
+        for path, job in pending_jobs():
+            if job and job["next_attempt"]:
+                job["next_attempt"] = 0
+                _write_json(path, job)
+
+
+def _cursor_key(project_dir: str, pr_number: str) -> str:
+    return f"{project_dir}#{pr_number}"
+
+
+def _git_entries(project_dir: str, branch: str, cursor: str) -> list:
+    """git log から、ブランチのコミットのうちカーソルより後のものを古い順に返す。
+
+    カーソルが無い（または辿れない）時は、他のローカルブランチに無いコミットを対象にする。
+    """
+    base = ["git", "-c", "core.quotePath=false", "log", "--reverse", "--name-only",
+            f"--max-count={GIT_FALLBACK_LIMIT}", f"--format={worklog.HISTORY_FORMAT}",
+            worklog.DATE_FORMAT]
+    ranges = [[f"{cursor}..{branch}"]] if cursor else []
+    ranges.append([branch, "--not", f"--exclude={branch}", "--branches"])
+    for revs in ranges:
+        try:
+            result = subprocess.run(base + revs + ["--"], cwd=project_dir,
+                                    capture_output=True, text=True)
+        except OSError:
+            return []
+        if result.returncode == 0:
+            break
+    else:
+        return []
+
+    entries = []
+    for chunk in result.stdout.split("\x01")[1:]:
+        header, _, files = chunk.partition("\n")
+        entry = worklog.parse_commit(header, [line for line in files.splitlines() if line], source=True)
+        entry["branch"] = branch
+        entries.append(entry)
+    return entries
+
+
+def _at_cursor(entry: dict, cursor: str) -> bool:
+    """エントリがカーソルのコミットか。どちらかが短縮ハッシュ（古いジャーナル・カーソル）なら前方一致で比べる。"""
+    commit = entry.get("commit") or entry["hash"]
+    if len(commit) == len(cursor):
+        return commit == cursor
+    shorter, longer = sorted((commit, cursor), key=len)
+    return longer.startswith(shorter)
+
+
+def entries_since(project_dir: str, branch: str, cursor: str) -> list:
+    """ジャーナルから、ブランチのエントリのうちカーソル（コミットハッシュ）より後のものを返す。
+
+    ジャーナルが無ければ git log から集める。
+    """
+    journal = os.path.join(project_dir, "logs", worklog.JOURNAL_NAME)
+    entries = []
+    try:
+        with open(journal, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("branch") != branch:
+                    continue
+                if cursor and _at_cursor(entry, cursor):
+                    entries = []
+                    continue
+                entries.append(entry)
+    except FileNotFoundError:
+        return _git_entries(project_dir, branch, cursor)
+    return entries
+
+
+def comment_body(branch: str, author: str, entries: list, pushes: int) -> str:
+    lines = [
+        f"## 📋 作業ログ更新 ({time.strftime('%Y-%m-%d %H:%M')})",
+        "",
+        f"**ブランチ**: `{branch}`",
+        f"**作業者**: @{author}",
+        "",
+        f"### 今回のコミット（{len(entries)}件" + (f"・push {pushes}回分" if pushes > 1 else "") + "）",
+    ]
+    for entry in entries:
+        lines.append(f"- {entry['hash']}: {entry['subject']}（{entry['time']}）")
+        if entry.get("files"):
+            lines.append(f"  - 変更ファイル: {', '.join(entry['files'])}")
+    return "\n".join(lines)
+
+
+def _gh(project_dir: str, *args: str):
+    return subprocess.run(
+        [gh_command(), *args], cwd=project_dir, capture_output=True, text=True, timeout=60
+    )
+
+
+def _log(message: str):
+    OUTBOX_DIR.mkdir(parents=True, exist_ok=True)
+    with open(FLUSH_LOG, "a", encoding="utf-8") as f:
+        f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}\n")
+
+
+def process_job(job: dict) -> str:
+    """ジョブを1件処理して結果のメッセージを返す。再試行すべき失敗は例外を送出する。"""
+    project_dir, branch = job["project_dir"], job["branch"]
+    try:
+        view = _gh(project_dir, "pr", "view", branch, "--json", "number", "-q", ".number")
+    except FileNotFoundError:
+        return "gh コマンドが見つかりません"
+    pr_number = view.stdout.strip() if view.returncode == 0 else ""
+    if not pr_number or pr_number == "null":
+        if view.returncode != 0 and "no pull requests found" not in view.stderr.lower():
+            raise RuntimeError(view.stderr.strip() or "gh pr view に失敗")
+        return "PRが見つかりません、スキップ"
+
+    cursors = _read_json(CURSORS_PATH, {})
+    key = _cursor_key(project_dir, pr_number)
+    entries = entries_since(project_dir, branch, cursors.get(key, ""))
+    if not entries:
+        return "新しいログエントリなし"
+
+    body = comment_body(branch, job["author"], entries, job["pushes"])
+    posted = _gh(project_dir, "pr", "comment", pr_number, "--body", body)
+    if posted.returncode != 0:
+        raise RuntimeError(posted.stderr.strip() or "gh pr comment に失敗")
+
+    with _lock(".outbox.lock"):
+        cursors = _read_json(CURSORS_PATH, {})
+        cursors[key] = entries[-1].get("commit") or entries[-1]["hash"]
+        _write_json(CURSORS_PATH, cursors)
+    return f"PR #{pr_number} にログコメントを投稿（{len(entries)}件）"
+
+
+def flush(wait: bool = True) -> list:
+    """アウトボックスのジョブを処理する。別のフラッシャーが動いていれば何もしない。
+
+    wait=True では連続pushを待ってから処理し、再試行待ちのジョブが残っていれば
+    FLUSH_MAX_SECONDS まで居残って再試行する。処理結果の (ブランチ, 結果) のリストを返す。
+    """
+    results = []
+    with _lock(".flush.lock", blocking=False) as acquired:
+        if not acquired:
+            return results
+        started = time.time()
+        if wait:
+            time.sleep(COALESCE_SECONDS)
+        while True:
+            next_retry = None
+            for path, job in pending_jobs():
+                if job is None:
+                    path.unlink(missing_ok=True)
+                    continue
+                if job["next_attempt"] > time.time():
+                    next_retry = min(next_retry or job["next_attempt"], job["next_attempt"])
+                    continue
+                try:
+                    result = process_job(job)
+                    error = ""
+                except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+                    result, error = "", str(e)
+
+                with _lock(".outbox.lock"):
+                    current = _read_json(path, None)
+                    if error:
+                        current = current or job
+                        current["attempts"] += 1
+                        current["last_error"] = error
+                        if current["attempts"] >= MAX_ATTEMPTS:
+                            path.unlink(missing_ok=True)
+                            result = f"断念: {error}"
+                        else:
+                            delay = min(RETRY_BASE * 2 ** (current["attempts"] - 1), RETRY_MAX)
+                            current["next_attempt"] = time.time() + delay
+                            _write_json(path, current)
+                            result = f"再試行予定（{delay}秒後）: {error}"
+                            next_retry = min(next_retry or current["next_attempt"], current["next_attempt"])
+                    elif current and current["pushes"] != job["pushes"]:
+                        # 処理中に新しいpushが積まれたら、ジョブを残して次のループで送る
+                        pass
+                    else:
+                        path.unlink(missing_ok=True)
+                _log(f"{job['project_dir']} [{job['branch']}] {result}")
+                results.append((job["branch"], result))
+
+            remaining = [job for _, job in pending_jobs() if job]
+            if not remaining or not wait:
+                break
+            if next_retry is None:
+                continue
+            if next_retry - started > FLUSH_MAX_SECONDS:
+                break
+            time.sleep(max(0, next_retry - time.time()))
+    return results
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["flush"]:
+    flush()
@@ -0,0 +1,140 @@
+"""~/.gemini/settings.json のトランザクション更新
+
+setup・uninstall・termux-setup は update() を通して settings.json を書き換える。
+
+1. ~/.gemini/.settings.lock の排他ロック（flock）を取る
+2. settings.json を読み、変更関数を適用する
+3. 同じディレクトリの一時ファイルに書き、fsync してから rename で置き換える
+
+途中で落ちても settings.json が切り詰められることはなく、
+複数のプロセスが同時に setup しても変更が失われない。
+ロックは settings.json 自体ではなく別ファイルに取る（rename で inode が変わるため）。
+"""
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+SETTINGS_PATH = Path.home() / ".gemini" / "settings.json"
+LOCK_NAME = ".settings.lock"
+
+
+@contextmanager
+def _locked(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.parent / LOCK_NAME, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def read(path: Path = None) -> dict:
+    """settings.json を読む。無ければ空のdict。"""
+    path = path or SETTINGS_PATH
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write(path: Path, data: dict):
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    # rename自体を永続化する
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def update(mutate, path: Path = None) -> dict:
+    """ロックを取って settings.json に mutate(settings) を適用し、原子的に書き戻す。
+
+    mutate は dict をその場で変更するか、新しい dict を返す。
+    内容が変わらなければ書き込まない。更新後の設定を返す。
+    """
+    path = path or SETTINGS_PATH
+    with _locked(path):
+        current = read(path)
+        before = json.dumps(current, sort_keys=True)
+        updated = mutate(current)
+        if updated is None:
+            updated = current
+        if json.dumps(updated, sort_keys=True) != before or not path.exists():
+            _write(path, updated)
+    return updated
+
+
+def merge_hooks(existing: dict, new_hooks: dict, replace: bool = False) -> dict:
+    """既存の設定にhook定義をマージする。既存hookは保持。
+
+    (イベント, hook名) の索引を1回作り、新しいhookごとに引く。
+    replace=True の場合、同名の既存hookは新しい定義で置き換える
+    （bashスクリプト版とPython版の切り替えに使う）。
+    """
+    hooks = existing.setdefault("hooks", {})
+    index = {
+        (event, h.get("name", "")): h
+        for event, groups in hooks.items()
+        for group in groups
+        for h in group.get("hooks", [])
+    }
+
+    for event, hook_groups in new_hooks.items():
+        groups = hooks.setdefault(event, [])
+        for group in hook_groups:
+            fresh = []
+            for h in group.get("hooks", []):
+                key = (event, h.get("name", ""))
+                current = index.get(key)
+                if current is None:
+                    fresh.append(h)
+                    index[key] = h
+                elif replace:
+                    current.update(h)
+            # 重複しないhookだけ追加
+            if fresh:
+                groups.append({**group, "hooks": fresh})
+    return existing
+
+
+def remove_hooks(existing: dict, names) -> dict:
+    """指定した名前のhookを取り除く。空になったグループ・イベントも削除する。"""
+    names = set(names)
+    hooks = existing.get("hooks")
+    if hooks is None:
+        return existing
+    for event in list(hooks):
+        groups = []
+        for group in hooks[event]:
+            group["hooks"] = [h for h in group.get("hooks", []) if h.get("name", "") not in names]
+            if group["hooks"]:
+                groups.append(group)
+        if groups:
+            hooks[event] = groups
+        else:
+            del hooks[event]
+    if not hooks:
+        del existing["hooks"]
+    return existing
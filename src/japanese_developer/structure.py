@@ -0,0 +1,213 @@
+"""HTML/CSSの構造チェッカー（ストリーミング・1パス）
+
+ファイルをチャンク単位で読みながらタグ・括弧のスタックを保持し、最初に見つかった
+対応の崩れを行・列付きで報告する。保持するのはスタックと読みかけのチャンクだけなので、
+数MBの生成HTMLバンドルでもメモリ使用量は一定。
+"""
+
+import re
+from html.parser import HTMLParser
+
+CHUNK_SIZE = 64 * 1024
+
+# 閉じタグを持たない要素
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link",
+    "meta", "param", "source", "track", "wbr", "basefont", "bgsound", "frame", "command",
+})
+
+# 閉じタグを省略できる要素（親の閉じタグで暗黙に閉じられる）
+OPTIONAL_END = frozenset({
+    "html", "head", "body", "p", "li", "dt", "dd", "tr", "td", "th", "thead", "tbody",
+    "tfoot", "option", "optgroup", "rb", "rp", "rt", "rtc", "colgroup", "caption",
+})
+
+
+class _Mismatch(Exception):
+    def __init__(self, line: int, col: int, message: str):
+        super().__init__(message)
+        self.line = line
+        self.col = col
+        self.message = message
+
+
+class _TagStackParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        # <p> の中で <p> が始まる・<li> の後に <li> が続く等は前の要素が暗黙に閉じる
+        if tag in OPTIONAL_END and self.stack and self.stack[-1][0] == tag:
+            self.stack.pop()
+        line, offset = self.getpos()
+        self.stack.append((tag, line, offset + 1))
+
+    def handle_endtag(self, tag):
+        line, offset = self.getpos()
+        if tag in VOID_ELEMENTS:
+            return
+        if self.stack and self.stack[-1][0] == tag:
+            self.stack.pop()
+            return
+
+        depth = next((i for i in range(len(self.stack) - 1, -1, -1) if self.stack[i][0] == tag), None)
+        if depth is None:
+            raise _Mismatch(line, offset + 1, f"</{tag}> に対応する開きタグがありません")
+        unclosed = [entry for entry in self.stack[depth + 1:] if entry[0] not in OPTIONAL_END]
+        if unclosed:
+            name, open_line, open_col = unclosed[-1]
+            raise _Mismatch(
+                line, offset + 1,
+                f"</{tag}> の前に <{name}>（{open_line}:{open_col}）が閉じられていません",
+            )
+        del self.stack[depth:]
+
+
+def check_html(path: str) -> str:
+    """HTMLのタグ対応をチェックする。エラーなしは空文字。"""
+    parser = _TagStackParser()
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), ""):
+                parser.feed(chunk)
+        parser.close()
+    except _Mismatch as e:
+        return f"HTML構文エラー: {path}:{e.line}:{e.col}: {e.message}"
+
+    unclosed = [entry for entry in parser.stack if entry[0] not in OPTIONAL_END]
+    if unclosed:
+        name, line, col = unclosed[-1]
+        return f"HTML構文エラー: {path}:{line}:{col}: <{name}> が閉じられていません"
+    return ""
+
+
+_PAIRS = {"}": "{", ")": "(", "]": "["}
+
+# 状態ごとに「次に意味のある文字」を探す正規表現
+_NORMAL = re.compile(r"""url\(\s*(?!["'\s])|/\*|//|\\[\s\S]|[{}()\[\]"'\n]""", re.I)
+_NORMAL_CSS = re.compile(r"""url\(\s*(?!["'\s])|/\*|\\[\s\S]|[{}()\[\]"'\n]""", re.I)
+_STRING = re.compile(r"""\\[\s\S]|["'\n]""")
+_COMMENT = re.compile(r"\*/|\n")
+_LINE_COMMENT = re.compile(r"\n")
+_URL = re.compile(r"[)\n]")
+
+# チャンク末尾で途切れる可能性のあるトークン（url( の後の空白含む）の最大長
+_CARRY = 16
+
+
+class _CssTokenizer:
+    """CSS/SCSSの括弧・文字列・コメントを追う最小限のトークナイザ"""
+
+    def __init__(self, scss: bool):
+        self.normal = _NORMAL if scss else _NORMAL_CSS
+        self.state = "normal"
+        self.quote = ""
+        self.stack = []
+        self.opened_at = (1, 1)
+        self.line = 1
+        self.line_start = 0  # 現在行の先頭の絶対オフセット
+        self.base = 0  # バッファ先頭の絶対オフセット
+
+    def _pos(self, index: int):
+        return self.line, self.base + index - self.line_start + 1
+
+    def _newline(self, index: int):
+        self.line += 1
+        self.line_start = self.base + index + 1
+
+    def _search(self, pattern, buf: str, pos: int, final: bool):
+        """次のトークンを探す。チャンク末尾で途切れている可能性があればNoneを返す。"""
+        m = pattern.search(buf, pos)
+        if not final and (m is None or m.start() >= len(buf) - _CARRY):
+            return None
+        return m
+
+    def feed(self, buf: str, final: bool) -> int:
+        """bufを処理し、処理できた文字数を返す。残りは次のチャンクの先頭に回す。"""
+        pos = 0
+        while True:
+            pattern = {
+                "normal": self.normal, "string": _STRING, "comment": _COMMENT,
+                "line_comment": _LINE_COMMENT, "url": _URL,
+            }[self.state]
+            m = self._search(pattern, buf, pos, final)
+            if m is None:
+                # トークンの無い範囲は読み飛ばし、途切れている可能性のある末尾だけ持ち越す
+                return len(buf) if final else max(pos, len(buf) - _CARRY)
+            token = m.group()
+            pos = m.end()
+
+            if self.state == "normal":
+                if token == "\n":
+                    self._newline(m.start())
+                elif token in "{([":
+                    self.stack.append((token, *self._pos(m.start())))
+                elif token in "})]":
+                    if not self.stack:
+                        raise _Mismatch(*self._pos(m.start()), f"'{token}' に対応する開き括弧がありません")
+                    opener, line, col = self.stack.pop()
+                    if opener != _PAIRS[token]:
+                        raise _Mismatch(
+                            *self._pos(m.start()),
+                            f"'{token}' が '{opener}'（{line}:{col}）と対応しません",
+                        )
+                elif token in ("'", '"'):
+                    self.state, self.quote = "string", token
+                    self.opened_at = self._pos(m.start())
+                elif token == "/*":
+                    self.state = "comment"
+                    self.opened_at = self._pos(m.start())
+                elif token == "//":
+                    self.state = "line_comment"
+                elif token.lower().startswith("url("):
+                    self.state = "url"
+                    self.opened_at = self._pos(m.start())
+            elif self.state == "string":
+                if token == "\n":
+                    raise _Mismatch(*self.opened_at, "文字列が閉じられていません")
+                if token == self.quote:
+                    self.state = "normal"
+                elif token == "\\\n":
+                    self._newline(m.start() + 1)
+            elif token == "\n":
+                self._newline(m.start())
+                if self.state == "line_comment":
+                    self.state = "normal"
+                elif self.state == "url":
+                    raise _Mismatch(*self.opened_at, "url( が閉じられていません")
+            else:
+                self.state = "normal"
+
+    def finish(self):
+        if self.state == "string":
+            raise _Mismatch(*self.opened_at, "文字列が閉じられていません")
+        if self.state == "comment":
+            raise _Mismatch(*self.opened_at, "コメント /* が閉じられていません")
+        if self.state == "url":
+            raise _Mismatch(*self.opened_at, "url( が閉じられていません")
+        if self.stack:
+            opener, line, col = self.stack[-1]
+            raise _Mismatch(line, col, f"'{opener}' が閉じられていません")
+
+
+def check_css(path: str) -> str:
+    """CSS/SCSSの括弧の対応をチェックする。エラーなしは空文字。"""
+    tokenizer = _CssTokenizer(scss=path.lower().endswith(".scss"))
+    buf = ""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                buf += chunk
+                done = tokenizer.feed(buf, final=not chunk)
+                tokenizer.base += done
+                buf = buf[done:]
+                if not chunk:
+                    break
+        tokenizer.finish()
+    except _Mismatch as e:
+        return f"CSS構文エラー: {path}:{e.line}:{e.col}: {e.message}"
+    return ""
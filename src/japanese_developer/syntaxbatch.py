@@ -0,0 +1,130 @@
+"""syntax-check のまとめ処理（スプール + リーダー）
+
+Vite プロジェクトの雛形作成のように短時間に多数のファイルが書かれると、
+syntax-check hook がファイルごとに起動してそれぞれ systemMessage を返し、
+コンテキストが埋まってしまう。そこで書き込みイベントをスプール
+（~/.gemini/cache/syntax-spool/）に積み、まとめてチェックする。
+
+- 書き込みのたびにスプールへ1行追記し、リーダーのロックを取れた hook だけが
+  スプールが空になるまで取り出してはチェックし、結果を1つのメッセージで報告する。
+  単発の書き込みは待たずにその場でチェックする
+- ロックを取れなかった hook（リーダーのチェック中に来た書き込み）は何も出さずに終わる。
+  そのファイルはリーダーが続けてチェックする
+- エージェントのターンの終わり（AfterAgent）には、残っている分をチェックする
+
+環境変数 JD_SYNTAX_WINDOW（秒）を指定すると、リーダーは最後の追記からその秒数
+新しい書き込みが無くなるまで待ってから取り出す（既定は 0 = 待たない）。
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+SPOOL_DIR = Path.home() / ".gemini" / "cache" / "syntax-spool"
+
+# 最後の書き込みからこの秒数、次の書き込みが無ければバーストの終わりとみなす
+WINDOW = 0.0
+
+# リーダーが待つ・チェックし続ける最長の秒数（hooks.json の timeout より十分短くする）
+MAX_WAIT = 5.0
+
+
+def window() -> float:
+    try:
+        return max(0.0, float(os.environ.get("JD_SYNTAX_WINDOW", WINDOW)))
+    except ValueError:
+        return WINDOW
+
+
+def _spool_path(project_dir: str) -> Path:
+    key = hashlib.sha1(os.path.realpath(project_dir).encode()).hexdigest()[:16]
+    return SPOOL_DIR / f"{key}.jsonl"
+
+
+@contextmanager
+def _lock(path: Path, blocking: bool = True):
+    """ロックを取る。blocking=False で取れなければ False を渡す。"""
+    with open(path, "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def add(project_dir: str, path: str):
+    """書き込まれたファイルをスプールに積む。"""
+    spool = _spool_path(project_dir)
+    spool.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps({"path": path, "ts": round(time.time(), 3)}, ensure_ascii=False) + "\n"
+    # 取り出し（rename → 読み込み）と追記が交差しないよう、短いロックを取る
+    with _lock(spool.with_suffix(".lock")):
+        with open(spool, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _take(spool: Path) -> list:
+    """スプールを空にして、積まれていたパスを（重複を除いて積んだ順に）返す。"""
+    with _lock(spool.with_suffix(".lock")):
+        try:
+            with open(spool, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        spool.unlink()
+    paths = []
+    for line in lines:
+        try:
+            paths.append(json.loads(line)["path"])
+        except (ValueError, KeyError):
+            continue
+    return list(dict.fromkeys(paths))
+
+
+def _wait_quiet(spool: Path, quiet: float, deadline: float):
+    """最後の追記から quiet 秒経つか、deadline（monotonic）を過ぎるまで待つ。"""
+    while True:
+        try:
+            idle = time.time() - spool.stat().st_mtime
+        except FileNotFoundError:
+            return
+        remaining = min(quiet - idle, deadline - time.monotonic())
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, 0.05))
+
+
+def collect(project_dir: str, check, quiet: float = None, max_wait: float = MAX_WAIT):
+    """リーダーになれればスプールが空になるまで取り出して check(パスのリスト) を呼ぶ。
+
+    check の結果（path → エラー内容）をまとめた辞書を返す。
+    他の hook がリーダーなら None を返す（そちらがまとめて報告する）。
+    """
+    spool = _spool_path(project_dir)
+    spool.parent.mkdir(parents=True, exist_ok=True)
+    quiet = window() if quiet is None else quiet
+    deadline = time.monotonic() + max_wait
+    results = None
+    while True:
+        with _lock(spool.with_suffix(".leader"), blocking=False) as leader:
+            if not leader:
+                return results
+            results = results or {}
+            # チェック中に積まれた分も、ロックを持ったまま続けてチェックする
+            while time.monotonic() < deadline:
+                _wait_quiet(spool, quiet, deadline)
+                paths = _take(spool)
+                if not paths:
+                    break
+                results.update(check(paths))
+        # ロックを離す直前に積まれた分は、その hook がロックを取れずに終わっている場合がある
+        if not spool.exists() or time.monotonic() >= deadline:
+            return results
@@ -0,0 +1,338 @@
+"""GitHub Issues のローカルミラー（`japanese-developer tasks`）
+
+/task コマンドの一覧表示のたびに gh issue list でネットワークへ問い合わせる代わりに、
+Issue とラベルを ~/.gemini/cache/tasks.db（SQLite）へミラーしておき、一覧は
+ローカルから即座に返す（オフラインでも動く）。
+
+- 同期は差分: Issue は updated_at のカーソル（since）、ラベルは ETag で取得する
+- 追加・クローズ・ラベル変更はキューに積んでローカルにも反映し、
+  接続できたときに古い順に送信する（sync の先頭でも送信する）
+
+GitHub API との通信は github.Client（ベースURL・トークンの決め方はそちらを参照）。
+"""
+
+import json
+import re
+import sqlite3
+import subprocess
+import time
+import urllib.parse
+from pathlib import Path
+
+from japanese_developer.github import ApiError, Client
+
+DB_PATH = Path.home() / ".gemini" / "cache" / "tasks.db"
+
+PER_PAGE = 100
+
+# キューの操作
+ADD = "add"
+CLOSE = "close"
+EDIT = "edit"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL,
+    labels TEXT NOT NULL DEFAULT '[]',
+    assignees TEXT NOT NULL DEFAULT '[]',
+    author TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (repo, number)
+);
+CREATE TABLE IF NOT EXISTS labels (
+    repo TEXT NOT NULL,
+    name TEXT NOT NULL,
+    color TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (repo, name)
+);
+CREATE TABLE IF NOT EXISTS sync (
+    repo TEXT PRIMARY KEY,
+    since TEXT NOT NULL DEFAULT '',
+    labels_etag TEXT NOT NULL DEFAULT '',
+    login TEXT NOT NULL DEFAULT '',
+    synced_at REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    repo TEXT NOT NULL,
+    action TEXT NOT NULL,
+    number INTEGER,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT NOT NULL DEFAULT ''
+);
+"""
+
+
+def connect(path: Path = None) -> sqlite3.Connection:
+    path = path or DB_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, timeout=10)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+# --- リポジトリ・認証 ---
+
+_REMOTE = re.compile(r"github\.com[:/](?P<repo>[^/\s]+/[^/\s]+?)(?:\.git)?/?$")
+
+
+def detect_repo(project_dir: str) -> str:
+    """origin のURLから owner/repo を返す。GitHubのリポジトリでなければ空文字。"""
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"], cwd=project_dir, capture_output=True, text=True
+        )
+    except OSError:
+        return ""
+    match = _REMOTE.search(result.stdout.strip())
+    return match.group("repo") if match else ""
+
+
+# --- 同期 ---
+
+def _sync_row(db, repo: str):
+    row = db.execute("SELECT * FROM sync WHERE repo = ?", (repo,)).fetchone()
+    if row is None:
+        db.execute("INSERT INTO sync (repo) VALUES (?)", (repo,))
+        row = db.execute("SELECT * FROM sync WHERE repo = ?", (repo,)).fetchone()
+    return row
+
+
+def _store_issue(db, repo: str, issue: dict):
+    db.execute(
+        "INSERT OR REPLACE INTO issues"
+        " (repo, number, title, body, state, labels, assignees, author, updated_at, url)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            repo, issue["number"], issue["title"], issue.get("body") or "", issue["state"],
+            json.dumps([label["name"] for label in issue.get("labels", [])], ensure_ascii=False),
+            json.dumps([a["login"] for a in issue.get("assignees", [])]),
+            (issue.get("user") or {}).get("login", ""),
+            issue.get("updated_at", ""), issue.get("html_url", ""),
+        ),
+    )
+
+
+def sync(db, repo: str, client: Client) -> dict:
+    """キューを送信してから、前回のカーソル以降に更新された Issue とラベルを取り込む。"""
+    sent, failed = replay(db, repo, client)
+    state = _sync_row(db, repo)
+    login = _login(db, repo, client)
+
+    path = f"/repos/{repo}/issues?state=all&sort=updated&direction=asc&per_page={PER_PAGE}"
+    if state["since"]:
+        path += f"&since={state['since']}"
+    issues, _ = client.pages(path)
+    since = state["since"]
+    updated = 0
+    for issue in issues:
+        # Issues API はPRも返すので除く
+        if "pull_request" in issue:
+            continue
+        _store_issue(db, repo, issue)
+        updated += 1
+        since = max(since, issue.get("updated_at", ""))
+
+    labels, labels_etag = client.pages(f"/repos/{repo}/labels?per_page={PER_PAGE}", etag=state["labels_etag"])
+    if labels is not None:
+        db.execute("DELETE FROM labels WHERE repo = ?", (repo,))
+        db.executemany(
+            "INSERT INTO labels (repo, name, color, description) VALUES (?, ?, ?, ?)",
+            [(repo, label["name"], label.get("color", ""), label.get("description") or "") for label in labels],
+        )
+
+    db.execute(
+        "UPDATE sync SET since = ?, labels_etag = ?, login = ?, synced_at = ? WHERE repo = ?",
+        (since, labels_etag, login, time.time(), repo),
+    )
+    db.commit()
+    return {"sent": sent, "failed": failed, "updated": updated, "labels_changed": labels is not None}
+
+
+def last_synced(db, repo: str) -> float:
+    row = db.execute("SELECT synced_at FROM sync WHERE repo = ?", (repo,)).fetchone()
+    return row["synced_at"] if row else 0
+
+
+# --- 一覧 ---
+
+def _issue_dict(row) -> dict:
+    return {
+        "number": row["number"],
+        "title": row["title"],
+        "state": row["state"],
+        "labels": json.loads(row["labels"]),
+        "assignees": json.loads(row["assignees"]),
+        "author": row["author"],
+        "updated_at": row["updated_at"],
+        "url": row["url"],
+        "pending": row["number"] < 0,
+    }
+
+
+def list_issues(db, repo: str, state: str = "open", label: str = None, mine: bool = False) -> list:
+    """ミラーから Issue を返す（新しい順）。未送信の追加は番号が負の値になる。"""
+    rows = db.execute(
+        "SELECT * FROM issues WHERE repo = ? AND (? = 'all' OR state = ?) ORDER BY updated_at DESC, number DESC",
+        (repo, state, state),
+    ).fetchall()
+    issues = [_issue_dict(row) for row in rows]
+    if label:
+        issues = [i for i in issues if label in i["labels"]]
+    if mine:
+        login = _sync_row(db, repo)["login"]
+        issues = [i for i in issues if login and login in i["assignees"]]
+    return issues
+
+
+def get_issue(db, repo: str, number: int):
+    row = db.execute("SELECT * FROM issues WHERE repo = ? AND number = ?", (repo, number)).fetchone()
+    if row is None:
+        return None
+    issue = _issue_dict(row)
+    issue["body"] = row["body"]
+    return issue
+
+
+def list_labels(db, repo: str) -> list:
+    rows = db.execute("SELECT name, color, description FROM labels WHERE repo = ? ORDER BY name", (repo,))
+    return [dict(row) for row in rows]
+
+
+# --- 書き込みキュー ---
+
+def _now_iso() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def enqueue(db, repo: str, action: str, number: int = None, **payload) -> int:
+    """操作をキューに積み、ミラーにも先に反映する。キューのidを返す。"""
+    cur = db.execute(
+        "INSERT INTO queue (repo, action, number, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+        (repo, action, number, json.dumps(payload, ensure_ascii=False), time.time()),
+    )
+    job_id = cur.lastrowid
+    if action == ADD:
+        login = _sync_row(db, repo)["login"]
+        _store_issue(db, repo, {
+            "number": -job_id, "title": payload["title"], "body": payload.get("body", ""),
+            "state": "open", "labels": [{"name": n} for n in payload.get("labels", [])],
+            "assignees": [{"login": login}] if login else [], "user": {"login": login},
+            "updated_at": _now_iso(),
+        })
+    else:
+        issue = get_issue(db, repo, number)
+        if issue is not None:
+            labels = [n for n in issue["labels"] if n not in payload.get("remove_labels", [])]
+            labels += [n for n in payload.get("add_labels", []) if n not in labels]
+            db.execute(
+                "UPDATE issues SET state = ?, labels = ?, updated_at = ? WHERE repo = ? AND number = ?",
+                ("closed" if action == CLOSE else issue["state"], json.dumps(labels, ensure_ascii=False),
+                 _now_iso(), repo, number),
+            )
+    db.commit()
+    return job_id
+
+
+def pending(db, repo: str = None) -> list:
+    rows = db.execute(
+        "SELECT * FROM queue WHERE (? IS NULL OR repo = ?) ORDER BY id", (repo, repo)
+    ).fetchall()
+    return [dict(row, payload=json.loads(row["payload"])) for row in rows]
+
+
+def _login(db, repo: str, client: Client) -> str:
+    """トークンのユーザー名（ミラーに保存したものを使い、無ければ /user から取る）
+
+    トークンが無い・権限が無い（401等）時は空文字を返す。公開リポジトリの同期は続けられる。
+    """
+    login = _sync_row(db, repo)["login"]
+    if not login:
+        try:
+            _, user, _ = client.request("GET", "/user")
+        except ApiError:
+            return ""
+        login = (user or {}).get("login", "")
+        db.execute("UPDATE sync SET login = ? WHERE repo = ?", (login, repo))
+    return login
+
+
+def _send(db, client: Client, job: dict):
+    repo, number, payload = job["repo"], job["number"], job["payload"]
+    if job["action"] == ADD:
+        body = {"title": payload["title"], "body": payload.get("body", ""), "labels": payload.get("labels", [])}
+        login = _login(db, repo, client) if payload.get("assign_self") else ""
+        if login:
+            body["assignees"] = [login]
+        _, issue, _ = client.request("POST", f"/repos/{repo}/issues", body)
+        return issue
+    if job["action"] == CLOSE:
+        if payload.get("comment"):
+            client.request("POST", f"/repos/{repo}/issues/{number}/comments", {"body": payload["comment"]})
+        _, issue, _ = client.request("PATCH", f"/repos/{repo}/issues/{number}", {"state": "closed"})
+        return issue
+    for name in payload.get("remove_labels", []):
+        try:
+            client.request("DELETE", f"/repos/{repo}/issues/{number}/labels/{urllib.parse.quote(name)}")
+        except ApiError:
+            pass  # 付いていないラベルの削除は404になる
+    if payload.get("add_labels"):
+        client.request("POST", f"/repos/{repo}/issues/{number}/labels", {"labels": payload["add_labels"]})
+    _, issue, _ = client.request("GET", f"/repos/{repo}/issues/{number}")
+    return issue
+
+
+def replay(db, repo: str, client: Client):
+    """キューを古い順に送信する。(送信できた件数, 失敗した件数) を返す。
+
+    接続できなければ OfflineError を送出し、残りはキューに残る。
+    API エラーは記録して次の操作へ進む（順序を保つため同じIssueへの後続操作は止める）。
+    """
+    sent = failed = 0
+    blocked = set()
+    for job in pending(db, repo):
+        if job["number"] in blocked:
+            continue
+        try:
+            issue = _send(db, client, job)
+        except ApiError as e:
+            db.execute(
+                "UPDATE queue SET attempts = attempts + 1, last_error = ? WHERE id = ?", (str(e), job["id"])
+            )
+            db.commit()
+            blocked.add(job["number"])
+            failed += 1
+            continue
+        db.execute("DELETE FROM queue WHERE id = ?", (job["id"],))
+        if job["action"] == ADD:
+            db.execute("DELETE FROM issues WHERE repo = ? AND number = ?", (repo, -job["id"]))
+        if issue:
+            _store_issue(db, repo, issue)
+        db.commit()
+        sent += 1
+    return sent, failed
+
+
+def discard(db, job_id: int) -> bool:
+    """キューから操作を取り消す（未送信の追加はミラーからも消す）。"""
+    row = db.execute("SELECT repo, action FROM queue WHERE id = ?", (job_id,)).fetchone()
+    if row is None:
+        return False
+    db.execute("DELETE FROM queue WHERE id = ?", (job_id,))
+    if row["action"] == ADD:
+        db.execute("DELETE FROM issues WHERE repo = ? AND number = ?", (row["repo"], -job_id))
+    else:
+        # ミラーに先に反映した変更を戻すため、次の sync で全件取り直す
+        db.execute("UPDATE sync SET since = '' WHERE repo = ?", (row["repo"],))
+    db.commit()
+    return True
@@ -0,0 +1,154 @@
+"""hook実行の記録（テレメトリ）
+
+Python版hookの実行ごとに ~/.gemini/telemetry.jsonl へ1行追記する。
+`japanese-developer stats` で集計する。
+
+記録: {"ts", "hook", "event", "tool", "ms", "decision", "code"}
+（拒否時は "rule"、ガードのルールid も付く）
+
+常時有効にしておけるよう、記録は O_APPEND で開いた1回の write だけで行う
+（数十µs）。ファイルが MAX_BYTES を超えたら telemetry.1.jsonl … へずらし、
+KEEP 世代まで残す。ずらす時だけ telemetry.lock の flock を取る。JD_NO_TELEMETRY=1 で無効。
+
+hookの高速パスからimportされるため、標準ライブラリの軽いモジュールだけを使うこと。
+"""
+
+import fcntl
+import json
+import os
+import time
+
+TELEMETRY_PATH = os.path.join(os.path.expanduser("~"), ".gemini", "telemetry.jsonl")
+
+# ローテーションする大きさと残す世代数
+MAX_BYTES = 2 * 1024 * 1024
+KEEP = 3
+
+
+def enabled() -> bool:
+    return not os.environ.get("JD_NO_TELEMETRY")
+
+
+def _rotated(n: int, path: str = TELEMETRY_PATH) -> str:
+    base, ext = os.path.splitext(path)
+    return f"{base}.{n}{ext}"
+
+
+def _rotate(path: str, written: os.stat_result):
+    """書き込んだファイル（written）が上限を超えていれば世代をずらす。
+
+    同時に上限を超えた別のhookが先にずらしていれば何もしない
+    （ずらした後の新しいファイルをさらにずらさない）。
+    """
+    with open(os.path.splitext(path)[0] + ".lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            current = os.stat(path)
+        except FileNotFoundError:
+            return
+        if (current.st_dev, current.st_ino) != (written.st_dev, written.st_ino):
+            return
+        for n in range(KEEP - 1, 0, -1):
+            src = _rotated(n, path)
+            if os.path.exists(src):
+                os.replace(src, _rotated(n + 1, path))
+        os.replace(path, _rotated(1, path))
+
+
+def record(hook: str, payload: dict, ms: float, response, code: int, extra: dict = None):
+    """hook実行を1件記録する。記録の失敗でhookを止めないよう、OSErrorは無視する。"""
+    entry = {
+        "ts": round(time.time(), 3),
+        "hook": hook,
+        "event": payload.get("hook_event_name", ""),
+        "tool": payload.get("tool_name", ""),
+        "ms": round(ms, 3),
+        "decision": (response or {}).get("decision", ""),
+        "code": code,
+    }
+    if extra:
+        entry.update(extra)
+    line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+    try:
+        try:
+            fd = os.open(TELEMETRY_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(TELEMETRY_PATH), exist_ok=True)
+            fd = os.open(TELEMETRY_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # 1行を1回の write で書くので、並行するhookの行が混ざらない
+            os.write(fd, line)
+            written = os.fstat(fd)
+        finally:
+            os.close(fd)
+        if written.st_size > MAX_BYTES:
+            _rotate(TELEMETRY_PATH, written)
+    except OSError:
+        pass
+
+
+def load(path: str = TELEMETRY_PATH, since: float = 0) -> list:
+    """記録を古い順に読む（ローテーション済みの世代も含む）。since はUNIX時刻。"""
+    entries = []
+    for p in [_rotated(n, path) for n in range(KEEP, 0, -1)] + [path]:
+        try:
+            with open(p, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get("ts", 0) >= since:
+                        entries.append(entry)
+        except FileNotFoundError:
+            continue
+    return entries
+
+
+# レイテンシのヒストグラムの区切り（ミリ秒）
+BUCKETS = (1, 5, 10, 50, 100, 500, 1000)
+
+
+def _bucket_label(i: int) -> str:
+    if i == 0:
+        return f"<{BUCKETS[0]}ms"
+    if i == len(BUCKETS):
+        return f"≥{BUCKETS[-1]}ms"
+    return f"{BUCKETS[i - 1]}-{BUCKETS[i]}ms"
+
+
+def summarize(entries: list, top: int = 5) -> dict:
+    """hookごとの件数・パーセンタイル・ヒストグラム、拒否理由の件数、遅い呼び出しを集計する。"""
+    by_hook = {}
+    for entry in entries:
+        by_hook.setdefault(entry.get("hook", "?"), []).append(entry)
+
+    hooks = {}
+    for name, items in sorted(by_hook.items()):
+        times = sorted(e.get("ms", 0) for e in items)
+        histogram = [0] * (len(BUCKETS) + 1)
+        for ms in times:
+            histogram[sum(1 for b in BUCKETS if ms >= b)] += 1
+        hooks[name] = {
+            "count": len(items),
+            "p50_ms": times[(len(times) - 1) // 2],
+            "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))],
+            "max_ms": times[-1],
+            "errors": sum(1 for e in items if e.get("code")),
+            "denies": sum(1 for e in items if e.get("decision") == "deny"),
+            "histogram": {_bucket_label(i): n for i, n in enumerate(histogram) if n},
+        }
+
+    denies = {}
+    for entry in entries:
+        if entry.get("decision") == "deny":
+            rule = entry.get("rule") or "?"
+            denies[rule] = denies.get(rule, 0) + 1
+
+    slowest = sorted(entries, key=lambda e: e.get("ms", 0), reverse=True)[:top]
+    return {
+        "total": len(entries),
+        "hooks": hooks,
+        "denies": dict(sorted(denies.items(), key=lambda kv: -kv[1])),
+        "slowest": slowest,
+    }
@@ -2,7 +2,14 @@
 # AfterTool hook: git commit 検出後にログを自動記録
 # - logs/WORK_LOG.md（統合ログ）に追記
 # - logs/<branch>_<author>.md（ブランチログ）に追記
+# japanese-developer が入っていれば、ジャーナル（logs/.worklog.jsonl）経由で記録する
+# （pr-log-sync・log search はジャーナルを読む）
 input=$(cat)
+
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer hook auto-worklog <<<"$input"
+fi
+
 command=$(echo "$input" | jq -r '.tool_input.command // .tool_input.content // ""')
 
 # git commit コマンドかチェック
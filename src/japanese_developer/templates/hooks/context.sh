@@ -0,0 +1,25 @@
+#!/usr/bin/env bash
+# SessionStart hook: 言語ルール・プライマー・プロジェクト向けルールをまとめて注入
+# japanese-developer が入っていれば、コンパイル済みのキャッシュを出力する
+input=$(cat)
+
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer hook context <<<"$input"
+fi
+
+# --- フォールバック: 言語ルール + プライマー（条件付きのルールは含めない） ---
+primer_json=$(bash "$HOME/.gemini/hooks/primer.sh" <<<"$input")
+LANGUAGE_PATH="$HOME/.gemini/context/language.md" python3 -c '
+import json, os, sys
+try:
+    parts = [open(os.environ["LANGUAGE_PATH"], encoding="utf-8").read().strip()]
+except OSError:
+    parts = []
+try:
+    parts.append(json.loads(sys.stdin.read())["hookSpecificOutput"]["additionalContext"])
+except (ValueError, KeyError):
+    pass
+context = "\n\n".join(p for p in parts if p)
+print(json.dumps({"hookSpecificOutput": {"additionalContext": context}}, ensure_ascii=False))
+' <<<"$primer_json"
+exit 0
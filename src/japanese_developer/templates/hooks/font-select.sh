@@ -66,6 +66,12 @@ if [ "$NAME" = "キャンセル" ] || [ -z "$REPO" ]; then
 fi
 
 echo ""
+
+# --- キャッシュ付きのインストール（ETag・途中再開・必要なTTFだけ展開） ---
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer font install "$NAME"
+fi
+
 echo "  ${NAME} をダウンロードしています..."
 
 # --- 最新リリースのzipダウンロードURLを取得 ---
@@ -1,8 +1,14 @@
 #!/bin/bash
 # interactive-guard.sh
 # 対話型コマンドを検知し、非対話フラグ付きの代替を提案するフック
+# japanese-developer が入っていれば、そちらのルール（guard_rules.json）で判定し、denyの件数を記録する
 
 INPUT=$(cat)
+
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer hook interactive-guard <<<"$INPUT"
+fi
+
 COMMAND=$(echo "$INPUT" | jq -r '.tool_input.command // empty')
 
 # コマンドが空なら許可
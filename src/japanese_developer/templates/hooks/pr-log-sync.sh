@@ -1,8 +1,14 @@
 #!/usr/bin/env bash
 # AfterTool hook: git push 検出後にPRへ作業ログを同期
 # - PR未作成時: スキップ
-# - PR作成済み時: 最新のログエントリをPRコメントとして投稿
+# - PR作成済み時: 今回のコミットをPRコメントとして投稿
+# japanese-developer が入っていれば、アウトボックスに積んでバックグラウンドで送信する
 input=$(cat)
+
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer hook pr-log-sync <<<"$input"
+fi
+
 command=$(echo "$input" | jq -r '.tool_input.command // .tool_input.content // ""')
 
 # git push コマンドかチェック
@@ -43,17 +49,7 @@ if [ -z "$pr_number" ] || [ "$pr_number" = "null" ]; then
   exit 0
 fi
 
-# ブランチログを取得
 author=$(cd "$project_dir" && git config user.name 2>/dev/null || echo "unknown")
-safe_branch=$(echo "$branch" | tr '/' '-')
-safe_author=$(echo "$author" | tr ' ' '-')
-branch_log="$project_dir/logs/${safe_branch}_${safe_author}.md"
-
-if [ ! -f "$branch_log" ]; then
-  echo "ブランチログが見つかりません: $branch_log" >&2
-  echo '{}'
-  exit 0
-fi
 
 # 直近のコミット情報（pushに含まれるもの）
 latest_commits=$(cd "$project_dir" && git log origin/$branch..HEAD --format="- %h: %s" 2>/dev/null)
@@ -71,15 +67,7 @@ comment_body="## 📋 作業ログ更新 ($timestamp)
 **作業者**: @$author
 
 ### 今回のコミット
-$latest_commits
-
----
-<details>
-<summary>ブランチログ全文</summary>
-
-$(cat "$branch_log")
-
-</details>"
+$latest_commits"
 
 cd "$project_dir" && gh pr comment "$pr_number" --body "$comment_body" 2>/dev/null
 
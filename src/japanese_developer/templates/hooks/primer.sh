@@ -1,7 +1,12 @@
 #!/usr/bin/env bash
 # SessionStart hook: 起動時プライマー情報を収集してコンテキストに注入
+# japanese-developer が入っていれば、キャッシュ付きのPython版で処理する
 input=$(cat)
 
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer hook primer <<<"$input"
+fi
+
 PRIMER_PATH="$HOME/.gemini/primer.md"
 
 if [ ! -f "$PRIMER_PATH" ]; then
@@ -1,8 +1,13 @@
 #!/data/data/com.termux/files/usr/bin/bash
 # AfterTool hook: コード生成後の構文エラー自動チェック
 # write_file/edit_file の後に実行され、構文エラーがあればGeminiに報告する
+# japanese-developer が入っていれば、連続した書き込みをまとめてチェックする（AfterAgent でも呼ばれる）
 
 INPUT=$(cat)
+
+if command -v japanese-developer &>/dev/null; then
+  exec japanese-developer hook syntax-check <<<"$INPUT"
+fi
 TOOL_NAME=$(echo "$INPUT" | jq -r '.tool_name // empty')
 
 # ファイル書き込み系ツールのみ対象
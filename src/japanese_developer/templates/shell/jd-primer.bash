@@ -0,0 +1,29 @@
+
+# japanese-developer: gemini起動時プライマー表示
+jd-primer() {
+  if [ -f "$HOME/.gemini/hooks/primer.sh" ]; then
+    if command -v japanese-developer &>/dev/null; then
+      echo '{}' | japanese-developer hook primer 2>&1 >/dev/null
+    else
+      echo '{}' | bash "$HOME/.gemini/hooks/primer.sh" 2>&1 >/dev/null
+    fi
+    while true; do
+      read -r -p "  (番号で詳細表示 / エンターで続行) " choice
+      case "$choice" in
+        "") break ;;
+        1) echo ""; echo "  Termuxとは？"; echo "  スマホの中にある「キッチン」のようなものです。"; echo "  Node.jsやPythonは鍋や包丁のような調理道具で、"; echo "  gitは冷蔵庫（材料の保管と出し入れ）にあたります。"; echo "  どんな道具を使って何を作るかはすべてあなた次第です。"; echo "" ;;
+        2) echo ""; echo "  gitとは？"; echo "  作ったモノの「セーブデータ管理」です。"; echo "  git add（材料を並べる）→ git commit（調理完了の記録）"; echo "  → git push（冷蔵庫に保存）が基本の流れです。"; echo "" ;;
+        3) echo ""; echo "  Gemini CLIとは？"; echo "  Googleが作ったAIの助手です。"; echo "  「これ作って」と言えばコードを書きますし、"; echo "  「これ何？」と聞けば説明してくれます。"; echo "" ;;
+        4) echo ""; echo "  コーディングエージェントとは？"; echo "  AIがコードの読み書き・実行・デバッグまで自律的にやってくれる仕組み。"; echo "  あなたがシェフで、エージェントは腕のいい助手です。"; echo "" ;;
+        5) echo ""; echo "  無責任者連絡先（無保証・無責任）:"; echo "  shimadatoshiyuki839@gmail.com"; echo "" ;;
+        6) echo ""; echo "  git連携:"; if command -v japanese-developer &>/dev/null; then japanese-developer primer --git; elif command -v git &>/dev/null && git rev-parse --is-inside-work-tree &>/dev/null 2>&1; then echo "  ユーザー: $(git config user.name)"; echo "  ブランチ: $(git branch --show-current)"; echo "  リモート: $(git remote get-url origin 2>/dev/null || echo なし)"; echo "  未コミット: $(git status --short | wc -l | tr -d ' ')件"; else echo "  （gitリポジトリ外）"; fi; echo "" ;;
+        7) echo ""; echo "  コマンド一覧:"; echo "  japanese-developer setup/status/error/termux-setup/uninstall"; if [ -d "$HOME/.gemini/commands" ]; then for f in "$HOME/.gemini/commands"/*.md; do [ -f "$f" ] && echo "  /$(basename "$f" .md)"; done; fi; echo "" ;;
+        8) if [ -f "$HOME/.gemini/hooks/font-select.sh" ]; then bash "$HOME/.gemini/hooks/font-select.sh"; else echo ""; echo "  font-select.sh が見つかりません。japanese-developer setup --force を実行してください。"; echo ""; fi ;;
+        9) echo ""; echo "  GitHubとは？"; echo "  プログラムのコードを保存・共有できる「共有倉庫」です。"; echo "  自分の作業をチームに共有したり、他の人の作業を取り込んだりできます。"; echo "  このチームではGitHubを通じてコードのやり取りをします。"; echo "" ;;
+        10) echo ""; echo "  GitHub連携（ログイン）"; echo "  既にGitHubアカウントを持っている人はこちら。"; echo ""; echo "  ターミナルで以下を実行してください:"; echo "    gh auth login"; echo ""; echo "  聞かれたら:"; echo "    1. GitHub.com を選択"; echo "    2. HTTPS を選択"; echo "    3. Yes を選択（gitの認証にも使う）"; echo "    4. Login with a web browser を選択"; echo "    5. 表示されるコードをメモ → ブラウザで入力"; echo ""; echo "  完了したら gh auth status で確認できます。"; echo "" ;;
+        11) echo ""; echo "  GitHubアカウント作成"; echo "  アカウントを持っていない人はこちら。"; echo ""; echo "  1. ブラウザで https://github.com を開く"; echo "  2. Sign up をタップ"; echo "  3. メールアドレス・パスワード・ユーザー名を入力"; echo "  4. メールに届く確認コードを入力"; echo "  5. 完了したら 10番 の手順でログインしてください"; echo "" ;;
+        *) echo "  1〜11の番号を入力してください。" ;;
+      esac
+    done
+  fi
+}
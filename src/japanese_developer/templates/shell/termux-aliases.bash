@@ -0,0 +1,5 @@
+
+# Gemini CLI - Termux aliases (japanese-developer)
+alias gemini='jd-primer && trap "" SIGWINCH && command gemini'
+alias gemini-safe='jd-primer && trap "" SIGWINCH && NO_COLOR=1 command gemini'
+alias gemini-plain='jd-primer && trap "" SIGWINCH && command gemini --screenReader'
@@ -0,0 +1,114 @@
+// japanese-developer: 常駐JS/TS構文チェッカー
+// stdinから1行1件のJSON {"path": ..., "ext": ...} を受け取り、
+// 構文チェック結果を1行1件のJSON {"error": ...} で返す（エラーなしは空文字）。
+// {"files": [{"path", "ext"}, ...]} を送ると、まとめてチェックして {"errors": [...]} を返す。
+// --experimental-vm-modules 付きで起動すると ES Modules もパースできる。
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const vm = require('vm');
+
+const MODULE_ERRORS = /Cannot use import statement|Unexpected token 'export'|import\.meta|await is only valid/;
+const typescripts = new Map();
+
+function loadTypescript(dir) {
+  let resolved;
+  try {
+    resolved = require.resolve('typescript', { paths: [dir] });
+  } catch (e) {
+    return null;
+  }
+  if (!typescripts.has(resolved)) {
+    typescripts.set(resolved, require(resolved));
+  }
+  return typescripts.get(resolved);
+}
+
+function formatSyntaxError(err, file) {
+  const stack = String(err.stack || err).split('\n    at ')[0];
+  return stack.startsWith(file) ? stack : `${file}: ${stack}`;
+}
+
+function checkJs(file, source, isModule) {
+  if (!isModule) {
+    try {
+      new vm.Script(source, { filename: file });
+      return '';
+    } catch (err) {
+      if (!MODULE_ERRORS.test(err.message) || !vm.SourceTextModule) {
+        return formatSyntaxError(err, file);
+      }
+    }
+  }
+  if (!vm.SourceTextModule) {
+    return '';
+  }
+  try {
+    new vm.SourceTextModule(source, { identifier: file });
+    return '';
+  } catch (err) {
+    return formatSyntaxError(err, file);
+  }
+}
+
+function checkTs(file, source) {
+  const ts = loadTypescript(path.dirname(file));
+  if (!ts) {
+    // typescriptが無ければJSとして基本的な構文チェック
+    return checkJs(file, source, false);
+  }
+  const result = ts.transpileModule(source, {
+    fileName: file,
+    reportDiagnostics: true,
+    compilerOptions: { jsx: ts.JsxEmit.Preserve, target: ts.ScriptTarget.ESNext },
+  });
+  return (result.diagnostics || []).slice(0, 20).map((d) => {
+    const message = ts.flattenDiagnosticMessageText(d.messageText, '\n');
+    if (!d.file) {
+      return `error TS${d.code}: ${message}`;
+    }
+    const pos = d.file.getLineAndCharacterOfPosition(d.start);
+    return `${file}(${pos.line + 1},${pos.character + 1}): error TS${d.code}: ${message}`;
+  }).join('\n');
+}
+
+function check(request) {
+  const file = request.path;
+  const source = fs.readFileSync(file, 'utf8');
+  switch (request.ext) {
+    case 'ts':
+    case 'tsx':
+    case 'jsx':
+      return checkTs(file, source);
+    case 'mjs':
+      return checkJs(file, source, true);
+    default:
+      return checkJs(file, source, false);
+  }
+}
+
+function checkOne(request) {
+  try {
+    return check(request);
+  } catch (err) {
+    return `${request.path}: ${String(err && err.message || err)}`;
+  }
+}
+
+const rl = readline.createInterface({ input: process.stdin });
+rl.on('line', (line) => {
+  let reply;
+  try {
+    const request = JSON.parse(line);
+    if (Array.isArray(request.files)) {
+      reply = { errors: request.files.map(checkOne) };
+    } else {
+      reply = { error: check(request) };
+    }
+  } catch (err) {
+    reply = { error: '', failure: String(err && err.message || err) };
+  }
+  process.stdout.write(JSON.stringify(reply) + '\n');
+});
@@ -0,0 +1,496 @@
+"""作業ログの記録（追記専用ジャーナル + Markdownの逐次描画）
+
+コミットは `git log -1` 1回で情報を取得し、logs/.worklog.jsonl に1行追記する。
+logs/WORK_LOG.md と logs/<branch>_<author>.md はジャーナルから描画し、
+最後に描画したエントリ（位置とコミットハッシュ）を logs/.worklog.cursor に保存しておくことで、
+ログがどれだけ大きくなっても新しいエントリだけを追記する。
+checkout 等でジャーナルや WORK_LOG.md が差し替わった（保存した位置のエントリや
+WORK_LOG.md のサイズが一致しない）時は、WORK_LOG.md に載っているコミットハッシュと
+突き合わせて未描画のエントリだけを描画する。
+
+並列に動く複数のGeminiセッションが同じリポジトリに書き込んでもエントリが
+混ざらないよう、ジャーナルへの追記と描画は logs/.worklog.lock の flock で直列化する。
+
+手動コミットやrebase等で記録されなかったコミットは rebuild() でgit履歴から取り込む。
+"""
+
+import fcntl
+import json
+import os
+import re
+import subprocess
+import time
+from contextlib import contextmanager
+
+JOURNAL_NAME = ".worklog.jsonl"
+CURSOR_NAME = ".worklog.cursor"
+LOCK_NAME = ".worklog.lock"
+STATE_NAME = ".worklog.state"
+
+# 変更ファイルとして記録する最大件数
+MAX_FILES = 10
+
+# git log -1 の出力形式（NUL区切り）: ハッシュ, 短縮ハッシュ, 件名, 作者, 日時, ref名
+LOG_FORMAT = "%H%x00%h%x00%s%x00%an%x00%cd%x00%D"
+DATE_FORMAT = "--date=format:%Y-%m-%d %H:%M"
+
+# 履歴の取り込み（rebuild）用の出力形式。%S は --source で辿ったブランチ名。
+# 各コミットの先頭に \x01 を付けて、続く --name-only のファイル行と区別する。
+HISTORY_FORMAT = "%x01%H%x00%h%x00%s%x00%an%x00%cd%x00%S"
+
+# rebuild でジャーナルへまとめて追記する件数
+BATCH_SIZE = 500
+
+WORK_LOG_HEADER = """# 作業ログ（統合）
+
+全ブランチ・全作業者のコミットログを時系列で記録します。
+
+---
+"""
+
+# ロックファイル・描画位置・rebuildの再開位置はローカル状態なのでリポジトリに含めない
+LOCAL_STATE_NAMES = (CURSOR_NAME, LOCK_NAME, STATE_NAME)
+
+
+def safe_names(branch: str, author: str):
+    return branch.replace("/", "-"), author.replace(" ", "-")
+
+
+def branch_log_name(branch: str, author: str) -> str:
+    safe_branch, safe_author = safe_names(branch, author)
+    return f"{safe_branch}_{safe_author}.md"
+
+
+def _branch_from_refs(refs: str) -> str:
+    """%D（例: "HEAD -> feature/x, origin/feature/x"）から現在のブランチ名を取り出す。"""
+    for ref in refs.split(", "):
+        if ref.startswith("HEAD -> "):
+            return ref[len("HEAD -> "):]
+    return ""
+
+
+def parse_commit(header: str, files: list, source: bool = False) -> dict:
+    """LOG_FORMAT（source=True なら HISTORY_FORMAT）の1件分とファイル一覧からジャーナルのエントリを作る。"""
+    commit, commit_hash, subject, author, timestamp, ref = header.split("\0")
+    if source:
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    else:
+        branch = _branch_from_refs(ref)
+    return {
+        "commit": commit,
+        "hash": commit_hash,
+        "subject": subject,
+        "branch": branch,
+        "author": author or "unknown",
+        "time": timestamp,
+        "files": files[:MAX_FILES],
+    }
+
+
+def read_head_commit(project_dir: str) -> dict:
+    """HEADのコミット情報を git log 1回で取得する。取得できなければNone。"""
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", "log", "-1", "--name-only",
+             f"--format={LOG_FORMAT}", DATE_FORMAT],
+            cwd=project_dir, capture_output=True, text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    lines = result.stdout.splitlines()
+    return parse_commit(lines[0], [line for line in lines[1:] if line])
+
+
+@contextmanager
+def locked(logs_dir: str):
+    """logs/ の作業ログ書き込みを排他する。"""
+    os.makedirs(logs_dir, exist_ok=True)
+    with open(os.path.join(logs_dir, LOCK_NAME), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _package_version(project_dir: str) -> str:
+    try:
+        with open(os.path.join(project_dir, "package.json")) as f:
+            return str(json.load(f).get("version") or "")
+    except (OSError, ValueError, AttributeError):
+        return ""
+
+
+def _entry_body(entry: dict) -> str:
+    return (
+        f"- **意図**: {entry['subject']}\n"
+        f"- **変更ファイル**: {', '.join(entry['files'])}\n"
+        f"- **コミット**: {entry['hash']}\n"
+    )
+
+
+def _read_cursor(logs_dir: str) -> dict:
+    try:
+        with open(os.path.join(logs_dir, CURSOR_NAME)) as f:
+            cursor = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cursor if isinstance(cursor, dict) else {}
+
+
+def _write_cursor(logs_dir: str, cursor: dict):
+    with open(os.path.join(logs_dir, CURSOR_NAME), "w") as f:
+        json.dump(cursor, f)
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return -1
+
+
+def _cursor_valid(f, cursor: dict, work_log: str) -> bool:
+    """カーソルの位置に記録したハッシュのエントリが残っていて、WORK_LOG.md も前回描画した時のままか。"""
+    try:
+        if cursor["markdown"] != _size(work_log):
+            return False
+        start, offset = int(cursor["start"]), int(cursor["offset"])
+        f.seek(start)
+        raw = f.readline()
+        return start + len(raw) == offset and json.loads(raw)["hash"] == cursor["hash"]
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+class KnownCommits:
+    """記録済みのコミットの集合
+
+    ジャーナルのエントリは完全なハッシュ（commit）で照合する。完全なハッシュを持たない
+    古いエントリとMarkdownのログは短縮ハッシュしか無いので、その桁数の前方一致で照合する。
+    """
+
+    def __init__(self):
+        self.full = set()
+        self.short = {}  # 桁数 → 短縮ハッシュの集合
+
+    def add(self, entry: dict):
+        if entry.get("commit"):
+            self.full.add(entry["commit"])
+        elif entry.get("hash"):
+            self.short.setdefault(len(entry["hash"]), set()).add(entry["hash"])
+
+    def __contains__(self, entry: dict) -> bool:
+        commit = entry.get("commit") or entry.get("hash", "")
+        if commit in self.full:
+            return True
+        return any(commit[:length] in hashes for length, hashes in self.short.items())
+
+
+def _markdown_hashes(path: str, known: KnownCommits):
+    """Markdownのログに載っているコミットの短縮ハッシュを known に加える。"""
+    marker = "- **コミット**: "
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(marker):
+                    known.add({"hash": line[len(marker):].strip()})
+    except FileNotFoundError:
+        pass
+
+
+def render(project_dir: str, logs_dir: str) -> list:
+    """ジャーナルの未描画エントリをMarkdownに追記する。ロック取得済みで呼ぶこと。
+
+    新規作成したログファイルに関するメッセージのリストを返す。
+    """
+    messages = []
+    journal = os.path.join(logs_dir, JOURNAL_NAME)
+    if not os.path.exists(journal):
+        return messages
+    outputs = {}
+
+    def output(path: str, header: str, message: str):
+        if path not in outputs:
+            created = not os.path.exists(path)
+            outputs[path] = open(path, "a", encoding="utf-8")
+            if created:
+                outputs[path].write(header)
+                messages.append(message)
+        return outputs[path]
+
+    work_log = os.path.join(logs_dir, "WORK_LOG.md")
+    cursor = _read_cursor(logs_dir)
+    try:
+        with open(journal, "rb") as f:
+            if _cursor_valid(f, cursor, work_log):
+                offset, rendered = cursor["offset"], None
+            else:
+                # ジャーナルかMarkdownが差し替わった（checkout・作り直し等）: 描画済みかはハッシュで判定する
+                offset, rendered = 0, KnownCommits()
+                _markdown_hashes(work_log, rendered)
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # 書き込み途中の行は次回に回す
+                    break
+                start, offset = offset, offset + len(raw)
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    continue
+                cursor = {"start": start, "offset": offset, "hash": entry["hash"]}
+                if rendered is not None:
+                    if entry in rendered:
+                        continue
+                    rendered.add(entry)
+
+                # 統合ログ
+                out = output(work_log, WORK_LOG_HEADER, "WORK_LOG.md を新規作成")
+                out.write(f"\n## {entry['time']} [{entry['branch']}] @{entry['author']}\n\n")
+                out.write(_entry_body(entry))
+
+                # ブランチログ
+                branch_log = os.path.join(logs_dir, branch_log_name(entry["branch"], entry["author"]))
+                if branch_log not in outputs:
+                    base_version = _package_version(project_dir)
+                    base = f"v{base_version}" if base_version else ""
+                    header = (
+                        f"# {entry['branch']} / {entry['author']}\n\n"
+                        f"- **開始日**: {entry['time'][:10]}\n"
+                        f"- **ベース**: main {base}\n\n"
+                        f"---\n"
+                    )
+                    output(branch_log, header, f"ブランチログを新規作成: {branch_log}")
+                out = outputs[branch_log]
+                out.write(f"\n## {entry['time']}\n\n")
+                out.write(_entry_body(entry))
+    finally:
+        for out in outputs.values():
+            out.close()
+
+    if cursor:
+        cursor["markdown"] = _size(work_log)
+        _write_cursor(logs_dir, cursor)
+    return messages
+
+
+# --- Markdownのログの読み込み（ジャーナル導入前のエントリ用） ---
+
+# 統合ログは "## 日時 [ブランチ] @作者"、ブランチログは "## 日時"
+_ENTRY_HEADING = re.compile(r"^## (\d{4}-\d{2}-\d{2} \d{2}:\d{2})(?: \[(.*)\] @(.*))?$")
+_ENTRY_FIELDS = {"意図": "subject", "変更ファイル": "files", "コミット": "hash"}
+
+
+def parse_markdown(path: str) -> list:
+    """WORK_LOG.md・ブランチログのエントリをジャーナルと同じ形式で返す。"""
+    entries = []
+    entry = None
+    branch = author = ""
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                heading = _ENTRY_HEADING.match(line)
+                if heading:
+                    entry = {
+                        "hash": "", "subject": "",
+                        "branch": branch if heading.group(2) is None else heading.group(2),
+                        "author": heading.group(3) or author or "unknown",
+                        "time": heading.group(1), "files": [],
+                    }
+                    entries.append(entry)
+                elif entry is None and line.startswith("# ") and " / " in line:
+                    # ブランチログの見出し "# ブランチ / 作者"
+                    branch, author = line[2:].split(" / ", 1)
+                elif entry is not None and line.startswith("- **"):
+                    name, _, value = line[4:].partition("**: ")
+                    field = _ENTRY_FIELDS.get(name)
+                    if field == "files":
+                        entry["files"] = [name for name in value.split(", ") if name]
+                    elif field:
+                        entry[field] = value.strip()
+    except FileNotFoundError:
+        pass
+    return [entry for entry in entries if entry["hash"]]
+
+
+def markdown_entries(logs_dir: str) -> list:
+    """WORK_LOG.md とブランチログのエントリを、コミットハッシュの重複を除いて返す。"""
+    paths = [os.path.join(logs_dir, "WORK_LOG.md")]
+    try:
+        paths += sorted(
+            os.path.join(logs_dir, name) for name in os.listdir(logs_dir)
+            if name.endswith(".md") and name != "WORK_LOG.md"
+        )
+    except FileNotFoundError:
+        return []
+    entries, seen = [], KnownCommits()
+    for path in paths:
+        for entry in parse_markdown(path):
+            if entry not in seen:
+                seen.add(entry)
+                entries.append(entry)
+    return entries
+
+
+def _ensure_gitignore(logs_dir: str):
+    gitignore = os.path.join(logs_dir, ".gitignore")
+    try:
+        with open(gitignore, encoding="utf-8") as f:
+            listed = set(f.read().splitlines())
+    except FileNotFoundError:
+        listed = set()
+    missing = [name for name in LOCAL_STATE_NAMES if name not in listed]
+    if missing:
+        with open(gitignore, "a", encoding="utf-8") as f:
+            f.write("".join(f"{name}\n" for name in missing))
+
+
+def append_entries(logs_dir: str, entries):
+    """エントリをジャーナルに追記する。ロック取得済みで呼ぶこと。"""
+    _ensure_gitignore(logs_dir)
+    with open(os.path.join(logs_dir, JOURNAL_NAME), "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def record_commit(project_dir: str):
+    """HEADのコミットをジャーナルに記録し、Markdownに描画する。
+
+    (エントリ, メッセージのリスト) を返す。コミット情報が取れなければエントリはNone。
+    """
+    entry = read_head_commit(project_dir)
+    if entry is None:
+        return None, ["コミット情報を取得できないためログ記録をスキップ"]
+    entry["recorded"] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    logs_dir = os.path.join(project_dir, "logs")
+    with locked(logs_dir):
+        append_entries(logs_dir, [entry])
+        messages = render(project_dir, logs_dir)
+    return entry, messages
+
+
+# --- rebuild（git履歴からの取り込み） ---
+
+def _known_hashes(logs_dir: str, journal_offset: int) -> KnownCommits:
+    """記録済みのコミットハッシュを集める。
+
+    前回のrebuild以降にジャーナルへ追記された分だけを読む（それ以前の分は
+    前回のブランチ先端より前の履歴なので、今回の取り込み範囲と重ならない）。
+    初回はジャーナル導入前に書かれた WORK_LOG.md のエントリも対象にする。
+    """
+    known = KnownCommits()
+    journal = os.path.join(logs_dir, JOURNAL_NAME)
+    if os.path.exists(journal):
+        with open(journal, "rb") as f:
+            f.seek(journal_offset)
+            for raw in f:
+                try:
+                    known.add(json.loads(raw))
+                except (ValueError, AttributeError):
+                    continue
+    if journal_offset == 0:
+        _markdown_hashes(os.path.join(logs_dir, "WORK_LOG.md"), known)
+    return known
+
+
+def _load_state(logs_dir: str) -> dict:
+    try:
+        with open(os.path.join(logs_dir, STATE_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _branch_tips(project_dir: str) -> list:
+    result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(objectname)", "refs/heads"],
+        cwd=project_dir, capture_output=True, text=True,
+    )
+    return sorted(set(result.stdout.split()))
+
+
+def iter_history(project_dir: str, exclude: list = ()):
+    """全ローカルブランチの履歴を古い順にストリーミングで読み、エントリを1件ずつ返す。
+
+    exclude のコミット（前回rebuild時のブランチ先端）から辿れる履歴は除く。
+    """
+    argv = [
+        "git", "-c", "core.quotePath=false", "log", "--reverse", "--branches", "--source",
+        "--name-only", f"--format={HISTORY_FORMAT}", DATE_FORMAT,
+    ]
+    if exclude:
+        argv += ["--not", *exclude]
+    proc = subprocess.Popen(
+        argv, cwd=project_dir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, encoding="utf-8", errors="replace",
+    )
+    header, files = None, []
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("\x01"):
+                if header is not None:
+                    yield parse_commit(header, files, source=True)
+                header, files = line[1:], []
+            elif line:
+                files.append(line)
+        if header is not None:
+            yield parse_commit(header, files, source=True)
+    finally:
+        proc.stdout.close()
+        if proc.wait() != 0 and header is None and exclude:
+            # 前回の先端がgc等で消えていると失敗するので、呼び出し側で全履歴から取り込み直す
+            raise LookupError("前回のrebuild位置から履歴を辿れません")
+
+
+def rebuild(project_dir: str) -> dict:
+    """手動コミット・rebase・cherry-pick等で記録されなかったコミットをgit履歴から取り込む。
+
+    前回のrebuild位置から再開し、未記録のコミットだけをジャーナルに追記して
+    Markdownに描画する。戻り値は {"scanned": 件数, "added": 件数, "messages": [...]}。
+    """
+    logs_dir = os.path.join(project_dir, "logs")
+    os.makedirs(logs_dir, exist_ok=True)
+    state = _load_state(logs_dir)
+    tips = _branch_tips(project_dir)
+
+    def scan(exclude: list, journal_offset: int):
+        known = _known_hashes(logs_dir, journal_offset)
+        scanned = added = 0
+        batch = []
+        for entry in iter_history(project_dir, exclude):
+            scanned += 1
+            if entry in known:
+                continue
+            entry["recorded"] = "rebuild"
+            batch.append(entry)
+            if len(batch) >= BATCH_SIZE:
+                with locked(logs_dir):
+                    append_entries(logs_dir, batch)
+                added += len(batch)
+                batch = []
+        if batch:
+            with locked(logs_dir):
+                append_entries(logs_dir, batch)
+            added += len(batch)
+        return scanned, added
+
+    try:
+        scanned, added = scan(state.get("tips", []), state.get("journal_offset", 0))
+    except LookupError:
+        scanned, added = scan([], 0)
+
+    with locked(logs_dir):
+        messages = render(project_dir, logs_dir)
+        journal = os.path.join(logs_dir, JOURNAL_NAME)
+        journal_size = os.path.getsize(journal) if os.path.exists(journal) else 0
+        tmp = os.path.join(logs_dir, f"{STATE_NAME}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"tips": tips, "journal_offset": journal_size}, f)
+        os.replace(tmp, os.path.join(logs_dir, STATE_NAME))
+    return {"scanned": scanned, "added": added, "messages": messages}
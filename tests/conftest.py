@@ -0,0 +1,91 @@
+"""テスト共通: 一時HOME・偽サーバー・使い捨てのgitリポジトリ
+
+japanese_developer の各モジュールは import 時に ~/.gemini 以下のパスを決めるため、
+最初に HOME を一時ディレクトリへ向けてから import する。
+実行: python -m pytest tests
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="jd-test-home-")
+for name in ("GH_TOKEN", "GITHUB_TOKEN", "JD_GH", "JD_GITHUB_API"):
+    os.environ.pop(name, None)
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """テストごとに routes を差し替えて使う偽HTTPサーバーのハンドラ
+
+    routes は (メソッド, パス) → 関数(handler) で、関数は (ステータス, ヘッダー, 本文bytes) を返す。
+    受け取ったリクエストは requests に (メソッド, パス, ヘッダー, 本文) で記録する。
+    """
+
+    routes = {}
+    requests = []
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.requests.append((self.command, self.path, dict(self.headers), body))
+        route = self.routes.get((self.command, self.path.split("?")[0]))
+        if route is None:
+            self.send_error(404)
+            return
+        status, headers, payload = route(self)
+        if payload is None:
+            # 接続を途中で切る（ヘッダーは送信済みにしたい時は route 側で書く）
+            self.close_connection = True
+            return
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server():
+    """偽HTTPサーバーを起動し、(ベースURL, ハンドラクラス) を返す。"""
+    handler = type("Handler", (FakeHandler,), {"routes": {}, "requests": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", handler
+    server.shutdown()
+    server.server_close()
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """main に1コミットある使い捨てのリポジトリ"""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+    git(repo, "config", "user.name", "tester")
+    git(repo, "config", "user.email", "tester@example.com")
+    (repo / "README.md").write_text("base\n")
+    git(repo, "add", "README.md")
+    git(repo, "commit", "-q", "-m", "base")
+    return repo
+
+
+def commit(repo, name: str, subject: str) -> str:
+    (repo / name).write_text(subject + "\n")
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", subject)
+    return git(repo, "rev-parse", "--short", "HEAD").strip()
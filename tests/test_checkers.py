@@ -0,0 +1,44 @@
+"""構文チェッカー（checkers）: 常駐ワーカー"""
+
+import sys
+import time
+
+import pytest
+
+from japanese_developer import checkers
+
+HUNG_WORKER = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+def test_hung_worker_is_not_retried(monkeypatch):
+    monkeypatch.setattr(checkers, "JOB_TIMEOUT", 0.3)
+    worker = checkers.Worker(HUNG_WORKER)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        worker.request({"path": "a.py"})
+    # 再試行すると応答待ちが2回分になる
+    assert time.monotonic() - start < 0.6
+    assert worker.proc is None
+
+
+def test_error_line_for_each_language():
+    assert checkers.error_line('  File "a.py", line 3\n    x = (\nSyntaxError: ...') == 3
+    assert checkers.error_line("a.ts(12,5): error TS1005: ';' expected.") == 12
+    assert checkers.error_line("JSON構文エラー: a.json: Expecting ',' delimiter: line 4 column 8 (char 30)") == 4
+    assert checkers.error_line("a.js:7\nSyntaxError: Unexpected token") == 7
+
+
+def test_check_index_skips_unchanged_files_and_forgets_deleted_ones(tmp_path):
+    (tmp_path / "ok.json").write_text('{"a": 1}')
+    (tmp_path / "gone.json").write_text("[]")
+    (tmp_path / "bad.json").write_text('{"a": 1,}')
+
+    first = checkers.check_project(str(tmp_path), jobs=1)
+    assert first["checked"] == 3 and [e["path"] for e in first["errors"]] == ["bad.json"]
+    assert sorted(checkers.load_index(str(tmp_path))) == ["gone.json", "ok.json"]
+
+    (tmp_path / "gone.json").unlink()
+    second = checkers.check_project(str(tmp_path), jobs=1)
+    # エラーのあったファイルだけを再チェックし、削除されたファイルは索引から消す
+    assert second["checked"] == 1 and second["skipped"] == 1
+    assert sorted(checkers.load_index(str(tmp_path))) == ["ok.json"]
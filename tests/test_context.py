@@ -0,0 +1,88 @@
+"""注入コンテキストのコンパイル（context）: 条件・重複除去・予算・キャッシュ"""
+
+import json
+import os
+
+import pytest
+
+from japanese_developer import context
+
+
+@pytest.fixture
+def fragments(tmp_path, monkeypatch):
+    directory = tmp_path / "context"
+    directory.mkdir()
+    (directory / "rules.json").write_text(json.dumps({
+        "conditions": {"frontend": ["package.json"]},
+        "fragments": [
+            {"file": "base.md", "when": None},
+            {"file": "vite.md", "when": "frontend"},
+            {"file": "design.md", "when": "frontend"},
+        ],
+    }))
+    (directory / "base.md").write_text("# 基本\n\n日本語で応答する。\n\nGEMINI.md と同じ段落。\n")
+    (directory / "vite.md").write_text("# Vite\n\n" + "ビルドは vite build。\n" * 20)
+    (directory / "design.md").write_text("# デザイン\n\n日本語で応答する。\n\n余白は8の倍数。\n")
+    gemini_md = tmp_path / "GEMINI.md"
+    gemini_md.write_text("# ルール\n\nGEMINI.md と同じ段落。\n")
+    monkeypatch.setattr(context, "CONTEXT_DIR", directory)
+    monkeypatch.setattr(context, "GEMINI_MD", gemini_md)
+    monkeypatch.setattr(context, "CACHE_DIR", tmp_path / "cache")
+    return directory
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    return project
+
+
+def sections(compiled) -> dict:
+    return {s["name"]: s for s in compiled["sections"]}
+
+
+def test_conditional_fragments_need_a_matching_file(fragments, project):
+    compiled = context.compile_context(str(project), budget=10_000)
+    assert sections(compiled)["vite.md"]["reason"] == "条件 frontend に一致しない"
+    assert "日本語で応答する。" in compiled["text"]
+
+    (project / "package.json").write_text("{}")
+    compiled = context.compile_context(str(project), budget=10_000)
+    assert sections(compiled)["vite.md"]["included"]
+    assert sections(compiled)["vite.md"]["reason"] == "frontend: package.json"
+
+
+def test_duplicate_paragraphs_are_removed(fragments, project):
+    (project / "package.json").write_text("{}")
+    compiled = context.compile_context(str(project), budget=10_000)
+    text = compiled["text"]
+    # GEMINI.md と同じ段落は入れず、断片どうしで重複する段落は1回だけ入れる
+    assert "GEMINI.md と同じ段落。" not in text
+    assert text.count("日本語で応答する。") == 1
+    assert "余白は8の倍数。" in text
+    assert compiled["deduped"] == 2
+
+
+def test_budget_drops_low_priority_fragments_first(fragments, project):
+    (project / "package.json").write_text("{}")
+    full = context.compile_context(str(project), budget=10_000)
+    design = sections(full)["design.md"]["tokens"]
+
+    compiled = context.compile_context(str(project), budget=full["tokens"] - design)
+    assert sections(compiled)["design.md"]["reason"] == "予算超過のため除外"
+    assert sections(compiled)["vite.md"]["included"]
+    # 条件なしの断片は予算を超えても外さない
+    compiled = context.compile_context(str(project), budget=0)
+    assert sections(compiled)["base.md"]["included"]
+
+
+def test_cache_is_rebuilt_when_a_fragment_changes(fragments, project):
+    built = context.build(str(project), budget=10_000)
+    assert context.load(str(project), budget=10_000) == built
+    assert context.load(str(project), budget=500) is None
+
+    path = fragments / "base.md"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert context.load(str(project), budget=10_000) is None
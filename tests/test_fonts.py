@@ -0,0 +1,140 @@
+"""フォントのキャッシュ（fonts）を偽の GitHub API・配布サーバーで確かめる: Range での再開・ETag"""
+
+import hashlib
+import io
+import os
+import zipfile
+
+import pytest
+
+from japanese_developer import fonts, github
+
+REPO = "yuru7/HackGen"
+TTF = "HackGenConsole-Regular.ttf"
+TTF_BYTES = os.urandom(300_000)
+
+
+def make_zip() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("HackGen_v1/README.txt", "readme")
+        zf.writestr(f"HackGen_v1/{TTF}", TTF_BYTES)
+    return buf.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(fonts, "CACHE_DIR", tmp_path / "fonts")
+    monkeypatch.setattr(fonts, "OBJECTS_DIR", tmp_path / "fonts" / "objects")
+    monkeypatch.setattr(fonts, "PARTIAL_DIR", tmp_path / "fonts" / "partial")
+    monkeypatch.setattr(fonts, "INDEX_PATH", tmp_path / "fonts" / "index.json")
+
+
+@pytest.fixture
+def server(fake_server):
+    """リリースAPIと zip の配布。最初の zip の取得は半分送ったところで接続を切る。"""
+    base, handler = fake_server
+    state = {"zip": make_zip(), "etag": '"zip-v1"', "cut": True}
+
+    def release(h):
+        if h.headers.get("If-None-Match") == '"rel-v1"':
+            return 304, {}, b""
+        body = (
+            '{"assets": [{"name": "HackGen_v1.zip", '
+            f'"browser_download_url": "{base}/download/HackGen_v1.zip"}}]}}'
+        ).encode()
+        return 200, {"Content-Type": "application/json", "ETag": '"rel-v1"'}, body
+
+    def download(h):
+        data = state["zip"]
+        start = 0
+        if h.headers.get("Range") and h.headers.get("If-Range") == state["etag"]:
+            start = int(h.headers["Range"].split("=")[1].rstrip("-"))
+        if state["cut"]:
+            state["cut"] = False
+            h.send_response(200)
+            h.send_header("ETag", state["etag"])
+            h.send_header("Content-Length", str(len(data)))
+            h.end_headers()
+            h.wfile.write(data[:len(data) // 2])
+            h.wfile.flush()
+            return 200, {}, None
+        status = 206 if start else 200
+        headers = {"ETag": state["etag"]}
+        if start:
+            headers["Content-Range"] = f"bytes {start}-{len(data) - 1}/{len(data)}"
+        return status, headers, data[start:]
+
+    handler.routes.update({
+        ("GET", f"/repos/{REPO}/releases/latest"): release,
+        ("GET", "/download/HackGen_v1.zip"): download,
+    })
+    return github.Client(base=base, token=""), handler, state
+
+
+def downloads(handler) -> list:
+    return [headers for method, path, headers, _ in handler.requests if path.startswith("/download/")]
+
+
+def test_interrupted_download_resumes_with_range(server):
+    client, handler, state = server
+    result = fonts.fetch(REPO, "HackGen_v", TTF, client=client)
+
+    assert result["downloaded"] and result["sha256"] == hashlib.sha256(TTF_BYTES).hexdigest()
+    assert result["path"].read_bytes() == TTF_BYTES
+    first, second = downloads(handler)
+    assert "Range" not in first
+    assert second["Range"] == f"bytes={len(state['zip']) // 2}-"
+    assert second["If-Range"] == '"zip-v1"'
+    # 完了したら途中のファイルは残さない
+    assert not any(fonts.PARTIAL_DIR.iterdir())
+
+
+def test_cached_font_is_reused_when_release_is_unchanged(server):
+    client, handler, state = server
+    state["cut"] = False
+    fonts.fetch(REPO, "HackGen_v", TTF, client=client)
+    handler.requests.clear()
+
+    result = fonts.fetch(REPO, "HackGen_v", TTF, client=client)
+    assert not result["downloaded"]
+    assert downloads(handler) == []
+    [(_, _, headers, _)] = handler.requests
+    assert headers["If-None-Match"] == '"rel-v1"'
+
+
+def test_changed_file_restarts_from_the_beginning(server, monkeypatch):
+    client, handler, state = server
+    # 再試行しなければ、途中まで取得したところで終わる
+    monkeypatch.setattr(fonts, "RESUME_ATTEMPTS", 0)
+    url = f"{client.base}/download/HackGen_v1.zip"
+    with pytest.raises(fonts.FontError):
+        fonts.download(url)
+    part, _ = fonts._partial_paths(url)
+    assert 0 < part.stat().st_size < len(state["zip"])
+
+    # サーバー側のファイルが変わった: If-Range が一致しないので全体を取り直す
+    state["zip"], state["etag"] = make_zip(), '"zip-v2"'
+    handler.requests.clear()
+    path = fonts.download(url)
+    assert path.read_bytes() == state["zip"]
+    [headers] = downloads(handler)
+    assert headers["If-Range"] == '"zip-v1"'
+
+
+def test_offline_uses_the_cached_font(server):
+    client, _, state = server
+    state["cut"] = False
+    cached = fonts.fetch(REPO, "HackGen_v", TTF, client=client)
+
+    result = fonts.fetch(REPO, "HackGen_v", TTF, client=github.Client(base="http://127.0.0.1:9", token=""))
+    assert result["offline"] and result["sha256"] == cached["sha256"]
+
+
+def test_not_modified_without_cached_asset_refetches(server):
+    client, handler, _ = server
+    # ETag だけ残っていてアセットURLが無い（古いキャッシュ等）
+    asset = fonts.latest_asset(REPO, "HackGen_v", {"release_etag": '"rel-v1"'}, client)
+    assert asset["url"] == f"{client.base}/download/HackGen_v1.zip"
+    first, second = [headers for _, _, headers, _ in handler.requests]
+    assert first["If-None-Match"] == '"rel-v1"' and "If-None-Match" not in second
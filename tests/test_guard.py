@@ -0,0 +1,33 @@
+"""interactive-guard のルールエンジンを評価コーパス（templates/guard_corpus.jsonl）で確かめる"""
+
+import pytest
+
+from japanese_developer import guard
+
+CORPUS = guard.load_corpus()
+
+
+@pytest.fixture(scope="module")
+def ruleset():
+    return guard.RuleSet(guard.load_specs())
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["command"] for case in CORPUS])
+def test_corpus(case, ruleset):
+    rule, _ = guard.evaluate(case["command"], ruleset)
+    if case["expect"] == "allow":
+        assert rule is None
+    else:
+        assert rule is not None and rule.id == case.get("rule", rule.id)
+
+
+def test_heredoc_body_is_not_a_command():
+    commands = [argv for argv, _, _ in guard.split_commands("cat <<EOF > a.sh\nnode\nEOF\nls -la")]
+    assert commands == [["cat"], ["ls", "-la"]]
+
+
+def test_stdin_from_redirect_or_pipe():
+    split = list(guard.split_commands("echo x | python3 && node < a.js; python3 2> err.log"))
+    assert [(argv[0], stdin) for argv, _, stdin in split] == [
+        ("echo", False), ("python3", True), ("node", True), ("python3", False),
+    ]
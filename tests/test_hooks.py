@@ -0,0 +1,39 @@
+"""Python版hookのディスパッチャ（hooks.run_hook）"""
+
+import json
+
+import pytest
+
+from japanese_developer import hooks, telemetry
+
+
+@pytest.fixture(autouse=True)
+def telemetry_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "telemetry.jsonl")
+    monkeypatch.setattr(telemetry, "TELEMETRY_PATH", path)
+    return path
+
+
+def shell(command: str) -> str:
+    return json.dumps({
+        "hook_event_name": "BeforeTool", "tool_name": "run_shell_command", "tool_input": {"command": command},
+    })
+
+
+def test_interactive_guard_denies_and_records_the_rule(tmp_path, telemetry_path):
+    stdout, _, code = hooks.run_hook("interactive-guard", shell("npm init"), str(tmp_path))
+    response = json.loads(stdout)
+    assert code == 0 and response["decision"] == "deny" and "npm init" in response["reason"]
+    # テレメトリ用の情報は出力に含めず、記録にだけ残す
+    assert hooks.TELEMETRY_KEY not in response
+    [entry] = telemetry.load(telemetry_path)
+    assert entry["hook"] == "interactive-guard" and entry["rule"] == "npm-init"
+
+    stdout, _, _ = hooks.run_hook("interactive-guard", shell("npm init -y"), str(tmp_path))
+    assert json.loads(stdout).get("decision") != "deny"
+
+
+def test_bad_input_and_unknown_hooks(tmp_path):
+    stdout, _, code = hooks.run_hook("interactive-guard", "not json", str(tmp_path))
+    assert code == 0 and json.loads(stdout).get("decision") != "deny"
+    assert hooks.run_hook("no-such-hook", "{}", str(tmp_path))[2] == 1
@@ -0,0 +1,48 @@
+"""ログからのスタックトレース抽出（logscan）: 逆向きの走査と指紋でのまとめ"""
+
+from japanese_developer import logscan
+
+PY_TRACE = """Traceback (most recent call last):
+  File "/srv/app/{n}/main.py", line {line}, in handler
+    run()
+  File "/srv/app/{n}/jobs.py", line 7, in run
+    1 / 0
+ZeroDivisionError: division by zero
+"""
+
+NODE_TRACE = """TypeError: Cannot read properties of undefined (reading 'id')
+    at render (/home/u/app/src/view.js:12:5)
+    at main (/home/u/app/src/index.js:3:1)
+"""
+
+
+def test_traces_are_newest_first_and_grouped_by_fingerprint(tmp_path):
+    log = tmp_path / "app.log"
+    noise = "INFO request ok\n" * 1000
+    log.write_text(
+        noise + NODE_TRACE + noise + PY_TRACE.format(n=1, line=10) + noise + PY_TRACE.format(n=2, line=99) + noise
+    )
+
+    result = logscan.scan(str(log), limit=2)
+    python, node = result["traces"]
+    # パス・行番号が違っても同じエラー（count は走査した範囲での回数）
+    assert python["kind"] == "python" and python["count"] == 2
+    assert python["lines"][-1] == "ZeroDivisionError: division by zero"
+    assert node["kind"] == "node" and node["count"] == 1
+    assert node["lines"][0].startswith("TypeError")
+    assert result["total_bytes"] == log.stat().st_size
+
+
+def test_stops_scanning_once_enough_traces_are_found(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text(NODE_TRACE + "INFO ok\n" * 100_000 + PY_TRACE.format(n=1, line=1))
+
+    result = logscan.scan(str(log), limit=1)
+    assert [t["kind"] for t in result["traces"]] == ["python"]
+    assert result["scanned_bytes"] < result["total_bytes"] // 10
+
+
+def test_empty_log(tmp_path):
+    log = tmp_path / "empty.log"
+    log.write_text("")
+    assert logscan.scan(str(log))["traces"] == []
@@ -0,0 +1,42 @@
+"""作業ログの全文検索（logsearch）: 差分の取り込みと日本語の検索"""
+
+from conftest import commit
+from japanese_developer import logsearch, worklog
+
+
+def record(repo, name, subject):
+    commit(repo, name, subject)
+    worklog.record_commit(str(repo))
+
+
+def test_index_is_updated_incrementally(git_repo):
+    record(git_repo, "login.py", "ログイン画面のバリデーションを追加")
+    record(git_repo, "style.css", "ボタンの色を変更")
+    db = logsearch.connect(str(git_repo))
+
+    assert logsearch.update(db, str(git_repo)) == 2
+    assert logsearch.update(db, str(git_repo)) == 0
+    [hit] = logsearch.search(db, "バリデーション")
+    assert hit["subject"] == "ログイン画面のバリデーションを追加" and hit["files"] == "login.py"
+    assert [h["subject"] for h in logsearch.search(db, "色 変更")] == ["ボタンの色を変更"]
+    assert logsearch.search(db, "存在しない語") == []
+
+    record(git_repo, "signup.py", "登録画面にもバリデーション")
+    assert logsearch.update(db, str(git_repo)) == 1
+    assert [h["subject"] for h in logsearch.search(db, "バリデーション")] == [
+        "登録画面にもバリデーション", "ログイン画面のバリデーションを追加",
+    ]
+
+
+def test_markdown_only_logs_are_indexed(git_repo):
+    logs = git_repo / "logs"
+    logs.mkdir()
+    (logs / "WORK_LOG.md").write_text(
+        worklog.WORK_LOG_HEADER
+        + "\n## 2025-01-01 10:00 [main] @tester\n\n"
+        + "- **意図**: 初期設定を整理\n- **変更ファイル**: setup.cfg\n- **コミット**: abc1234\n"
+    )
+    db = logsearch.connect(str(git_repo))
+    assert logsearch.update(db, str(git_repo)) == 1
+    [hit] = logsearch.search(db, "初期設定")
+    assert hit["hash"] == "abc1234" and hit["branch"] == "main"
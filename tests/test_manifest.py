@@ -0,0 +1,66 @@
+"""導入ファイルのマニフェスト（manifest）: 状態の判定と保存"""
+
+import shutil
+
+import pytest
+
+from japanese_developer import manifest
+
+
+@pytest.fixture
+def gemini_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(manifest, "GEMINI_DIR", tmp_path)
+    monkeypatch.setattr(manifest, "MANIFEST_PATH", tmp_path / "jd-manifest.json")
+    return tmp_path
+
+
+def install(gemini_dir, rel, src):
+    dest = gemini_dir / rel
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, dest)
+
+
+def states(recorded=None) -> dict:
+    return {rel: state for rel, _, state in manifest.plan(recorded)}
+
+
+def test_plan_states(gemini_dir):
+    templates = manifest.template_files()
+    assert "GEMINI.md" in templates and any(rel.startswith("hooks/") for rel in templates)
+    assert set(states().values()) == {manifest.INSTALL}
+
+    install(gemini_dir, "GEMINI.md", templates["GEMINI.md"])
+    install(gemini_dir, "primer.md", templates["primer.md"])
+    # マニフェスト導入前から同じ内容で存在 → 記録のみ
+    assert states()["GEMINI.md"] == manifest.ADOPT
+
+    # primer.md は前のバージョンで配置した内容のまま、テンプレートだけ更新された
+    (gemini_dir / "primer.md").write_text("古い primer\n")
+    recorded = {"files": {
+        "GEMINI.md": manifest.entry_for(templates["GEMINI.md"]),
+        "primer.md": manifest.entry_for(gemini_dir / "primer.md"),
+        "hooks/removed.sh": {"sha256": "0" * 64, "version": "0.0.1"},
+    }}
+    result = states(recorded)
+    assert result["GEMINI.md"] == manifest.CURRENT
+    assert result["primer.md"] == manifest.UPDATE
+    assert result["hooks/removed.sh"] == manifest.RETIRE
+
+    # 利用者が手を加えたファイル
+    (gemini_dir / "GEMINI.md").write_text("自分用に編集\n")
+    assert states(recorded)["GEMINI.md"] == manifest.MODIFIED
+
+
+def test_save_and_load(gemini_dir):
+    assert manifest.load() is None
+    files = {"GEMINI.md": {"sha256": "a" * 64, "version": "1.0.0"}}
+    manifest.save(files, ["interactive-guard"])
+    data = manifest.load()
+    assert data["files"] == files and data["hook_names"] == ["interactive-guard"]
+    assert data["version"] == manifest.MANIFEST_VERSION
+    assert [p.name for p in gemini_dir.iterdir()] == ["jd-manifest.json"]
+
+
+def test_hook_names_come_from_hooks_json():
+    names = manifest.hook_names()
+    assert "interactive-guard" in names and names == sorted(names)
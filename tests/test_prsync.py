@@ -0,0 +1,114 @@
+"""PRへの作業ログ同期（prsync）を偽ghで確かめる: 連続pushのまとめ・カーソル・再試行"""
+
+import json
+import sys
+import time
+
+import pytest
+
+from conftest import commit, git
+from japanese_developer import prsync, worklog
+
+FAKE_GH = """#!{python}
+import json, os, sys
+log = os.path.join(os.path.dirname(__file__), "calls.jsonl")
+with open(log, "a") as f:
+    f.write(json.dumps(sys.argv[1:]) + "\\n")
+if sys.argv[1:3] == ["pr", "view"]:
+    print(7)
+elif sys.argv[1:3] == ["pr", "comment"] and os.path.exists(os.path.join(os.path.dirname(__file__), "fail")):
+    sys.stderr.write("HTTP 502\\n")
+    sys.exit(1)
+"""
+
+
+@pytest.fixture
+def fake_gh(tmp_path, monkeypatch):
+    directory = tmp_path / "gh"
+    directory.mkdir()
+    gh = directory / "gh"
+    gh.write_text(FAKE_GH.format(python=sys.executable))
+    gh.chmod(0o755)
+    monkeypatch.setenv("JD_GH", str(gh))
+    monkeypatch.setattr(prsync, "OUTBOX_DIR", tmp_path / "outbox")
+    monkeypatch.setattr(prsync, "CURSORS_PATH", tmp_path / "outbox" / "cursors.json")
+    monkeypatch.setattr(prsync, "FLUSH_LOG", tmp_path / "outbox" / "flush.log")
+    return directory
+
+
+def comments(directory) -> list:
+    calls = [json.loads(line) for line in (directory / "calls.jsonl").read_text().splitlines()]
+    return [call[call.index("--body") + 1] for call in calls if call[:2] == ["pr", "comment"]]
+
+
+def record(repo, name, subject):
+    commit(repo, name, subject)
+    worklog.record_commit(str(repo))
+
+
+def test_consecutive_pushes_become_one_comment(git_repo, fake_gh):
+    git(git_repo, "checkout", "-q", "-b", "feature/x")
+    record(git_repo, "a.txt", "1つ目")
+    prsync.enqueue(str(git_repo), "feature/x", "tester")
+    record(git_repo, "b.txt", "2つ目")
+    job = prsync.enqueue(str(git_repo), "feature/x", "tester")
+    assert job["pushes"] == 2
+    assert len(prsync.pending_jobs()) == 1
+
+    results = prsync.flush(wait=False)
+    assert results == [("feature/x", "PR #7 にログコメントを投稿（2件）")]
+    [body] = comments(fake_gh)
+    assert "1つ目" in body and "2つ目" in body and "push 2回分" in body
+
+    # カーソル以降のエントリだけを投稿する
+    record(git_repo, "c.txt", "3つ目")
+    prsync.enqueue(str(git_repo), "feature/x", "tester")
+    prsync.flush(wait=False)
+    body = comments(fake_gh)[-1]
+    assert "3つ目" in body and "1つ目" not in body
+
+
+def test_failed_post_is_retried_with_backoff(git_repo, fake_gh):
+    git(git_repo, "checkout", "-q", "-b", "feature/y")
+    record(git_repo, "a.txt", "変更")
+    prsync.enqueue(str(git_repo), "feature/y", "tester")
+    (fake_gh / "fail").touch()
+
+    [(_, result)] = prsync.flush(wait=False)
+    assert result.startswith("再試行予定（30秒後）")
+    [(_, job)] = prsync.pending_jobs()
+    assert job["attempts"] == 1 and job["next_attempt"] > time.time()
+
+    # 再試行待ちのジョブは送らない。reset_retries で即座に送信対象へ戻る
+    assert prsync.flush(wait=False) == []
+    (fake_gh / "fail").unlink()
+    prsync.reset_retries()
+    assert prsync.flush(wait=False) == [("feature/y", "PR #7 にログコメントを投稿（1件）")]
+    assert prsync.pending_jobs() == []
+
+
+def test_entries_fall_back_to_git_log_without_journal(git_repo, fake_gh):
+    git(git_repo, "checkout", "-q", "-b", "feature/z")
+    commit(git_repo, "a.txt", "ジャーナルなし1")
+    commit(git_repo, "b.txt", "ジャーナルなし2")
+    prsync.enqueue(str(git_repo), "feature/z", "tester")
+
+    assert prsync.flush(wait=False) == [("feature/z", "PR #7 にログコメントを投稿（2件）")]
+    body = comments(fake_gh)[-1]
+    assert "ジャーナルなし1" in body and "base" not in body
+
+
+def test_cursor_is_the_full_hash(git_repo, fake_gh):
+    git(git_repo, "checkout", "-q", "-b", "feature/w")
+    record(git_repo, "a.txt", "1つ目")
+    prsync.enqueue(str(git_repo), "feature/w", "tester")
+    prsync.flush(wait=False)
+    [cursor] = json.loads(prsync.CURSORS_PATH.read_text()).values()
+    assert cursor == git(git_repo, "rev-parse", "HEAD").strip()
+
+    # 先頭7桁だけが一致するエントリはカーソルとみなさない
+    entry = {"commit": cursor[:7] + "0" * 33, "hash": cursor[:7], "branch": "feature/w"}
+    assert not prsync._at_cursor(entry, cursor)
+    # 短縮ハッシュしか無い古いカーソル・エントリは前方一致で比べる
+    assert prsync._at_cursor({"commit": cursor, "hash": cursor[:7]}, cursor[:7])
+    assert prsync._at_cursor({"hash": cursor[:7]}, cursor)
@@ -0,0 +1,62 @@
+"""settings.json のトランザクション更新（settings）: 原子的な書き換え・並行更新・hookのマージ"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from japanese_developer import settings
+
+
+def add_key(path, key):
+    settings.update(lambda s: s.setdefault("keys", []).append(key), path)
+
+
+def test_update_writes_atomically_and_keeps_the_mode(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text('{"theme": "dark"}')
+    os.chmod(path, 0o600)
+
+    result = settings.update(lambda s: s.update(model="pro"), path)
+    assert result == {"theme": "dark", "model": "pro"}
+    assert json.loads(path.read_text()) == result
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir()) == [settings.LOCK_NAME, "settings.json"]
+
+
+def test_failed_mutation_leaves_the_file_untouched(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text('{"theme": "dark"}')
+
+    def broken(s):
+        s["theme"] = "light"
+        raise RuntimeError("途中で失敗")
+
+    with pytest.raises(RuntimeError):
+        settings.update(broken, path)
+    assert json.loads(path.read_text()) == {"theme": "dark"}
+
+
+def test_concurrent_updates_are_not_lost(tmp_path):
+    path = tmp_path / "settings.json"
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(add_key, [path] * 20, range(20)))
+    assert sorted(json.loads(path.read_text())["keys"]) == list(range(20))
+
+
+def test_merge_and_remove_hooks():
+    hook = {"name": "interactive-guard", "type": "command", "command": "old"}
+    existing = {"hooks": {"BeforeTool": [{"matcher": "run_shell_command", "hooks": [hook]}]}}
+    new = {"BeforeTool": [{"matcher": "run_shell_command", "hooks": [
+        {"name": "interactive-guard", "type": "command", "command": "new"},
+        {"name": "other", "type": "command", "command": "x"},
+    ]}]}
+
+    merged = settings.merge_hooks(existing, new)
+    names = [h["name"] for g in merged["hooks"]["BeforeTool"] for h in g["hooks"]]
+    assert names == ["interactive-guard", "other"] and hook["command"] == "old"
+    settings.merge_hooks(merged, new, replace=True)
+    assert hook["command"] == "new"
+
+    assert settings.remove_hooks(merged, ["interactive-guard", "other"]) == {}
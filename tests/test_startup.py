@@ -0,0 +1,33 @@
+"""起動時間の予算（hook-budget と同じ計測）: hook の高速パスと CLI の status"""
+
+import compileall
+import os
+
+import pytest
+
+import japanese_developer
+from japanese_developer.cli import CLI_FORBIDDEN_IMPORTS, CLI_IMPORT_BUDGET_MS
+from japanese_developer.cli.hooks import CLI_IMPORT_CODE, HOOK_IMPORT_CODE, _import_ms
+from japanese_developer.hooks import FORBIDDEN_IMPORTS, HOOK_IMPORT_BUDGET_MS
+
+RUNS = 5
+
+
+@pytest.fixture(scope="module", autouse=True)
+def bytecode():
+    # .pyc が無いとコンパイル時間まで計測してしまう
+    compileall.compile_dir(os.path.dirname(japanese_developer.__file__), quiet=1)
+
+
+def test_hook_path_is_within_budget_and_skips_click():
+    import_ms, imported = _import_ms(HOOK_IMPORT_CODE, RUNS)
+    assert "japanese_developer.hooks" in imported
+    assert [m for m in FORBIDDEN_IMPORTS if m in imported] == []
+    assert "click" not in imported
+    assert import_ms <= HOOK_IMPORT_BUDGET_MS
+
+
+def test_cli_status_is_within_budget():
+    import_ms, imported = _import_ms(CLI_IMPORT_CODE, RUNS)
+    assert [m for m in CLI_FORBIDDEN_IMPORTS if m in imported] == []
+    assert import_ms <= CLI_IMPORT_BUDGET_MS
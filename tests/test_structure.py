@@ -0,0 +1,38 @@
+"""HTML/CSS の構造チェック（structure）: タグ・括弧の対応"""
+
+import pytest
+
+from japanese_developer import structure
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(name, text):
+        path = tmp_path / name
+        path.write_text(text)
+        return str(path)
+    return write
+
+
+def test_html_tags(write):
+    assert structure.check_html(write("ok.html", "<ul><li>a<li>b</ul><p>段落<br><img src=x>")) == ""
+    error = structure.check_html(write("bad.html", "<div>\n  <span></div>\n"))
+    assert error.startswith("HTML構文エラー: ") and ":2:" in error
+    assert "<main> が閉じられていません" in structure.check_html(write("open.html", "<main>\n<p>x</p>\n"))
+
+
+def test_css_braces_ignore_strings_and_comments(write):
+    css = 'a::before { content: "}"; }\n/* { */\n.b { background: url(x{.png); }\n'
+    assert structure.check_css(write("ok.css", css)) == ""
+    error = structure.check_css(write("bad.css", ".a {\n  color: red;\n"))
+    assert error.startswith("CSS構文エラー: ")
+    assert structure.check_css(write("bad2.css", ".a { color: red; }}\n")) != ""
+    # SCSS の行コメント
+    assert structure.check_css(write("ok.scss", ".a { // }\n  b: c;\n}\n")) == ""
+
+
+def test_tokens_split_across_chunks(write, monkeypatch):
+    monkeypatch.setattr(structure, "CHUNK_SIZE", 7)
+    css = ".a { content: \"}}}\"; }\n/* } */ .b { c: url(  x.png); }\n" * 20
+    assert structure.check_css(write("ok.css", css)) == ""
+    assert structure.check_html(write("ok.html", "<div><span>テキスト</span></div>" * 20)) == ""
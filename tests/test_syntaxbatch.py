@@ -0,0 +1,56 @@
+"""syntax-check のまとめ処理（syntaxbatch）: スプール・リーダー"""
+
+import pytest
+
+from japanese_developer import syntaxbatch
+
+
+@pytest.fixture(autouse=True)
+def spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(syntaxbatch, "SPOOL_DIR", tmp_path / "spool")
+
+
+class Checker:
+    """呼ばれたパスを記録し、bad.* をエラーにする"""
+
+    def __init__(self, on_first=None):
+        self.calls = []
+        self.on_first = on_first
+
+    def __call__(self, paths):
+        self.calls.append(paths)
+        if self.on_first and len(self.calls) == 1:
+            self.on_first()
+        return {p: ("構文エラー" if "bad" in p else "") for p in paths}
+
+
+def test_spooled_paths_are_checked_once_in_order(tmp_path):
+    project = str(tmp_path)
+    for path in ("a.js", "bad.js", "a.js"):
+        syntaxbatch.add(project, path)
+    check = Checker()
+
+    assert syntaxbatch.collect(project, check, quiet=0) == {"a.js": "", "bad.js": "構文エラー"}
+    assert check.calls == [["a.js", "bad.js"]]
+    # スプールは空になる
+    assert syntaxbatch.collect(project, check, quiet=0) == {}
+
+
+def test_writes_during_a_check_are_picked_up_by_the_leader(tmp_path):
+    project = str(tmp_path)
+    syntaxbatch.add(project, "a.js")
+    check = Checker(on_first=lambda: syntaxbatch.add(project, "b.js"))
+
+    assert set(syntaxbatch.collect(project, check, quiet=0)) == {"a.js", "b.js"}
+    assert check.calls == [["a.js"], ["b.js"]]
+
+
+def test_non_leader_leaves_the_spool_to_the_leader(tmp_path):
+    project = str(tmp_path)
+    syntaxbatch.add(project, "a.js")
+    spool = syntaxbatch._spool_path(project)
+
+    with syntaxbatch._lock(spool.with_suffix(".leader"), blocking=False) as leader:
+        assert leader
+        assert syntaxbatch.collect(project, Checker(), quiet=0) is None
+    assert syntaxbatch.collect(project, Checker(), quiet=0) == {"a.js": ""}
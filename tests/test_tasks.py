@@ -0,0 +1,152 @@
+"""Issue のローカルミラー（tasks）を偽 GitHub API で確かめる: 差分同期・ETag・キューの再送"""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from japanese_developer import github, tasks
+
+REPO = "owner/app"
+
+
+def issue(number, title, updated_at, state="open", labels=(), pull_request=False):
+    data = {
+        "number": number, "title": title, "body": "", "state": state, "updated_at": updated_at,
+        "labels": [{"name": name} for name in labels], "assignees": [{"login": "tester"}],
+        "user": {"login": "tester"}, "html_url": f"https://github.com/{REPO}/issues/{number}",
+    }
+    if pull_request:
+        data["pull_request"] = {}
+    return data
+
+
+def reply(payload, status=200, headers=None):
+    return status, {"Content-Type": "application/json", **(headers or {})}, json.dumps(payload).encode()
+
+
+@pytest.fixture
+def api(fake_server):
+    base, handler = fake_server
+    state = {
+        "issues": [
+            issue(1, "ログイン画面", "2026-01-01T00:00:00Z", labels=["bug"]),
+            issue(2, "PRは除く", "2026-01-02T00:00:00Z", pull_request=True),
+            issue(3, "設定画面", "2026-01-03T00:00:00Z"),
+        ],
+        "labels_etag": '"labels-v1"',
+        "next_number": 10,
+    }
+
+    def list_issues(h):
+        query = parse_qs(urlparse(h.path).query)
+        since = query.get("since", [""])[0]
+        items = [i for i in state["issues"] if i["updated_at"] >= since]
+        if query.get("page") == ["2"]:
+            return reply(items[2:])
+        # 2件ずつページングする
+        link = f'<{base}/repos/{REPO}/issues?{urlparse(h.path).query}&page=2>; rel="next"'
+        return reply(items[:2], headers={"Link": link} if len(items) > 2 else {})
+
+    def list_labels(h):
+        if h.headers.get("If-None-Match") == state["labels_etag"]:
+            return 304, {}, b""
+        return reply([{"name": "bug", "color": "d73a4a"}], headers={"ETag": state["labels_etag"]})
+
+    def create_issue(h):
+        body = json.loads(h.requests[-1][3])
+        created = issue(state["next_number"], body["title"], "2026-02-01T00:00:00Z", labels=body["labels"])
+        state["next_number"] += 1
+        state["issues"].append(created)
+        return reply(created, status=201)
+
+    def close_issue(h):
+        number = int(h.path.rstrip("/").split("/")[-1])
+        if number == 404:
+            return reply({"message": "Not Found"}, status=404)
+        return reply(issue(number, "クローズ", "2026-02-02T00:00:00Z", state="closed"))
+
+    handler.routes.update({
+        ("GET", "/user"): lambda h: reply({"login": "tester"}),
+        ("GET", f"/repos/{REPO}/issues"): list_issues,
+        ("GET", f"/repos/{REPO}/labels"): list_labels,
+        ("POST", f"/repos/{REPO}/issues"): create_issue,
+        ("POST", f"/repos/{REPO}/issues/3/comments"): lambda h: reply({}, status=201),
+        ("PATCH", f"/repos/{REPO}/issues/3"): close_issue,
+        ("PATCH", f"/repos/{REPO}/issues/404"): close_issue,
+    })
+    return github.Client(base=base, token="test-token"), handler
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tasks.connect(tmp_path / "tasks.db")
+
+
+def test_sync_is_incremental_and_uses_label_etag(db, api):
+    client, handler = api
+    result = tasks.sync(db, REPO, client)
+    assert result["updated"] == 2 and result["labels_changed"]
+    assert [i["number"] for i in tasks.list_issues(db, REPO)] == [3, 1]
+    assert [label["name"] for label in tasks.list_labels(db, REPO)] == ["bug"]
+
+    handler.requests.clear()
+    result = tasks.sync(db, REPO, client)
+    assert not result["labels_changed"]
+    assert tasks.list_labels(db, REPO)  # 304 ではラベルを消さない
+    paths = [path for method, path, _, _ in handler.requests if method == "GET"]
+    assert any("since=2026-01-03T00:00:00Z" in p for p in paths)
+    labels_request = next(r for r in handler.requests if r[1].startswith(f"/repos/{REPO}/labels"))
+    assert labels_request[2].get("If-None-Match") == '"labels-v1"'
+    assert "/user" not in paths  # ログイン名はミラーに保存済み
+
+
+def test_queue_is_replayed_in_order(db, api):
+    client, handler = api
+    tasks.sync(db, REPO, client)
+
+    add_id = tasks.enqueue(db, REPO, tasks.ADD, title="オフラインで追加", labels=["bug"])
+    tasks.enqueue(db, REPO, tasks.CLOSE, 3, comment="完了")
+    # 送信前からミラーに反映される（未送信の追加は番号が負）
+    assert any(i["number"] == -add_id and i["pending"] for i in tasks.list_issues(db, REPO))
+    assert tasks.get_issue(db, REPO, 3)["state"] == "closed"
+
+    handler.requests.clear()
+    assert tasks.replay(db, REPO, client) == (2, 0)
+    sent = [(method, path) for method, path, _, _ in handler.requests]
+    assert sent == [
+        ("POST", f"/repos/{REPO}/issues"),
+        ("POST", f"/repos/{REPO}/issues/3/comments"),
+        ("PATCH", f"/repos/{REPO}/issues/3"),
+    ]
+    assert tasks.pending(db, REPO) == []
+    numbers = [i["number"] for i in tasks.list_issues(db, REPO, state="all")]
+    assert 10 in numbers and -add_id not in numbers
+
+
+def test_api_error_blocks_later_jobs_for_the_same_issue(db, api):
+    client, _ = api
+    tasks.enqueue(db, REPO, tasks.CLOSE, 404)
+    tasks.enqueue(db, REPO, tasks.EDIT, 404, add_labels=["bug"])
+    tasks.enqueue(db, REPO, tasks.CLOSE, 3)
+
+    assert tasks.replay(db, REPO, client) == (1, 1)
+    left = tasks.pending(db, REPO)
+    assert [(job["action"], job["number"]) for job in left] == [(tasks.CLOSE, 404), (tasks.EDIT, 404)]
+    assert left[0]["attempts"] == 1 and "HTTP 404" in left[0]["last_error"]
+
+
+def test_offline_keeps_the_queue(db):
+    tasks.enqueue(db, REPO, tasks.ADD, title="圏外")
+    with pytest.raises(github.OfflineError):
+        tasks.replay(db, REPO, github.Client(base="http://127.0.0.1:9", token=""))
+    assert len(tasks.pending(db, REPO)) == 1
+
+
+def test_sync_without_token_skips_the_login(db, api):
+    client, handler = api
+    handler.routes[("GET", "/user")] = lambda h: reply({"message": "Requires authentication"}, status=401)
+
+    result = tasks.sync(db, REPO, github.Client(base=client.base, token=""))
+    assert result["updated"] == 2
+    assert tasks.list_issues(db, REPO)
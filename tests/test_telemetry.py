@@ -0,0 +1,49 @@
+"""hookのテレメトリ（telemetry）: 記録・ローテーション・集計"""
+
+import os
+
+import pytest
+
+from japanese_developer import telemetry
+
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    path = str(tmp_path / "telemetry.jsonl")
+    monkeypatch.setattr(telemetry, "TELEMETRY_PATH", path)
+    return path
+
+
+def record(hook="interactive-guard", ms=1.0):
+    telemetry.record(hook, {"hook_event_name": "BeforeTool", "tool_name": "run_shell_command"}, ms, {}, 0)
+
+
+def test_rotates_when_over_the_limit(path, monkeypatch):
+    monkeypatch.setattr(telemetry, "MAX_BYTES", 300)
+    for _ in range(30):
+        record()
+    for n in range(1, telemetry.KEEP + 1):
+        assert os.path.getsize(telemetry._rotated(n, path)) <= 300 + 200
+    assert not os.path.exists(telemetry._rotated(telemetry.KEEP + 1, path))
+    assert len(telemetry.load(path)) > 0
+
+
+def test_rotation_skips_a_file_already_rotated_by_another_hook(path):
+    record()
+    stale = os.stat(path)
+    # 別のhookが先にずらし、新しいファイルへ書き込んだ
+    os.replace(path, telemetry._rotated(1, path))
+    record()
+
+    telemetry._rotate(path, stale)
+    assert os.path.exists(path)
+    assert not os.path.exists(telemetry._rotated(2, path))
+
+
+def test_summary_per_hook(path):
+    for ms in (1, 2, 3, 40):
+        record(ms=ms)
+    record(hook="syntax-check", ms=5)
+    summary = telemetry.summarize(telemetry.load(path))
+    assert summary["hooks"]["interactive-guard"]["count"] == 4
+    assert summary["hooks"]["interactive-guard"]["p50_ms"] == 2
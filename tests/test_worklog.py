@@ -0,0 +1,96 @@
+"""作業ログ（worklog）: ジャーナルへの追記・Markdownの逐次描画・git履歴からの rebuild"""
+
+import json
+
+from conftest import commit, git
+from japanese_developer import worklog
+
+
+def journal(repo) -> list:
+    path = repo / "logs" / worklog.JOURNAL_NAME
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_record_appends_to_journal_and_renders_markdown(git_repo):
+    git(git_repo, "checkout", "-q", "-b", "feature/log")
+    short = commit(git_repo, "a.txt", "1つ目")
+    entry, messages = worklog.record_commit(str(git_repo))
+    assert entry["hash"] == short and entry["branch"] == "feature/log" and entry["files"] == ["a.txt"]
+    assert "WORK_LOG.md を新規作成" in messages
+
+    commit(git_repo, "b.txt", "2つ目")
+    worklog.record_commit(str(git_repo))
+    logs = git_repo / "logs"
+    assert [e["subject"] for e in journal(git_repo)] == ["1つ目", "2つ目"]
+    work_log = (logs / "WORK_LOG.md").read_text()
+    assert work_log.count("## ") == 2 and work_log.index("1つ目") < work_log.index("2つ目")
+    branch_log = (logs / worklog.branch_log_name("feature/log", "tester")).read_text()
+    assert "- **コミット**: " + short in branch_log
+    # ローカル状態のファイルはコミットしない
+    assert set(worklog.LOCAL_STATE_NAMES) <= set((logs / ".gitignore").read_text().split())
+
+
+def test_render_only_appends_new_entries(git_repo):
+    commit(git_repo, "a.txt", "1つ目")
+    worklog.record_commit(str(git_repo))
+    logs = str(git_repo / "logs")
+    before = (git_repo / "logs" / "WORK_LOG.md").read_text()
+
+    # 描画済みのエントリは描き直さない
+    with worklog.locked(logs):
+        worklog.render(str(git_repo), logs)
+    assert (git_repo / "logs" / "WORK_LOG.md").read_text() == before
+
+
+def test_replaced_markdown_is_matched_by_hash(git_repo):
+    commit(git_repo, "a.txt", "1つ目")
+    worklog.record_commit(str(git_repo))
+    work_log = git_repo / "logs" / "WORK_LOG.md"
+    # checkout 等で WORK_LOG.md が別の内容に差し替わった: カーソルは使えない
+    work_log.write_text(work_log.read_text() + "\n<!-- 手で追記 -->\n")
+    commit(git_repo, "b.txt", "2つ目")
+    worklog.record_commit(str(git_repo))
+
+    text = work_log.read_text()
+    assert text.count("1つ目") == 1 and text.count("2つ目") == 1
+
+
+def test_rebuild_imports_unrecorded_commits_once(git_repo):
+    commit(git_repo, "a.txt", "記録済み")
+    worklog.record_commit(str(git_repo))
+    manual = commit(git_repo, "b.txt", "手動コミット")
+
+    result = worklog.rebuild(str(git_repo))
+    assert result["added"] == 2  # base と手動コミット
+    entries = journal(git_repo)
+    assert [e["subject"] for e in entries] == ["記録済み", "base", "手動コミット"]
+    assert entries[-1]["hash"] == manual
+    assert entries[-1]["commit"] == git(git_repo, "rev-parse", "HEAD").strip()
+
+    # 2回目は前回の位置から再開し、何も追加しない
+    assert worklog.rebuild(str(git_repo))["added"] == 0
+    work_log = (git_repo / "logs" / "WORK_LOG.md").read_text()
+    assert work_log.count("手動コミット") == 1
+
+
+def test_rebuild_compares_full_hashes(git_repo):
+    head = commit(git_repo, "a.txt", "本物")
+    full = git(git_repo, "rev-parse", "HEAD").strip()
+    # 先頭7桁だけが一致する別のコミットがジャーナルにあっても、取り込み済みとはみなさない
+    fake = {"commit": full[:7] + "0" * 33, "hash": head, "subject": "別物", "branch": "main",
+            "author": "tester", "time": "2026-01-01 00:00", "files": []}
+    with worklog.locked(str(git_repo / "logs")):
+        worklog.append_entries(str(git_repo / "logs"), [fake])
+
+    worklog.rebuild(str(git_repo))
+    assert [e["subject"] for e in journal(git_repo)] == ["別物", "base", "本物"]
+
+
+def test_legacy_short_hashes_still_match(git_repo):
+    head = commit(git_repo, "a.txt", "古い記録")
+    legacy = {"hash": head, "subject": "古い記録", "branch": "main",
+              "author": "tester", "time": "2026-01-01 00:00", "files": []}
+    with worklog.locked(str(git_repo / "logs")):
+        worklog.append_entries(str(git_repo / "logs"), [legacy])
+
+    assert worklog.rebuild(str(git_repo))["added"] == 1  # base だけ